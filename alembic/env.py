@@ -18,9 +18,15 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
-from app.database import Base
+from app.database import DATABASE_URL, SYNC_DATABASE_URL, Base
 target_metadata = Base.metadata
 
+# Migrations always run on the sync driver, even if DATABASE_URL names asyncpg
+if DATABASE_URL:
+    config.set_main_option(
+        "sqlalchemy.url", SYNC_DATABASE_URL.render_as_string(hide_password=False).replace("%", "%%")
+    )
+
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
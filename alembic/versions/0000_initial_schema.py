@@ -0,0 +1,124 @@
+"""initial schema (tables previously created by create_all() on startup)
+
+Revision ID: 0000
+Revises:
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0000'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing databases already have these tables from the old startup
+    # create_all(); only create what is missing (then `alembic upgrade head`).
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("full_name", sa.String(255), nullable=False),
+            sa.Column("email", sa.String(255), nullable=False),
+            sa.Column("hashed_password", sa.String(255), nullable=False),
+            sa.Column("role", sa.String(50), nullable=False),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    if "talent" not in existing:
+        op.create_table(
+            "talent",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("full_name", sa.String(255), nullable=False),
+            sa.Column("email", sa.String(255), nullable=False),
+            sa.Column("skills", postgresql.ARRAY(sa.Text()), nullable=False),
+            sa.Column("experience_years", sa.Integer(), nullable=False),
+            sa.Column("profile_completed", sa.Boolean(), nullable=False),
+            sa.Column(
+                "availability_status",
+                sa.Enum("available", "busy", "on_project", name="availability_enum"),
+                nullable=False,
+            ),
+        )
+        op.create_index("ix_talent_id", "talent", ["id"])
+        op.create_index("ix_talent_email", "talent", ["email"], unique=True)
+
+    if "projects" not in existing:
+        op.create_table(
+            "projects",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("title", sa.String(255), nullable=False),
+            sa.Column("description", sa.String(1000), nullable=True),
+            sa.Column("technical_brief", sa.String(2000), nullable=True),
+            sa.Column("expected_duration_days", sa.Integer(), nullable=True),
+            sa.Column("time_to_match_days", sa.Integer(), nullable=True),
+            sa.Column("status", sa.String(50), nullable=False),
+        )
+        op.create_index("ix_projects_id", "projects", ["id"])
+
+    if "project_outcomes" not in existing:
+        op.create_table(
+            "project_outcomes",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("forecast_accuracy_percentage", sa.Numeric(5, 2), nullable=False),
+            sa.Column("client_satisfaction_rating", sa.Integer(), nullable=False),
+            sa.Column("code_quality_score", sa.Integer(), nullable=False),
+            sa.Column("delivery_speed_days", sa.Integer(), nullable=False),
+            sa.Column("user_engagement_rate", sa.Numeric(6, 4), nullable=True),
+            sa.Column("retention_rate", sa.Numeric(6, 4), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+            sa.Column("created_by", sa.Integer(), nullable=True),
+            sa.CheckConstraint('forecast_accuracy_percentage >= 0 AND forecast_accuracy_percentage <= 100', name='chk_forecast_accuracy'),
+            sa.CheckConstraint('client_satisfaction_rating >= 1 AND client_satisfaction_rating <= 5', name='chk_client_satisfaction'),
+            sa.CheckConstraint('code_quality_score >= 1 AND code_quality_score <= 5', name='chk_code_quality'),
+            sa.CheckConstraint('delivery_speed_days >= 0', name='chk_delivery_speed'),
+            sa.CheckConstraint('user_engagement_rate >= 0 AND user_engagement_rate <= 1', name='chk_user_engagement'),
+            sa.CheckConstraint('retention_rate >= 0 AND retention_rate <= 1', name='chk_retention_rate'),
+        )
+        op.create_index("ix_project_outcomes_id", "project_outcomes", ["id"])
+
+    if "audit_logs" not in existing:
+        op.create_table(
+            "audit_logs",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("action", sa.String(), nullable=False),
+            sa.Column("entity", sa.String(), nullable=False),
+            sa.Column("entity_id", sa.Integer(), nullable=False),
+            sa.Column("performed_by", sa.String(), nullable=False),
+            sa.Column("timestamp", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+        op.create_index("ix_audit_logs_id", "audit_logs", ["id"])
+
+    if "notifications" not in existing:
+        op.create_table(
+            "notifications",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+            sa.Column("message", sa.String(), nullable=True),
+            sa.Column("read", sa.Boolean(), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("notifications")
+    op.drop_table("audit_logs")
+    op.drop_table("project_outcomes")
+    op.drop_table("projects")
+    op.drop_table("talent")
+    op.drop_table("users")
+    sa.Enum(name="availability_enum").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,40 @@
+"""project required_skills column and GIN index on talent.skills
+
+Revision ID: 0001
+Revises: 0000
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = '0000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tables may already exist from the old create_all() on startup,
+    # so only add what is missing.
+    inspector = sa.inspect(op.get_bind())
+
+    project_columns = {c["name"] for c in inspector.get_columns("projects")}
+    if "required_skills" not in project_columns:
+        op.add_column("projects", sa.Column("required_skills", postgresql.ARRAY(sa.Text()), nullable=True))
+
+    talent_indexes = {i["name"] for i in inspector.get_indexes("talent")}
+    if "ix_talent_skills_gin" not in talent_indexes:
+        op.create_index("ix_talent_skills_gin", "talent", ["skills"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_talent_skills_gin", table_name="talent", postgresql_using="gin")
+    op.drop_column("projects", "required_skills")
@@ -0,0 +1,54 @@
+"""row version and updated_at columns on talent and projects
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ("talent", "projects")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    op.execute("CREATE SEQUENCE IF NOT EXISTS row_version_seq")
+
+    for table in VERSIONED_TABLES:
+        columns = {c["name"] for c in inspector.get_columns(table)}
+        if "version" not in columns:
+            # add nullable, number existing rows, then tighten
+            op.add_column(table, sa.Column("version", sa.BigInteger(), nullable=True))
+            op.execute(f"UPDATE {table} SET version = nextval('row_version_seq')")
+            op.alter_column(table, "version", nullable=False)
+        if "updated_at" not in columns:
+            op.add_column(
+                table,
+                sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+            )
+
+        indexes = {i["name"] for i in inspector.get_indexes(table)}
+        if f"ix_{table}_version" not in indexes:
+            op.create_index(f"ix_{table}_version", table, ["version"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in VERSIONED_TABLES:
+        op.drop_index(f"ix_{table}_version", table_name=table)
+        op.drop_column(table, "updated_at")
+        op.drop_column(table, "version")
+    op.execute("DROP SEQUENCE IF EXISTS row_version_seq")
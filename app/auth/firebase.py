@@ -1,18 +1,9 @@
-import firebase_admin
-from firebase_admin import credentials, auth
-from fastapi import HTTPException, Depends, Request
+from fastapi import HTTPException, Request
 
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.models.user import User
+from app.security.firebase import verify_id_token
+from app.security.principal import get_principal
 
-
-
-# Load Firebase service account JSON
-cred = credentials.Certificate("firebase-service-account.json")
-
-if not firebase_admin._apps:
-    firebase_admin.initialize_app(cred)
+# Firebase Admin is initialized lazily by app.security.firebase.init_firebase
 
 
 def verify_token(request: Request):
@@ -25,7 +16,7 @@ def verify_token(request: Request):
     token = auth_header.split(" ")[1]
 
     try:
-        decoded = auth.verify_id_token(token)
+        decoded = verify_id_token(token)
         return decoded
 
     except Exception as e:
@@ -35,21 +26,11 @@ def verify_token(request: Request):
 def verify_firebase_token(token: str):
     """Compatibility wrapper for old imports."""
     try:
-        decoded = auth.verify_id_token(token)
+        decoded = verify_id_token(token)
         return decoded
     except Exception as e:
         raise HTTPException(status_code=401, detail=f"Invalid token: {str(e)}")
 
 
-def get_current_user(request: Request, db: Session = Depends(get_db)):
-    """Get the authenticated Firebase user + DB user with role."""
-    decoded = verify_token(request)
-
-    email = decoded.get("email")
-
-    user = db.query(User).filter(User.email == email).first()
-
-    if not user:
-        raise HTTPException(status_code=403, detail="User not found or unauthorized")
-
-    return user
+# Kept for old imports; resolves through the shared principal resolver.
+get_current_user = get_principal
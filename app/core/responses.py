@@ -0,0 +1,32 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value):
+    # Numeric columns come back as Decimal; encode them the way jsonable_encoder did
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by orjson: encodes dicts, lists, datetimes, UUIDs,
+    dataclasses and numpy scalars directly, without jsonable_encoder's walk.
+    Routes that return plain data can return one of these to skip FastAPI's
+    response validation and encoding entirely.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
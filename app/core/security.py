@@ -1,9 +1,98 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from fastapi import HTTPException
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt cost; raising it only affects new hashes (and rehash-on-login if enabled)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Dedicated worker processes for hashing, and how many hashes may be running or
+# queued before new requests are turned away with a 503
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+# Opt-in: upgrade stored hashes whose cost no longer matches BCRYPT_ROUNDS on login
+PASSWORD_REHASH_ON_LOGIN = os.getenv("PASSWORD_REHASH_ON_LOGIN", "0") == "1"
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 def hash_password(password: str):
     return pwd_context.hash(password)
 
 def verify_password(plain, hashed):
     return pwd_context.verify(plain, hashed)
+
+def verify_and_update(plain, hashed):
+    """(is_valid, new_hash_or_None) — new hash only if `hashed` needs upgrading."""
+    return pwd_context.verify_and_update(plain, hashed)
+
+
+class PasswordHasherBusy(HTTPException):
+    def __init__(self, retry_after=1):
+        super().__init__(
+            status_code=503,
+            detail="Authentication is busy, please retry",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated process pool so login/register storms
+    neither block the event loop nor eat the threadpool shared by every sync
+    route. At most `max_pending` hashes may be running or queued; past that we
+    fail fast with a 503 rather than let latency grow without bound.
+    """
+
+    def __init__(self, max_workers=PASSWORD_HASH_WORKERS, max_pending=PASSWORD_HASH_MAX_PENDING,
+                 rehash=PASSWORD_REHASH_ON_LOGIN, executor=None):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.rehash = rehash
+        self._executor = executor
+        self.pending = 0
+        self.rejected = 0
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def _run(self, fn, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHasherBusy()
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password):
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain, hashed):
+        """
+        Returns (is_valid, new_hash). new_hash is set only when rehashing is
+        enabled and the stored hash was made with a different cost.
+        """
+        if not self.rehash:
+            return await self._run(verify_password, plain, hashed), None
+        return await self._run(verify_and_update, plain, hashed)
+
+    def stats(self):
+        return {
+            "workers": self.max_workers,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher()
@@ -1,11 +1,27 @@
 # app/database.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from pathlib import Path
 from dotenv import load_dotenv
+import asyncio
 import os
 
+from fastapi import Request
+
+from app.services.pool_metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool, instrument_engine
+from app.services.read_replicas import (
+    DATABASE_REPLICA_URLS,
+    REPLICA_CONNECT_TIMEOUT,
+    REPLICA_STATEMENT_TIMEOUT,
+    ReplicaSet,
+    mark_primary_write,
+    wants_primary,
+)
+
 # Resolve project root (somahorse-backend/)
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -14,14 +30,119 @@ load_dotenv(BASE_DIR / ".env", override=True)
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL)
+# Connection pool, per engine and per worker process (see README for sizing)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "1") == "1"
+
+# DATABASE_URL may name either driver; each engine gets the one it needs.
+SYNC_DRIVERS = {"postgresql": "postgresql+psycopg2", "sqlite": "sqlite"}
+ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+
+def _with_driver(url, drivers):
+    url = make_url(url)
+    backend = url.get_backend_name()
+    return url.set(drivername=drivers.get(backend, url.drivername))
+
+
+def _pool_kwargs(url, poolclass):
+    kwargs = {"pool_pre_ping": DB_POOL_PRE_PING}
+    # SQLite (dev/tests) keeps SQLAlchemy's default pool for its URL type
+    if url.get_backend_name() != "sqlite":
+        kwargs.update(
+            poolclass=poolclass,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+        )
+    return kwargs
+
+
+SYNC_DATABASE_URL = _with_driver(DATABASE_URL, SYNC_DRIVERS)
+ASYNC_DATABASE_URL = _with_driver(DATABASE_URL, ASYNC_DRIVERS)
+
+# Sync engine: Alembic, scripts and the routes that are still `def`
+engine = create_engine(SYNC_DATABASE_URL, **_pool_kwargs(SYNC_DATABASE_URL, TimedQueuePool))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# Async engine for `async def` routes, so request concurrency isn't capped by
+# the threadpool. expire_on_commit=False: no lazy reloads after commit.
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, **_pool_kwargs(ASYNC_DATABASE_URL, TimedAsyncAdaptedQueuePool)
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+instrument_engine(engine, "sync")
+instrument_engine(async_engine, "async")
+
+# Read replicas (async only: the read-heavy routes are async)
+replica_engines = []
+for i, url in enumerate(DATABASE_REPLICA_URLS):
+    url = _with_driver(url, ASYNC_DRIVERS)
+    kwargs = _pool_kwargs(url, TimedAsyncAdaptedQueuePool)
+    if url.get_backend_name() == "postgresql":
+        # asyncpg: connect and per-statement timeouts, so a hung replica errors out
+        kwargs["connect_args"] = {"timeout": REPLICA_CONNECT_TIMEOUT, "command_timeout": REPLICA_STATEMENT_TIMEOUT}
+    replica_engines.append(create_async_engine(url, **kwargs))
+    instrument_engine(replica_engines[-1], f"replica-{i}")
+replica_set = ReplicaSet(async_engine, replica_engines)
+
 
-def get_db():
+# Writes through a request's primary session flag the request, so
+# ReadYourWritesMiddleware pins only callers that actually wrote.
+@event.listens_for(Session, "after_flush")
+def _flag_flush(session, flush_context):
+    state = session.info.get("request_state")
+    if state is not None:
+        mark_primary_write(state)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _flag_bulk_write(orm_execute_state):
+    state = orm_execute_state.session.info.get("request_state")
+    if state is not None and not orm_execute_state.is_select:
+        mark_primary_write(state)
+
+
+def get_db(request: Request):
     db = SessionLocal()
+    db.info["request_state"] = request.state
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db(request: Request):
+    async with AsyncSessionLocal() as db:
+        db.info["request_state"] = request.state
+        yield db
+
+
+async def get_read_db(request: Request):
+    """
+    AsyncSession for read-only routes: a healthy replica (round-robin), or
+    the primary right after the caller's own write. Never commit on it.
+    `db.info["read_target"]` names where it reads from (see reads_primary).
+    """
+    conn, name = await replica_set.connect(use_primary=wants_primary(request.headers, request.cookies))
+    try:
+        async with AsyncSession(bind=conn, autoflush=False, expire_on_commit=False) as db:
+            db.info["read_target"] = name
+            yield db
+    except (OperationalError, OSError, asyncio.TimeoutError) as e:
+        # e.g. a statement timeout on a hung replica: fail over for later reads
+        replica_set.mark_down(name, e)
+        raise
+    finally:
+        await conn.close()
+
+
+def reads_primary(db):
+    """False when `db` reads from a replica, whose rows may lag the primary."""
+    return db.info.get("read_target", "primary") == "primary"
\ No newline at end of file
@@ -1,60 +1,46 @@
 import os
 import logging
-from typing import Optional
-import time
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from app.database import Base, engine
-from app.routers.talent import router as talent_router
-from app.routers.projects import router as project_router
-from app.routers.project_outcomes import router as outcome_router
-from app.routers import matching
-from app.routers.auth import router as auth_router
-from app.routers.dashboard import router as dashboard_router
-from app.routers.payments import router as payments_router
+from app.core.security import password_hasher
+from app.routers.registry import include_routers
+from app.security.firebase import prefetch_public_keys
+from app.services.openapi_document import OpenAPIDocument
 
-
-
-from app.security.firebase import init_firebase
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
-
-from fastapi import FastAPI
-from app.routers import auth
-
-app = FastAPI()
-
-app.include_router(auth.router)
+from app.middleware.request_log import RequestLogMiddleware
+from app.middleware.read_your_writes import ReadYourWritesMiddleware
 
 # ---------------------------------------------------------
 # Create the FastAPI app (ONLY ONCE)
 # ---------------------------------------------------------
+# The schema and docs routes are registered below (see "OpenAPI"), so the
+# document is built once and served as pre-encoded bytes.
+OPENAPI_URL = "/openapi.json"
+
 app = FastAPI(
     title="Somahorse Nexus API",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
 )
 
 # ---------------------------------------------------------
 # Add middleware
 # ---------------------------------------------------------
+app.add_middleware(CompressionMiddleware)
 app.add_middleware(RateLimitMiddleware)
 
 # ---------------------------------------------------------
-# Include routers
+# Include routers (the list lives in app/routers/registry.py)
 # ---------------------------------------------------------
-app.include_router(talent_router)
-app.include_router(project_router)
-app.include_router(outcome_router)
-app.include_router(matching.router)
-app.include_router(auth_router)
-app.include_router(dashboard_router)
-app.include_router(payments_router)
+include_routers(app)
 
 # ---------------------------------------------------------
 # Logging
@@ -80,45 +66,40 @@ app.add_middleware(
 # -------------------------
 # Simple request logging middleware (useful for staging)
 # -------------------------
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
-    logger.info(f">>> {request.method} {request.url.path}")
-    try:
-        response = await call_next(request)
-    except Exception as exc:
-        # Let global exception handler deal with it
-        raise
-    process_time = (time.time() - start_time) * 1000
-    logger.info(f"<<< {request.method} {request.url.path} completed_in={process_time:.2f}ms status={response.status_code}")
-    response.headers["X-Process-Time-ms"] = str(f"{process_time:.2f}")
-    return response
+app.add_middleware(RequestLogMiddleware)
 
 # -------------------------
-# Startup: DB tables + Firebase init
+# Read-your-writes: pin a caller's reads to the primary right after they write
+# -------------------------
+app.add_middleware(ReadYourWritesMiddleware)
+
 # -------------------------
+# Startup does no blocking I/O: the schema is managed by `alembic upgrade head`
+# (run it before deploying), and Firebase Admin initializes on the first token
+# that needs it (app.security.firebase.init_firebase). The Firebase signing
+# keys (with FIREBASE_PROJECT_ID) are fetched by a background thread started
+# here, so no request has to fetch them.
+# -------------------------
+@app.on_event("startup")
+def warm_openapi():
+    openapi_document.warm()
+
 @app.on_event("startup")
-def on_startup():
-    # Create DB tables in dev; in prod use Alembic migrations
-    try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables ensured.")
-    except Exception as e:
-        logger.exception("Failed to create DB tables on startup: %s", e)
-
-    # Initialize Firebase Admin SDK (optional in dev)
-    try:
-        init_firebase()
-        logger.info("Firebase Admin initialized.")
-    except Exception as e:
-        # Don't hard-fail startup for local development; log warning
-        logger.warning("Firebase initialization failed or not configured: %s", e)
+def warm_firebase_keys():
+    prefetch_public_keys()
+
+@app.on_event("shutdown")
+def on_shutdown():
+    password_hasher.shutdown()
 
 # -------------------------
 # OpenAPI / Swagger: add Bearer auth scheme
 # -------------------------
-# We'll add a "bearerAuth" scheme into the generated OpenAPI schema
+# We'll add a "bearerAuth" scheme into the generated OpenAPI schema.
+# /openapi.json serves it from OpenAPIDocument: built once (warmed in the
+# background at startup), encoded once, with ETag/304 and a gzipped copy.
 
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
 from fastapi.openapi.utils import get_openapi
 
 def custom_openapi():
@@ -136,6 +117,25 @@ def custom_openapi():
     return app.openapi_schema
 
 app.openapi = custom_openapi
+openapi_document = OpenAPIDocument(app.openapi)
+
+@app.get(OPENAPI_URL, include_in_schema=False)
+def openapi_json(request: Request):
+    return openapi_document.response(request.headers)
+
+@app.get("/docs", include_in_schema=False)
+def swagger_ui():
+    return get_swagger_ui_html(
+        openapi_url=OPENAPI_URL, title=f"{app.title} - Swagger UI", oauth2_redirect_url="/docs/oauth2-redirect"
+    )
+
+@app.get("/docs/oauth2-redirect", include_in_schema=False)
+def swagger_ui_redirect():
+    return get_swagger_ui_oauth2_redirect_html()
+
+@app.get("/redoc", include_in_schema=False)
+def redoc():
+    return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc")
 
 # -------------------------
 # Global error handlers
@@ -149,6 +149,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
             "status_code": exc.status_code,
             "detail": exc.detail,
         },
+        headers=getattr(exc, "headers", None),
     )
 
 @app.exception_handler(Exception)
@@ -173,12 +174,3 @@ def healthz():
 @app.get("/", tags=["Health"])
 def root():
     return {"message": "Somahorse Nexus API is running"}
-
-# -------------------------
-# Routers
-# -------------------------
-app.include_router(talent_router)
-app.include_router(project_router)
-app.include_router(outcome_router)
-from app.routers import matching
-app.include_router(matching.router)
@@ -0,0 +1,81 @@
+import os
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder, IdentityResponder
+
+from app.services.http_cache import accepted_encodings, encoding_quality
+
+try:  # optional: `pip install brotli` enables Content-Encoding: br
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+# Bodies smaller than this go out uncompressed; the headers would outweigh the saving
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+# Level 6 / quality 5: most of the size win at a fraction of the max-level CPU
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app, minimum_size, quality, exclude_content_types):
+        super().__init__(app, minimum_size, exclude_content_types=exclude_content_types)
+        self.quality = quality
+        self._compressor = None
+
+    async def apply_compression(self, body, *, more_body):
+        if self._compressor is None:
+            self._compressor = brotli.Compressor(quality=self.quality)
+        if more_body:
+            return self._compressor.process(body) + self._compressor.flush()
+        return self._compressor.process(body) + self._compressor.finish()
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Starlette's GZipMiddleware (size threshold, streaming, skips bodies that are
+    already encoded), plus Brotli when the client accepts `br` and the brotli
+    package is installed. Accept-Encoding is parsed with qvalues: a coding
+    with q=0 is never used, and br wins unless gzip has a higher qvalue. A
+    strong ETag on a compressed body is downgraded to weak, since the bytes
+    differ from the identity representation it names.
+    """
+
+    def __init__(self, app, minimum_size=COMPRESSION_MINIMUM_SIZE, compresslevel=GZIP_LEVEL,
+                 brotli_quality=BROTLI_QUALITY, **kwargs):
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel, **kwargs)
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_weakening_etag(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/") and headers.get("content-encoding") in ("gzip", "br"):
+                    headers["ETag"] = "W/" + etag
+            await send(message)
+
+        accepted = accepted_encodings(Headers(scope=scope).get("accept-encoding"))
+        br = encoding_quality(accepted, "br") if brotli is not None else 0.0
+        gzip = encoding_quality(accepted, "gzip")
+        if br > 0 and br >= gzip:
+            responder = BrotliResponder(
+                self.app, self.minimum_size, self.brotli_quality, self.exclude_content_types
+            )
+        elif gzip > 0:
+            responder = GZipResponder(
+                self.app,
+                self.minimum_size,
+                compresslevel=self.compresslevel,
+                thread_minimum_size=self.thread_minimum_size,
+                exclude_content_types=self.exclude_content_types,
+            )
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size, exclude_content_types=self.exclude_content_types)
+        await responder(scope, receive, send_weakening_etag)
@@ -1,32 +1,171 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import HTTPException
+import math
+import os
 import time
+from collections import OrderedDict
 
-rate_cache = {}
+from jose import jwt
+from jose.exceptions import JWTError
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
 
+from app.core.jwt import ALGORITHM, SECRET_KEY
+
+# Requests allowed per WINDOW_SECONDS, by role
 LIMITS = {
     "user": 50,
     "admin": 200
 }
 
+WINDOW_SECONDS = 60
+MAX_TRACKED_KEYS = 100_000
+
+# "memory" (per process) or "redis" (shared across workers/replicas via REDIS_URL)
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_LEASE_SIZE = int(os.getenv("RATE_LIMIT_LEASE_SIZE", "10"))
+
+
+def retry_after_seconds(window, limit, current, previous, elapsed):
+    """Seconds until a sliding-window counter at (current, previous) admits a request."""
+    if current >= limit or not previous:
+        # only the next window can free capacity
+        wait = window - elapsed
+    else:
+        # wait until the previous window's weighted share decays enough
+        wait = window * (1 - (limit - current) / previous) - elapsed
+    return max(1, math.ceil(wait))
+
+
+class SlidingWindowLimiter:
+    """
+    Sliding-window counter: per key we keep only the current and previous
+    fixed-window counts and weight the previous one by how much of it still
+    overlaps the sliding window. Constant work and memory per key.
+
+    Keys idle for two windows are evicted (oldest first), and at most
+    `max_keys` are tracked, so a scan from many IPs can't grow memory unbounded.
+    """
+
+    def __init__(self, window=WINDOW_SECONDS, max_keys=MAX_TRACKED_KEYS, clock=time.monotonic):
+        self.window = window
+        self.max_keys = max_keys
+        self.clock = clock
+        # key -> [window_start, current_count, previous_count]
+        self._buckets = OrderedDict()
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def _evict(self, now):
+        while self._buckets:
+            key, bucket = next(iter(self._buckets.items()))
+            if now - bucket[0] < 2 * self.window and len(self._buckets) <= self.max_keys:
+                break
+            del self._buckets[key]
+
+    def hit(self, key, limit):
+        """
+        Count one request for `key`. Returns (allowed, remaining, retry_after_seconds).
+        """
+        now = self.clock()
+        self._evict(now)
+
+        window_start = now - (now % self.window)
+        bucket = self._buckets.pop(key, None)
+        if bucket is None:
+            bucket = [window_start, 0, 0]
+        elif bucket[0] != window_start:
+            # roll over: the old current window becomes "previous" only if adjacent
+            adjacent = window_start - bucket[0] == self.window
+            bucket = [window_start, 0, bucket[1] if adjacent else 0]
+        self._buckets[key] = bucket  # most recently used goes last
+
+        elapsed = now - window_start
+        weight = 1 - elapsed / self.window
+        estimate = bucket[2] * weight + bucket[1]
+
+        if estimate >= limit:
+            return False, 0, retry_after_seconds(self.window, limit, bucket[1], bucket[2], elapsed)
+
+        bucket[1] += 1
+        return True, max(0, int(limit - estimate - 1)), 0
+
+    async def acquire(self, key, limit):
+        return self.hit(key, limit)
+
+
+def role_from_authorization(auth_header):
+    """
+    Limit tier for the caller. The admin tier needs one of our own login
+    tokens with a valid signature (a local HMAC check, no I/O); anything
+    else, including a forged or unverifiable `role` claim, is "user".
+    Firebase tokens are not verified here (that can need a key fetch), so
+    they get the user tier.
+    """
+    if auth_header and auth_header.lower().startswith("bearer "):
+        try:
+            claims = jwt.decode(auth_header.split(" ", 1)[1], SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
+            return "user"
+        if claims.get("role") == "admin":
+            return "admin"
+    return "user"
+
+
+def backend_from_env():
+    """Build the limiter backend selected by RATE_LIMIT_BACKEND."""
+    if RATE_LIMIT_BACKEND == "redis":
+        from app.middleware.rate_limit_backends import RedisWindowBackend
+
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis needs REDIS_URL (e.g. redis://localhost:6379/0)")
+        return RedisWindowBackend.from_url(
+            redis_url, window=WINDOW_SECONDS, lease_size=RATE_LIMIT_LEASE_SIZE
+        )
+    if RATE_LIMIT_BACKEND != "memory":
+        raise RuntimeError(f"Unknown RATE_LIMIT_BACKEND {RATE_LIMIT_BACKEND!r} (expected 'memory' or 'redis')")
+    return SlidingWindowLimiter()
+
+
+limiter = backend_from_env()
+
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        ip = request.client.host
-        now = time.time()
+class RateLimitMiddleware:
+    """
+    Pure ASGI middleware (no BaseHTTPMiddleware task/stream wrapping): rejects
+    over-limit requests with a 429 and adds X-RateLimit-* headers otherwise.
+    """
 
-        window = 60
+    def __init__(self, app, limiter=limiter, limits=LIMITS):
+        self.app = app
+        self.limiter = limiter
+        self.limits = limits
 
-        if ip not in rate_cache:
-            rate_cache[ip] = []
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        rate_cache[ip] = [t for t in rate_cache[ip] if now - t < window]
-        count = len(rate_cache[ip])
+        client = scope.get("client")
+        ip = client[0] if client else "unknown"
+        role = role_from_authorization(Headers(scope=scope).get("authorization"))
+        limit = self.limits.get(role, self.limits["user"])
 
-        if count > LIMITS["user"]:
-            raise HTTPException(status_code=429, detail="Too many requests")
+        allowed, remaining, retry_after = await self.limiter.acquire(f"{ip}:{role}", limit)
+        if not allowed:
+            response = JSONResponse(
+                status_code=429,
+                content={"error": True, "status_code": 429, "detail": "Too many requests"},
+                headers={"Retry-After": str(retry_after), "X-RateLimit-Limit": str(limit)},
+            )
+            await response(scope, receive, send)
+            return
 
-        rate_cache[ip].append(now)
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(limit)
+                headers["X-RateLimit-Remaining"] = str(remaining)
+            await send(message)
 
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send_with_headers)
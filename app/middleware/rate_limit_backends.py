@@ -0,0 +1,204 @@
+import logging
+import math
+import time
+from collections import OrderedDict
+
+from app.middleware.rate_limit import MAX_TRACKED_KEYS, WINDOW_SECONDS, SlidingWindowLimiter, retry_after_seconds
+
+logger = logging.getLogger("somahorse-backend")
+
+# Store failures that make the backend fail open to its local window
+# (builtin ConnectionError/TimeoutError are OSErrors)
+try:
+    from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+except ImportError:
+    STORE_ERRORS = (OSError,)
+else:
+    STORE_ERRORS = (RedisConnectionError, RedisTimeoutError, OSError)
+
+
+class RedisWindowBackend:
+    """
+    Sliding-window counter shared by every worker/replica through a Redis
+    compatible store: one counter key per (client key, fixed window), bumped
+    with INCRBY + EXPIRE in a single MULTI/EXEC, next to a GET of the previous
+    window's counter.
+
+    To avoid a network round trip per request, each process leases a small
+    batch of tokens with one INCRBY and serves them locally until they run out
+    or the window rolls over. Tokens that would push the key over its limit
+    are handed straight back with DECRBY, and a denied key is answered locally
+    until its Retry-After passes. Leased-but-unused tokens still count, so
+    leasing can only make the limit stricter, never looser.
+
+    If the store is unreachable or times out, requests fail open to a local
+    in-process window (per-process limits, like the "memory" backend) instead
+    of erroring; `store_failures` counts them and the first of each outage is
+    logged.
+    """
+
+    def __init__(self, client, window=WINDOW_SECONDS, lease_size=10, prefix="ratelimit",
+                 max_keys=MAX_TRACKED_KEYS, clock=time.time):
+        self.client = client
+        self.window = window
+        self.lease_size = lease_size
+        self.prefix = prefix
+        self.max_keys = max_keys
+        # wall clock: windows must line up across processes and hosts
+        self.clock = clock
+        # key -> [window_start, tokens_left, remaining_after_lease, blocked_until]
+        self._leases = OrderedDict()
+        self.fallback = SlidingWindowLimiter(window=window, max_keys=max_keys)
+        self.store_failures = 0
+        self._store_down = False
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        import redis.asyncio as redis
+
+        return cls(redis.from_url(url), **kwargs)
+
+    def _lease_size(self, limit):
+        # keep N workers x lease well under the limit
+        return max(1, min(self.lease_size, limit // 10))
+
+    def _counter_key(self, key, window_start):
+        return f"{self.prefix}:{key}:{int(window_start)}"
+
+    async def acquire(self, key, limit):
+        now = self.clock()
+        window_start = now - (now % self.window)
+        elapsed = now - window_start
+
+        lease = self._leases.get(key)
+        if lease is not None:
+            if now < lease[3]:
+                return False, 0, max(1, math.ceil(lease[3] - now))
+            if lease[0] == window_start and lease[1] > 0:
+                lease[1] -= 1
+                self._leases.move_to_end(key)
+                return True, lease[1] + lease[2], 0
+
+        size = self._lease_size(limit)
+        current_key = self._counter_key(key, window_start)
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.incrby(current_key, size)
+            pipe.expire(current_key, int(2 * self.window))
+            pipe.get(self._counter_key(key, window_start - self.window))
+            current, _, previous = await pipe.execute()
+
+            previous = int(previous or 0)
+            before = current - size
+            estimate = previous * (1 - elapsed / self.window) + before
+            granted = min(size, max(0, math.ceil(limit - estimate)))
+            if granted < size:
+                await self.client.decrby(current_key, size - granted)
+        except STORE_ERRORS as e:
+            return self._fail_open(key, limit, e)
+        if self._store_down:
+            self._store_down = False
+            logger.info("Rate limit store reachable again")
+
+        if not granted:
+            # other workers can only add to the count, so this wait is a lower bound
+            retry_after = retry_after_seconds(self.window, limit, before, previous, elapsed)
+            self._store_lease(key, [window_start, 0, 0, now + retry_after])
+            return False, 0, retry_after
+
+        remaining = max(0, int(limit - estimate - granted))
+        self._store_lease(key, [window_start, granted - 1, remaining, 0])
+        return True, granted - 1 + remaining, 0
+
+    def _fail_open(self, key, limit, error):
+        self.store_failures += 1
+        if not self._store_down:
+            self._store_down = True
+            logger.warning("Rate limit store unavailable, limiting per process: %s", error)
+        return self.fallback.hit(key, limit)
+
+    def _store_lease(self, key, lease):
+        self._leases[key] = lease
+        self._leases.move_to_end(key)
+        while len(self._leases) > self.max_keys:
+            self._leases.popitem(last=False)
+
+
+class InProcessRedis:
+    """
+    Minimal asyncio stand-in for the Redis commands RedisWindowBackend uses
+    (INCRBY, DECRBY, GET, EXPIRE, MULTI/EXEC pipelines). For tests and
+    benchmarks; state lives in this process only.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.round_trips = 0
+        self._data = {}
+        self._expires = {}
+
+    def _live(self, key):
+        expires = self._expires.get(key)
+        if expires is not None and expires <= self.clock():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return self._data.get(key)
+
+    def _incrby(self, key, amount):
+        value = int(self._live(key) or 0) + amount
+        self._data[key] = value
+        return value
+
+    def _expire(self, key, seconds):
+        if self._live(key) is None:
+            return False
+        self._expires[key] = self.clock() + seconds
+        return True
+
+    async def incrby(self, key, amount=1):
+        self.round_trips += 1
+        return self._incrby(key, amount)
+
+    async def decrby(self, key, amount=1):
+        self.round_trips += 1
+        return self._incrby(key, -amount)
+
+    async def get(self, key):
+        self.round_trips += 1
+        value = self._live(key)
+        return None if value is None else str(value).encode()
+
+    async def expire(self, key, seconds):
+        self.round_trips += 1
+        return self._expire(key, seconds)
+
+    def pipeline(self, transaction=True):
+        return _InProcessPipeline(self)
+
+
+class _InProcessPipeline:
+    def __init__(self, store):
+        self.store = store
+        self.commands = []
+
+    def incrby(self, key, amount=1):
+        self.commands.append(lambda: self.store._incrby(key, amount))
+        return self
+
+    def expire(self, key, seconds):
+        self.commands.append(lambda: self.store._expire(key, seconds))
+        return self
+
+    def get(self, key):
+        def _get():
+            value = self.store._live(key)
+            return None if value is None else str(value).encode()
+        self.commands.append(_get)
+        return self
+
+    async def execute(self):
+        # one round trip, applied atomically (nothing else runs in between)
+        self.store.round_trips += 1
+        results = [command() for command in self.commands]
+        self.commands = []
+        return results
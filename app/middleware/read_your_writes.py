@@ -0,0 +1,55 @@
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.services.read_replicas import (
+    PRIMARY_COOKIE,
+    READ_YOUR_WRITES_SECONDS,
+    WROTE_PRIMARY,
+    caller_key,
+    recent_writes,
+)
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pure ASGI middleware: after a successful request that wrote to the
+    primary (flagged by the DB session, see mark_primary_write), remember the
+    caller so get_read_db sends their reads to the primary for
+    READ_YOUR_WRITES_SECONDS. Read-only POSTs (e.g. /v1/match/batch) don't pin.
+    Bearer clients are tracked in-process by hashed credentials; a short-lived
+    cookie covers browsers whose next request lands on another worker.
+    """
+
+    def __init__(self, app, window=READ_YOUR_WRITES_SECONDS):
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        # shared with request.state in the app, even if the scope is copied
+        state = scope.setdefault("state", {})
+
+        async def send_marking_writes(message):
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < 400
+                and state.get(WROTE_PRIMARY)
+            ):
+                key = caller_key(Headers(scope=scope).get("authorization"))
+                if key:
+                    recent_writes.mark(key)
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Set-Cookie",
+                    f"{PRIMARY_COOKIE}={time.time() + self.window:.3f}; Max-Age={int(self.window) or 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_marking_writes)
@@ -0,0 +1,45 @@
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger("somahorse-backend")
+
+
+class RequestLogMiddleware:
+    """
+    Pure ASGI access log + timing: logs each request and its completion, and
+    sets X-Process-Time-ms (time until the response headers were sent).
+    Unlike BaseHTTPMiddleware it doesn't spawn a task or buffer the body, so
+    streaming responses pass straight through.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method, path = scope["method"], scope["path"]
+        start_time = time.perf_counter()
+        status = None
+        process_time = None
+        logger.info(">>> %s %s", method, path)
+
+        async def send_with_timing(message):
+            nonlocal status, process_time
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                process_time = (time.perf_counter() - start_time) * 1000
+                MutableHeaders(scope=message)["X-Process-Time-ms"] = f"{process_time:.2f}"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            if process_time is None:
+                # app raised before sending headers; the exception handlers log it
+                process_time = (time.perf_counter() - start_time) * 1000
+            logger.info("<<< %s %s completed_in=%.2fms status=%s", method, path, process_time, status)
@@ -1,3 +1,4 @@
+from .user import User
 from .talent import Talent
 from .project import Project
 from .project_outcome import ProjectOutcome
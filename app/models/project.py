@@ -1,11 +1,10 @@
 from sqlalchemy import Column, Integer, String
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.models.versioning import RowVersionMixin
 from sqlalchemy import ARRAY, Text
 
-required_skills = Column(ARRAY(Text), nullable=True, default=list)
-
-class Project(Base):
+class Project(RowVersionMixin, Base):
     __tablename__ = "projects"
 
     id = Column(Integer, primary_key=True, index=True)
@@ -13,6 +12,8 @@ class Project(Base):
     description = Column(String(1000), nullable=True)
     technical_brief = Column(String(2000), nullable=True)
 
+    required_skills = Column(ARRAY(Text), nullable=True, default=list)
+
     expected_duration_days = Column(Integer, nullable=True)
     time_to_match_days = Column(Integer, nullable=True)
 
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Boolean, Enum
+from sqlalchemy import Column, Integer, String, Boolean, Enum, Index
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy import Text
 from app.database import Base
+from app.models.versioning import RowVersionMixin
 import enum
 
 class AvailabilityStatus(str, enum.Enum):
@@ -9,7 +10,7 @@ class AvailabilityStatus(str, enum.Enum):
     busy = "busy"
     on_project = "on_project"
 
-class Talent(Base):
+class Talent(RowVersionMixin, Base):
     __tablename__ = "talent"
 
     id = Column(Integer, primary_key=True, index=True)
@@ -25,3 +26,8 @@ class Talent(Base):
         nullable=False,
         default=AvailabilityStatus.available
     )
+
+    # GIN index so `skills && :required` (array overlap) is an index scan
+    __table_args__ = (
+        Index("ix_talent_skills_gin", "skills", postgresql_using="gin"),
+    )
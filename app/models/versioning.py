@@ -0,0 +1,38 @@
+from sqlalchemy import BigInteger, Column, DateTime, Sequence, func
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import next_value
+
+from app.database import Base
+
+# One sequence shared by every versioned table, so a single number orders all
+# changes: "everything with version > N" is an index range scan per table.
+row_version_seq = Sequence("row_version_seq", metadata=Base.metadata)
+
+
+class RowVersionMixin:
+    """
+    `version` is taken from row_version_seq on every ORM insert and update, and
+    `updated_at` is reset with it. eager_defaults reads both back via RETURNING
+    on flush, so they are usable without another SELECT (or a lazy load on an
+    AsyncSession).
+    """
+
+    version = Column(BigInteger, nullable=False, index=True,
+                     default=row_version_seq.next_value(), onupdate=row_version_seq.next_value())
+    updated_at = Column(DateTime(timezone=True), nullable=False,
+                        server_default=func.now(), default=func.now(), onupdate=func.now())
+
+    __mapper_args__ = {"eager_defaults": True}
+
+
+# SQLite (dev/tests) has no sequences: take max+1 across the versioned tables.
+# Writers are serialized there, so this is still monotonic.
+@compiles(next_value, "sqlite")
+def _sqlite_next_value(element, compiler, **kw):
+    tables = [cls.__tablename__ for cls in _versioned_models()]
+    parts = " UNION ALL ".join(f"SELECT max(version) AS v FROM {t}" for t in tables)
+    return f"(SELECT coalesce(max(v), 0) + 1 FROM ({parts}))"
+
+
+def _versioned_models():
+    return [m.class_ for m in Base.registry.mappers if issubclass(m.class_, RowVersionMixin)]
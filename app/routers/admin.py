@@ -1,14 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from app.core.responses import ORJSONResponse
 from app.database import get_db
 from app.models import Talent, Project, ProjectOutcome, User
 from app.schemas.talent import TalentCreate, TalentUpdate, TalentResponse
-from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
+from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectRead as ProjectResponse
 from app.schemas.project_outcome import ProjectOutcomeCreate, ProjectOutcomeUpdate
-from app.auth.dependencies import get_current_user
-from app.routers.matching import calculate_match
-from typing import List
-from app.auth.rbac import require_role
+from app.schemas.matching import ProjectMatchResponse
+from app.schemas.pagination import Page
+from app.schemas.user import UserResponse, UserRoleUpdate
+from app.routers.matching import project_match_page
+from app.services.export import MEDIA_TYPES, stream_table
+from app.services.match_cache import match_cache
+from app.services.pagination import PageParams, keyset_page
+from app.services.skill_index import skill_index
+from typing import List, Optional
+from app.security.principal import Principal, get_principal, require_roles, role_cache
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -16,7 +24,7 @@ router = APIRouter(prefix="/admin", tags=["Admin"])
 # ------------------------------
 # ADMIN AUTH CHECK
 # ------------------------------
-def verify_admin(user: User):
+def verify_admin(user: Principal):
     if not user or not user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
 
@@ -24,20 +32,21 @@ def verify_admin(user: User):
 # ------------------------------
 # TALENT MANAGEMENT
 # ------------------------------
-@router.get("/talents", response_model=List[TalentResponse])
+@router.get("/talents", response_model=Page[TalentResponse])
 def list_talents(
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    user: Principal = Depends(get_principal)
 ):
     verify_admin(user)
-    return db.query(Talent).all()
+    return keyset_page(db.query(Talent), Talent.id, page)
 
 
 @router.post("/talents", response_model=TalentResponse)
 def create_talent(
     payload: TalentCreate,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    user: Principal = Depends(get_principal)
 ):
     verify_admin(user)
 
@@ -45,6 +54,8 @@ def create_talent(
     db.add(talent)
     db.commit()
     db.refresh(talent)
+    skill_index.upsert(talent.id, talent.skills)
+    match_cache.invalidate_talent(talent.skills)
     return talent
 
 
@@ -53,7 +64,7 @@ def update_talent(
     talent_id: int,
     payload: TalentUpdate,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    user: Principal = Depends(get_principal)
 ):
     verify_admin(user)
 
@@ -61,11 +72,14 @@ def update_talent(
     if not talent:
         raise HTTPException(status_code=404, detail="Talent not found")
 
+    old_skills = list(talent.skills or [])
     for key, value in payload.dict(exclude_unset=True).items():
         setattr(talent, key, value)
 
     db.commit()
     db.refresh(talent)
+    skill_index.upsert(talent.id, talent.skills)
+    match_cache.invalidate_talent(old_skills, talent.skills)
     return talent
 
 
@@ -73,7 +87,7 @@ def update_talent(
 def delete_talent(
     talent_id: int,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    user: Principal = Depends(get_principal)
 ):
     verify_admin(user)
 
@@ -81,26 +95,30 @@ def delete_talent(
     if not talent:
         raise HTTPException(status_code=404, detail="Talent not found")
 
+    old_skills = list(talent.skills or [])
     db.delete(talent)
     db.commit()
+    skill_index.remove(talent_id)
+    match_cache.invalidate_talent(old_skills)
     return {"message": "Talent deleted successfully"}
 
 
 # ------------------------------
 # PROJECT MANAGEMENT
 # ------------------------------
-@router.get("/projects", response_model=List[ProjectResponse])
+@router.get("/projects", response_model=Page[ProjectResponse])
 def list_projects(
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    user: Principal = Depends(get_principal)
 ):
     verify_admin(user)
-    return db.query(Project).all()
+    return keyset_page(db.query(Project), Project.id, page)
 
 @router.get("/admin/dashboard")
 def admin_dashboard(
-    current_user = Depends(get_current_user),
-    _ = Depends(require_role("admin"))
+    current_user = Depends(get_principal),
+    _ = Depends(require_roles(["admin"]))
 ):
     return {"msg": "Admin dashboard"}
 
@@ -108,7 +126,7 @@ def admin_dashboard(
 def create_project(
     payload: ProjectCreate,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    user: Principal = Depends(get_principal)
 ):
     verify_admin(user)
 
@@ -124,7 +142,7 @@ def update_project(
     project_id: int,
     payload: ProjectUpdate,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    user: Principal = Depends(get_principal)
 ):
     verify_admin(user)
 
@@ -137,6 +155,7 @@ def update_project(
 
     db.commit()
     db.refresh(project)
+    match_cache.invalidate_project(project_id)
     return project
 
 
@@ -144,7 +163,7 @@ def update_project(
 def delete_project(
     project_id: int,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    user: Principal = Depends(get_principal)
 ):
     verify_admin(user)
 
@@ -154,6 +173,7 @@ def delete_project(
 
     db.delete(project)
     db.commit()
+    match_cache.invalidate_project(project_id)
     return {"message": "Project deleted successfully"}
 
 
@@ -162,47 +182,125 @@ def delete_project(
 # ------------------------------
 @router.get("/outcomes")
 def list_outcomes(
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    user: Principal = Depends(get_principal)
 ):
     verify_admin(user)
-    return db.query(ProjectOutcome).all()
+    return keyset_page(db.query(ProjectOutcome), ProjectOutcome.id, page)
+
+
+# ------------------------------
+# USER ROLES
+# ------------------------------
+@router.patch("/users/{user_id}/role", response_model=UserResponse)
+def update_user_role(
+    user_id: int,
+    payload: UserRoleUpdate,
+    db: Session = Depends(get_db),
+    user: Principal = Depends(get_principal)
+):
+    verify_admin(user)
+
+    target = db.get(User, user_id)
+    if not target:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    target.role = payload.role
+    db.commit()
+    db.refresh(target)
+    role_cache.invalidate(target.email)
+    return target
+
+
+# ------------------------------
+# STREAMING EXPORTS (NDJSON / CSV)
+# ------------------------------
+def _export_response(db, model, name, fmt, *criteria):
+    return StreamingResponse(
+        stream_table(db.get_bind(), model, *criteria, fmt=fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+
+@router.get("/export/talents")
+def export_talents(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    location: Optional[str] = None,
+    min_vetting_score: Optional[float] = None,
+    db: Session = Depends(get_db),
+    user: Principal = Depends(get_principal)
+):
+    verify_admin(user)
+
+    # Talent has no location / vetting score columns yet. Refuse the filters
+    # rather than silently exporting every row.
+    criteria = []
+    for param, value, column in (
+        ("location", location, "location"),
+        ("min_vetting_score", min_vetting_score, "vetting_overall_score"),
+    ):
+        if value is not None and not hasattr(Talent, column):
+            raise HTTPException(status_code=422, detail=f"{param} filter is not supported: talent has no {column} column")
+    if location is not None:
+        criteria.append(Talent.location.ilike(location))
+    if min_vetting_score is not None:
+        criteria.append(Talent.vetting_overall_score >= min_vetting_score)
+
+    return _export_response(db, Talent, "talents", format, *criteria)
+
+
+@router.get("/export/projects")
+def export_projects(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    db: Session = Depends(get_db),
+    user: Principal = Depends(get_principal)
+):
+    verify_admin(user)
+    return _export_response(db, Project, "projects", format)
+
+
+@router.get("/export/outcomes")
+def export_outcomes(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    db: Session = Depends(get_db),
+    user: Principal = Depends(get_principal)
+):
+    verify_admin(user)
+    return _export_response(db, ProjectOutcome, "outcomes", format)
 
 
 # ------------------------------
 # ADMIN: VIEW MATCHES FOR ANY PROJECT
 # ------------------------------
-@router.get("/match/{project_id}")
+@router.get("/match/{project_id}", response_model=ProjectMatchResponse)
 def admin_match_view(
     project_id: int,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    user: Principal = Depends(get_principal)
 ):
     verify_admin(user)
 
+    cache_key = ("admin", project_id, limit, offset)
+    cached = match_cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    required_skills = [s.name for s in project.required_skills]
-    talents = db.query(Talent).all()
-
-    matches = []
-
-    for t in talents:
-        skills = [s.name for s in t.skills]
-        score = calculate_match(skills, required_skills, t.experience_years or 0)
-
-        matches.append({
-            "talent_id": t.id,
-            "name": t.user.username if t.user else None,
-            "match_score": score,
-            "skills": skills,
-            "experience_years": t.experience_years
-        })
+    matches = project_match_page(db, project, limit=limit, offset=offset)
 
-    matches.sort(key=lambda x: x["match_score"], reverse=True)
-    return {"project_id": project_id, "matches": matches}
+    result = {"project_id": project_id, "matches": matches}
+    # No skills on the entry: the page ranks every talent (zero-overlap rows
+    # and experience_years included), so any talent write must drop it.
+    match_cache.set(cache_key, result, project_id)
+    # rows are already plain typed values; skip re-validation (see matching.py)
+    return ORJSONResponse(result)
 
 
 # ------------------------------
@@ -213,7 +311,7 @@ def admin_force_assign(
     project_id: int,
     talent_id: int,
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user)
+    user: Principal = Depends(get_principal)
 ):
     verify_admin(user)
 
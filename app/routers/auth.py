@@ -1,43 +1,57 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.schemas.user import UserCreate, UserLogin, UserResponse
 from app.models.user import User
-from app.core.security import hash_password, verify_password
+from app.core.security import password_hasher
 from app.core.jwt import create_access_token
 from fastapi import APIRouter, Depends
-from app.auth.firebase import get_current_user
+from app.security.principal import get_principal, role_cache
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
+def _user_by_email(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
+
+def _save(db: Session, user: User):
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+# Async so bcrypt can be awaited on the hashing pool; DB calls go to the threadpool.
 @router.post("/register", response_model=UserResponse)
-def register_user(data: UserCreate, db: Session = Depends(get_db)):
-    user_exists = db.query(User).filter(User.email == data.email).first()
+async def register_user(data: UserCreate, db: Session = Depends(get_db)):
+    user_exists = await run_in_threadpool(_user_by_email, db, data.email)
     if user_exists:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     user = User(
         full_name=data.full_name,
         email=data.email,
-        hashed_password=hash_password(data.password),
-        role=data.role
+        hashed_password=await password_hasher.hash(data.password),
+        role="client",
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    user = await run_in_threadpool(_save, db, user)
+    role_cache.invalidate(user.email)
     return user
 
 @router.post("/login")
-def login(data: UserLogin, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == data.email).first()
-    if not user or not verify_password(data.password, user.hashed_password):
+async def login(data: UserLogin, db: Session = Depends(get_db)):
+    user = await run_in_threadpool(_user_by_email, db, data.email)
+    valid, new_hash = (await password_hasher.verify(data.password, user.hashed_password)) if user else (False, None)
+    if not valid:
         raise HTTPException(status_code=400, detail="Invalid email or password")
+    if new_hash:
+        user.hashed_password = new_hash
+        await run_in_threadpool(_save, db, user)
 
     token = create_access_token({"sub": user.email, "role": user.role})
     return {"access_token": token, "token_type": "bearer", "role": user.role}
 @router.get("/me")
-async def get_me(user = Depends(get_current_user)):
+async def get_me(user = Depends(get_principal)):
     return {
         "uid": user["uid"],
         "email": user.get("email"),
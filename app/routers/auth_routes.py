@@ -1,40 +1,3 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-
-from app.database import get_db
-from app import models, schemas
-from app.auth import hash_password, verify_password, create_access_token
-
-router = APIRouter(prefix="/auth", tags=["Authentication"])
-
-
-@router.post("/register", response_model=schemas.UserResponse)
-def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
-    exists = db.query(models.User).filter(models.User.email == user.email).first()
-    if exists:
-        raise HTTPException(status_code=400, detail="Email already registered")
-
-    hashed = hash_password(user.password)
-
-    new_user = models.User(
-        username=user.username,
-        email=user.email,
-        password_hash=hashed,
-        role=user.role
-    )
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    return new_user
-
-
-@router.post("/login")
-def login(login_data: schemas.LoginSchema, db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.email == login_data.email).first()
-
-    if not user or not verify_password(login_data.password, user.password_hash):
-        raise HTTPException(status_code=401, detail="Invalid email or password")
-
-    token = create_access_token({"user_id": user.id, "role": user.role})
-
-    return {"access_token": token, "token_type": "bearer"}
+# Legacy module: /auth/register and /auth/login live in app.routers.auth.
+# Kept as an alias so old imports get the same router (mounted once).
+from app.routers.auth import router  # noqa: F401
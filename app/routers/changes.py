@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.models.project import Project
+from app.models.talent import Talent
+from app.schemas.changes import ChangeFeed
+from app.security.principal import get_async_current_admin
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get("/changes", response_model=ChangeFeed)
+async def list_changes(
+    since: int = Query(0, ge=0, description="next_since from the previous call; 0 for everything"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
+    admin: dict = Depends(get_async_current_admin),
+):
+    """
+    Talent and projects inserted or updated after row version `since`, oldest
+    change first, at most `limit` rows in total. Each table is read with an
+    index range scan on `version`. Deletes are not reported.
+
+    Versions are assigned at write time but become visible at commit, so a
+    slow transaction can commit a version below one already returned; poll
+    with a small overlap (e.g. `since=next_since - 100`) if that matters.
+    """
+    changed = []
+    for model in (Talent, Project):
+        result = await db.execute(
+            select(model).where(model.version > since).order_by(model.version).limit(limit + 1)
+        )
+        changed.extend(result.scalars().all())
+
+    changed.sort(key=lambda row: row.version)
+    has_more = len(changed) > limit
+    changed = changed[:limit]
+    return {
+        "talent": [row for row in changed if isinstance(row, Talent)],
+        "projects": [row for row in changed if isinstance(row, Project)],
+        "next_since": changed[-1].version if changed else since,
+        "has_more": has_more,
+    }
@@ -1,176 +1,163 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select, true, union
 from sqlalchemy.orm import Session
+from app.core.security import password_hasher
 from app.database import get_db
-from app import models, schemas
-
+from app import models
+from app.schemas.pagination import NamePage, Page
+from app.schemas.project import ProjectRead
+from app.schemas.talent import TalentRead
+from app.schemas.user import UserCreate, UserResponse
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PageParams, keyset_page
+from app.services.skill_index import skill_names
+from app.security.principal import require_roles, role_cache
+
+# Legacy admin API: every route is admin-only (it exposes users and talent emails)
 router = APIRouter(
     prefix="/api",
     tags=["CRUD"],
+    dependencies=[Depends(require_roles(["admin"]))],
 )
-from app.dependencies import require_admin, require_talent
 
-@router.get("/admin/talents", dependencies=[Depends(require_admin)])
-def admin_list_all_talents(db: Session = Depends(get_db)):
-    return db.query(models.Talent).all()
+# Talent, projects and outcomes are created through their own routers
+# (/talent, /project, /v1/projects/{id}/outcomes), which check ownership and
+# keep the skill index and match cache in sync; this router only reads them.
+# The talent list for admins is the keyset-paged GET /admin/talents.
 
 # -----------------------------------------
-# USERS
+# USERS (admin only)
 # -----------------------------------------
-@router.post("/users", response_model=schemas.UserResponse)
-def create_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
-    db_user = db.query(models.User).filter(models.User.email == user.email).first()
+def _user_by_email(db: Session, email: str):
+    return db.query(models.User).filter(models.User.email == email).first()
+
+
+def _save(db: Session, user):
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+@router.post("/users", response_model=UserResponse)
+async def create_user(user: UserCreate, db: Session = Depends(get_db)):
+    db_user = await run_in_threadpool(_user_by_email, db, user.email)
     if db_user:
         raise HTTPException(status_code=400, detail="Email already exists")
 
+    # always "client"; roles change via PATCH /admin/users/{id}/role
     new_user = models.User(
-        username=user.username,
+        full_name=user.full_name,
         email=user.email,
-        password_hash=user.password,   # hash later in Step 3
-        role=user.role
+        hashed_password=await password_hasher.hash(user.password),
+        role="client",
     )
-
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    new_user = await run_in_threadpool(_save, db, new_user)
+    role_cache.invalidate(new_user.email)
     return new_user
 
 
-@router.get("/users", response_model=list[schemas.UserResponse])
-def get_users(db: Session = Depends(get_db)):
-    return db.query(models.User).all()
+@router.get("/users", response_model=Page[UserResponse])
+def get_users(page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return keyset_page(db.query(models.User), models.User.id, page)
 
 
 # -----------------------------------------
 # SKILLS
 # -----------------------------------------
-@router.post("/skills")
-def create_skill(skill: schemas.SkillCreate, db: Session = Depends(get_db)):
-    new_skill = models.Skill(name=skill.name)
-    db.add(new_skill)
-    db.commit()
-    db.refresh(new_skill)
-    return new_skill
-
-
-@router.get("/skills")
-def get_skills(db: Session = Depends(get_db)):
-    return db.query(models.Skill).all()
-
-
-# -----------------------------------------
-# TALENTS
-# -----------------------------------------
-@router.post("/talents", response_model=schemas.TalentResponse)
-def create_talent(talent: schemas.TalentCreate, db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.id == talent.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    new_talent = models.Talent(
-        user_id=talent.user_id,
-        bio=talent.bio,
-        experience_level=talent.experience_level
-    )
-
-    # Add skills
-    skills = db.query(models.Skill).filter(models.Skill.id.in_(talent.skill_ids)).all()
-    new_talent.skills = skills
-
-    db.add(new_talent)
-    db.commit()
-    db.refresh(new_talent)
-    return new_talent
-
-
-@router.get("/talents")
-def list_talents(db: Session = Depends(get_db)):
-    return db.query(models.Talent).all()
-
-
-# -----------------------------------------
-# PROJECTS
-# -----------------------------------------
-@router.post("/projects", response_model=schemas.ProjectResponse)
-def create_project(project: schemas.ProjectCreate, db: Session = Depends(get_db)):
-    owner = db.query(models.User).filter(models.User.id == project.owner_id).first()
-    if not owner:
-        raise HTTPException(status_code=404, detail="Owner not found")
-
-    new_project = models.Project(
-        title=project.title,
-        description=project.description,
-        owner_id=project.owner_id
-    )
-
-    skills = db.query(models.Skill).filter(models.Skill.id.in_(project.skill_ids)).all()
-    new_project.required_skills = skills
-
-    db.add(new_project)
-    db.commit()
-    db.refresh(new_project)
-    return new_project
-
-
-@router.get("/projects")
-def list_projects(db: Session = Depends(get_db)):
-    return db.query(models.Project).all()
+def _skill_names_query(db: Session):
+    """SELECT name FROM (distinct names in talent.skills and projects.required_skills)."""
+    if db.get_bind().dialect.name == "postgresql":
+        talent = select(func.unnest(models.Talent.skills).label("name"))
+        projects = select(func.unnest(models.Project.required_skills).label("name"))
+    else:  # SQLite (dev/tests) stores ARRAY columns as JSON
+        talent_items = func.json_each(models.Talent.skills).table_valued("value")
+        project_items = func.json_each(models.Project.required_skills).table_valued("value")
+        talent = select(talent_items.c.value.label("name")).select_from(models.Talent).join(talent_items, true())
+        projects = (
+            select(project_items.c.value.label("name"))
+            .select_from(models.Project)
+            .join(project_items, true())
+        )
+    return union(talent, projects).subquery()
+
+
+@router.get("/skills", response_model=NamePage)
+def get_skills(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """
+    Distinct skill names in use on talent and projects (skills are ARRAY
+    columns, not a table), in name order and keyset-paginated on the name.
+    """
+    names = _skill_names_query(db)
+    stmt = select(names.c.name)
+    if cursor is not None:
+        stmt = stmt.where(names.c.name > cursor)
+    items = list(db.execute(stmt.order_by(names.c.name).limit(limit + 1)).scalars())
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = items[-1]
+    return {"items": items, "next_cursor": next_cursor}
 
 
 # -----------------------------------------
-# PROJECT OUTCOMES
+# TALENTS / PROJECTS
 # -----------------------------------------
-@router.post("/projects/{project_id}/outcome")
-def create_outcome(project_id: int, outcome: schemas.ProjectOutcomeCreate, db: Session = Depends(get_db)):
-    project = db.query(models.Project).filter(models.Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+@router.get("/talents", response_model=Page[TalentRead])
+def list_talents(page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return keyset_page(db.query(models.Talent), models.Talent.id, page)
 
-    new_outcome = models.ProjectOutcome(
-        project_id=project_id,
-        is_completed=outcome.is_completed,
-        score=outcome.score,
-        feedback=outcome.feedback
-    )
 
-    db.add(new_outcome)
-    db.commit()
-    db.refresh(new_outcome)
-    return new_outcome
+@router.get("/projects", response_model=Page[ProjectRead])
+def list_projects(page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return keyset_page(db.query(models.Project), models.Project.id, page)
 
 
 def calculate_match_score(talent_skills, project_skills):
-    if not talent_skills:
+    if not talent_skills or not project_skills:
         return 0
-    
-    matches = set([s.name for s in talent_skills]).intersection(
-        set([s.name for s in project_skills])
-    )
+
+    matches = set(talent_skills).intersection(project_skills)
 
     score = (len(matches) / len(project_skills)) * 100
     return round(score, 2)
 
 
 def match_talents_to_project(db: Session, project_id: int):
-    project = db.query(models.Project).filter(models.Project.id == project_id).first()
-    
+    """
+    Score every talent against the project's required skills, best first.
+    Skills are ARRAY columns on the rows themselves, so this is two flat
+    SELECTs of the needed columns (like matching.project_match_page).
+    """
+    project = (
+        db.query(models.Project.required_skills)
+        .filter(models.Project.id == project_id)
+        .first()
+    )
     if not project:
         return None
 
-    talents = db.query(models.Talent).all()
-    results = []
-
-    for t in talents:
-        score = calculate_match_score(
-            talent_skills=t.skills, 
-            project_skills=project.required_skills
-        )
+    required = skill_names(project.required_skills)
+    rows = (
+        db.query(models.Talent.id, models.Talent.full_name, models.Talent.skills)
+        .order_by(models.Talent.id)
+        .all()
+    )
 
+    results = []
+    for row in rows:
+        skills = skill_names(row.skills)
         results.append({
-            "talent_id": t.id,
-            "talent_name": t.user.username,
-            "skills": [s.name for s in t.skills],
-            "match_score": score
+            "talent_id": row.id,
+            "talent_name": row.full_name,
+            "skills": skills,
+            "match_score": calculate_match_score(skills, required)
         })
 
     results.sort(key=lambda x: x["match_score"], reverse=True)
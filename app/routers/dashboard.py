@@ -1,13 +1,12 @@
 from fastapi import APIRouter, Depends
 from datetime import datetime
-from app.auth.rbac import require_roles
-from app.auth.firebase import get_current_user
+from app.security.principal import get_principal, require_roles
 
 router = APIRouter(prefix="/transactions", tags=["Dashboard"])
 
 
 @router.get("/feed", dependencies=[Depends(require_roles(["admin", "owner"]))])
-async def transaction_feed(user=Depends(get_current_user)):
+async def transaction_feed(user=Depends(get_principal)):
     
     # Temporary dummy data — real M-Pesa + Flutterwave next week
     dummy_transactions = [
@@ -1,34 +1,67 @@
-from fastapi import APIRouter, HTTPException, Depends
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import Project, Talent
+from app.security.principal import require_roles
+from app.services.ranking import rank_top_k
+from app.services.sql_matching import sql_overlap_matches
 
-router = APIRouter(prefix="/match", tags=["Matching"])
+# Legacy matcher (returns talent emails): admin only; clients use /v1/match
+router = APIRouter(prefix="/match", tags=["Matching"], dependencies=[Depends(require_roles(["admin"]))])
 
 @router.get("/{project_id}")
-def match_talent(project_id: int, db: Session = Depends(get_db)):
+def match_talent(
+    project_id: int,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    mode: str = Query("python", pattern="^(python|sql)$"),
+    db: Session = Depends(get_db)
+):
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
     required = set(project.required_skills or [])
 
-    talents = db.query(Talent).filter(Talent.profile_completed == True).all()
+    if mode == "sql":
+        # overlap, filtering, ordering and paging all happen in Postgres
+        top = sql_overlap_matches(db, required, limit=limit, offset=offset)
+    else:
+        top = _rank_in_python(db, required, limit, offset)
 
     results = []
-    for t in talents:
-        skill_overlap = len(required.intersection(set(t.skills)))
-        total = len(required) if len(required) > 0 else 1
-        score = skill_overlap / total
-
+    for score, t in top:
         results.append({
             "talent_id": t.id,
             "full_name": t.full_name,
             "email": t.email,
             "skills": t.skills,
-            "score": round(score, 2)
+            "score": score
         })
 
-    results = sorted(results, key=lambda x: x["score"], reverse=True)
-
     return {"project_id": project_id, "matches": results}
+
+
+def _overlap_score(overlap, total):
+    """overlap / total to 2 places, rounded half-up like Postgres NUMERIC round()."""
+    return float((Decimal(overlap) / Decimal(total)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
+
+
+def _rank_in_python(db, required, limit, offset):
+    """
+    Same rows as sql_overlap_matches: completed profiles sharing at least one
+    required skill (none when the project requires nothing), best first.
+    """
+    if not required:
+        return []
+    talents = db.query(Talent).filter(Talent.profile_completed == True).all()
+
+    scored = []
+    for t in talents:
+        skill_overlap = len(required.intersection(set(t.skills or [])))
+        if skill_overlap:
+            scored.append((_overlap_score(skill_overlap, len(required)), t))
+
+    return rank_top_k(scored, score=lambda r: r[0], ident=lambda r: r[1].id, limit=limit, offset=offset)
@@ -1,8 +1,18 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.responses import ORJSONResponse, dumps
+from app.database import get_read_db, reads_primary
 from app.models import Project, Talent
-from typing import Optional
+from app.schemas.matching import MatchResponse
+from app.security.principal import get_current_admin
+from app.services.match_cache import match_cache
+from app.services.ranking import rank_top_k
+from app.services.skill_index import skill_index, skill_names
+from app.services.sql_matching import sql_weighted_matches
+from typing import List, Optional
 
 
 router = APIRouter(prefix="/v1", tags=["Matching"])
@@ -15,42 +25,197 @@ def calculate_skill_match(talent_skills, project_skills):
         return 0.0
     return (len(matches) / len(project_skills)) * 100.0
 
-@router.get("/match/{project_id}")
-def match_talents(
+
+def _match_row(t, talent_skills, skill_score, vetting_score, combined):
+    return {
+        "talent_id": t.id,
+        "name": getattr(t, "full_name", None),
+        "skills": talent_skills,
+        "skill_score": round(skill_score,2),
+        "vetting_score": vetting_score,
+        # ranking uses the exact score; round once, here, for every path
+        "combined_score": round(combined, 2),
+        "location": getattr(t, "location", None)
+    }
+
+
+def _candidate_talents(db, project_skills, location=None):
+    # Only talent sharing at least one required skill can score above zero,
+    # so let the inverted index pick the candidates instead of scanning the table.
+    skill_index.ensure_loaded(db)
+    candidate_ids = skill_index.candidates(project_skills)
+    if not candidate_ids:
+        return []
+
+    talents_q = db.query(Talent).filter(Talent.id.in_(candidate_ids)).order_by(Talent.id)
+    # Same guard as sql_matching: Talent has no location column yet
+    if location and hasattr(Talent, "location"):
+        talents_q = talents_q.filter(Talent.location == location)
+    return talents_q.all()
+
+
+def project_match_page(db, project, limit=None, offset=0):
+    """
+    Skill-match every talent against `project` and return one page of results.
+    Talent is read with a single flattened SELECT of the columns we need, so
+    the statement count stays constant however large the pool is.
+    """
+    required = skill_names(getattr(project, "required_skills", []))
+    rows = (
+        db.query(Talent.id, Talent.full_name, Talent.skills, Talent.experience_years)
+        .order_by(Talent.id)
+        .all()
+    )
+
+    scored = []
+    for row in rows:
+        skills = skill_names(row.skills)
+        scored.append((round(calculate_skill_match(skills, required), 2), row, skills))
+
+    top = rank_top_k(scored, score=lambda r: r[0], ident=lambda r: r[1].id, limit=limit, offset=offset)
+
+    return [
+        {
+            "talent_id": row.id,
+            "name": row.full_name,
+            "match_score": score,
+            "skills": skills,
+            "experience_years": row.experience_years
+        }
+        for score, row, skills in top
+    ]
+
+
+# The match routes are async; the sync query helpers above run on the
+# AsyncSession's connection via db.run_sync, without a threadpool hop.
+# Match rows are built from typed values here, so the route returns an
+# ORJSONResponse: response_model documents the shape, and FastAPI skips
+# re-validating and jsonable_encoder-walking thousands of dicts.
+@router.get("/match/{project_id}", response_model=MatchResponse)
+async def match_talents(
     project_id: int,
     vetting_min: float = Query(0.0, ge=0.0, le=100.0),
     location: Optional[str] = Query(None),
     limit: int = Query(10, ge=1, le=50),
-    db: Session = Depends(get_db)
+    mode: str = Query("python", pattern="^(python|sql)$"),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    project = db.query(Project).filter(Project.id == project_id).first()
+    cache_key = ("v1", project_id, vetting_min, location, limit, mode)
+    cached = match_cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    project_skills = [s.name for s in getattr(project, "required_skills", [])]  # adjust to real model
-    talents_q = db.query(Talent)
-    if location:
-        talents_q = talents_q.filter(Talent.location == location)
-    talents = talents_q.all()
+    project_skills = skill_names(getattr(project, "required_skills", []))
 
-    results = []
-    for t in talents:
-        talent_skills = [s.name for s in getattr(t, "skills", [])]
+    if mode == "sql":
+        rows = await db.run_sync(
+            sql_weighted_matches, project_skills, vetting_min=vetting_min, location=location, limit=limit
+        )
+        result = {"project_id": project_id, "matches": [
+            _match_row(t, skill_names(t.skills), skill_score, vetting_score, combined)
+            for t, skill_score, vetting_score, combined in rows
+        ]}
+        _cache_if_fresh(db, cache_key, result, project_id, project_skills)
+        return ORJSONResponse(result)
+
+    scored = []
+    for t in await db.run_sync(_candidate_talents, project_skills, location):
+        talent_skills = skill_names(getattr(t, "skills", []))
         skill_score = calculate_skill_match(talent_skills, project_skills)  # 0-100
         vetting_score = getattr(t, "vetting_overall_score", 0)  # make sure field exists on Talent
-        # Combine scores: 70% skill match, 30% vetting (simple heuristic)
-        combined = round((0.7 * skill_score) + (0.3 * vetting_score), 2)
         if vetting_score < vetting_min:
             continue
-        results.append({
-            "talent_id": t.id,
-            "name": getattr(t, "full_name", None),
-            "skills": talent_skills,
-            "skill_score": round(skill_score,2),
-            "vetting_score": vetting_score,
-            "combined_score": combined,
-            "location": getattr(t, "location", None)
-        })
-
-    results.sort(key=lambda x: x["combined_score"], reverse=True)
-    return {"project_id": project_id, "matches": results[:limit]}
+        # Combine scores: 70% skill match, 30% vetting (simple heuristic).
+        # Unrounded, like BatchScorer: _match_row rounds for the response.
+        combined = (0.7 * skill_score) + (0.3 * vetting_score)
+        scored.append((combined, t.id, t, talent_skills, skill_score, vetting_score))
+
+    top = rank_top_k(scored, score=lambda r: r[0], ident=lambda r: r[1], limit=limit)
+
+    result = {"project_id": project_id, "matches": [
+        _match_row(t, talent_skills, skill_score, vetting_score, combined)
+        for combined, _, t, talent_skills, skill_score, vetting_score in top
+    ]}
+    _cache_if_fresh(db, cache_key, result, project_id, project_skills)
+    return ORJSONResponse(result)
+
+
+def _cache_if_fresh(db, cache_key, result, project_id, project_skills):
+    # A lagging replica could cache rows from before a write whose
+    # invalidation already ran; only the primary's reads fill the cache.
+    if reads_primary(db):
+        match_cache.set(cache_key, result, project_id, project_skills)
+
+
+@router.get("/match/cache/stats")
+def match_cache_stats(admin: dict = Depends(get_current_admin)):
+    """Hit/miss/eviction counters for sizing MATCH_CACHE_MAX_ENTRIES / TTL."""
+    return match_cache.stats()
+
+
+# -------------------------
+# Batch matching: many projects, one candidate pass
+# -------------------------
+class ProjectMatchSpec(BaseModel):
+    project_id: int
+    limit: int = Field(10, ge=1, le=50)
+
+
+class MatchBatchRequest(BaseModel):
+    projects: List[ProjectMatchSpec] = Field(..., min_length=1, max_length=500)
+    vetting_min: float = Field(0.0, ge=0.0, le=100.0)
+    location: Optional[str] = None
+
+
+@router.post("/match/batch")
+async def match_talents_batch(payload: MatchBatchRequest, db: AsyncSession = Depends(get_read_db)):
+    """
+    Rank talent for many projects at once. Candidates for all requested projects
+    are loaded in a single query and scored with the vectorised BatchScorer;
+    results stream back as NDJSON, one line per project, in request order.
+    """
+    # numpy is only needed here; importing it lazily keeps it off the cold-start path
+    from app.services.batch_scorer import BatchScorer
+
+    project_ids = {spec.project_id for spec in payload.projects}
+    result = await db.execute(select(Project).where(Project.id.in_(project_ids)))
+    projects = {p.id: p for p in result.scalars()}
+    project_skills = {
+        pid: skill_names(getattr(p, "required_skills", [])) for pid, p in projects.items()
+    }
+
+    all_skills = set()
+    for skills in project_skills.values():
+        all_skills.update(skills)
+    talents = await db.run_sync(_candidate_talents, all_skills, payload.location)
+    scorer = BatchScorer.from_talents(talents)
+    eligible = scorer.vetting >= payload.vetting_min
+
+    # Everything the generator needs is loaded now, so the DB session can be
+    # released while the response streams.
+    def generate():
+        for spec in payload.projects:
+            if spec.project_id not in projects:
+                yield dumps({"project_id": spec.project_id, "error": "Project not found"}) + b"\n"
+                continue
+
+            skills = project_skills[spec.project_id]
+            skill, combined = scorer.combined_scores(skills)
+            rows = scorer.top_k(combined, spec.limit, mask=eligible & (skill > 0))
+            matches = []
+            for row in rows:
+                t = talents[row]
+                matches.append(_match_row(
+                    t,
+                    skill_names(getattr(t, "skills", [])),
+                    float(skill[row]),
+                    getattr(t, "vetting_overall_score", 0),
+                    float(combined[row]),
+                ))
+            yield dumps({"project_id": spec.project_id, "matches": matches}) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
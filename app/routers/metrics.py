@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends
+
+from app import database
+from app.core.security import password_hasher
+from app.security.principal import get_current_admin, role_cache
+from app.security.firebase import public_keys, token_cache
+from app.services.pool_metrics import pool_stats
+
+router = APIRouter(prefix="/admin/metrics", tags=["Metrics"])
+
+
+@router.get("/token-cache")
+def token_cache_stats(admin: dict = Depends(get_current_admin)):
+    """Verified-token cache size and hit rate."""
+    return token_cache.stats()
+
+
+@router.get("/token-keys")
+def token_keys_stats(admin: dict = Depends(get_current_admin)):
+    """Cached token signing keys and their refresh state."""
+    return public_keys.stats()
+
+
+@router.get("/password-hasher")
+def password_hasher_stats(admin: dict = Depends(get_current_admin)):
+    """Hashing pool size, in-flight work and fast-fail count."""
+    return password_hasher.stats()
+
+
+@router.get("/role-cache")
+def role_cache_stats(admin: dict = Depends(get_current_admin)):
+    """Principal role lookups served from cache vs the users table."""
+    return role_cache.stats()
+
+
+@router.get("/db-pool")
+def db_pool_stats(admin: dict = Depends(get_current_admin)):
+    """Checkouts, overflow, timeouts and checkout wait times per engine pool."""
+    return pool_stats()
+
+
+@router.get("/replicas")
+def replica_stats(admin: dict = Depends(get_current_admin)):
+    """Reads per replica/primary, replicas currently skipped, failovers."""
+    return database.replica_set.stats()
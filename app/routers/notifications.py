@@ -1,21 +1,24 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models.notification import Notification
-from app.security.auth import get_current_user
+from app.security.principal import require_async_registered_user
+from app.services.pagination import PageParams, async_keyset_page
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
 
 @router.get("/")
-def list_notifications(user=Depends(get_current_user), db: Session = Depends(get_db)):
-    return db.query(Notification).filter(Notification.user_id == user.id).all()
+async def list_notifications(page: PageParams = Depends(), user=Depends(require_async_registered_user), db: AsyncSession = Depends(get_async_db)):
+    stmt = select(Notification).where(Notification.user_id == user.id)
+    return await async_keyset_page(db, stmt, Notification.id, page)
 
 
 @router.post("/")
-def send_notification(message: str, user=Depends(get_current_user), db: Session = Depends(get_db)):
+async def send_notification(message: str, user=Depends(require_async_registered_user), db: AsyncSession = Depends(get_async_db)):
     notif = Notification(user_id=user.id, message=message)
     db.add(notif)
-    db.commit()
-    db.refresh(notif)
+    await db.commit()
+    await db.refresh(notif)
     return notif
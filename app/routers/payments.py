@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-from app.auth.dependencies import get_current_user
-from app.auth.rbac import require_roles
+from app.security.principal import get_principal, require_roles
 from app.services.mpesa import initiate_mpesa_payment, handle_mpesa_callback
 from app.services.flutterwave import initiate_flutterwave_payment, handle_flutterwave_callback
 
@@ -27,7 +26,7 @@ class FlutterwaveRequest(BaseModel):
     "/mpesa/initiate",
     dependencies=[Depends(require_roles(["admin", "owner", "client"]))]
 )
-def mpesa_initiate(data: MpesaRequest, user=Depends(get_current_user)):
+def mpesa_initiate(data: MpesaRequest, user=Depends(get_principal)):
     return initiate_mpesa_payment(amount=data.amount, phone=data.phone)
 
 
@@ -46,7 +45,7 @@ def mpesa_callback(data: dict):
     "/flutterwave/status",
     dependencies=[Depends(require_roles(["admin", "owner", "client"]))]
 )
-def flutterwave_initiate(data: FlutterwaveRequest, user=Depends(get_current_user)):
+def flutterwave_initiate(data: FlutterwaveRequest, user=Depends(get_principal)):
     return initiate_flutterwave_payment(amount=data.amount, email=data.email)
 
 
@@ -4,7 +4,7 @@ from app.database import get_db
 from app.models import Project, ProjectOutcome, AuditLog
 from pydantic import BaseModel, condecimal, conint, confloat
 from typing import Optional
-from app.security.roles import requires_role
+from app.security.principal import require_roles
 
 router = APIRouter(prefix="/v1", tags=["ProjectOutcome"])
 
@@ -17,7 +17,7 @@ class OutcomeCreate(BaseModel):
     retention_rate: Optional[confloat(ge=0, le=1)]
 
 @router.post("/projects/{project_id}/outcomes", status_code=201)
-def create_outcome(project_id: int, payload: OutcomeCreate, db: Session = Depends(get_db), user=Depends(requires_role("client"))):
+def create_outcome(project_id: int, payload: OutcomeCreate, db: Session = Depends(get_db), user=Depends(require_roles(["client"]))):
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
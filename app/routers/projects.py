@@ -1,14 +1,20 @@
 # app/routers/project.py
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.project import Project
+from app.schemas.pagination import Page
 from app.schemas.project import ProjectCreate, ProjectRead, ProjectUpdate
+from app.services.http_cache import REVALIDATE_CACHE_CONTROL, conditional_response, row_etag
+from app.services.match_cache import match_cache
+from app.services.pagination import PageParams, async_keyset_page
+
+from app.security.principal import get_current_admin, get_principal
 
-from app.security.admin_utils import get_current_user, get_current_admin
-from app.auth.firebase import get_current_user
 router = APIRouter(prefix="/project", tags=["Project"])
 
 
@@ -17,7 +23,7 @@ router = APIRouter(prefix="/project", tags=["Project"])
 def create_project(
     payload: ProjectCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = Depends(get_principal),
 ):
     """
     Allow authenticated 'user' creators, or admin to create projects.
@@ -39,21 +45,31 @@ def create_project(
 
 
 # --- LIST PROJECTS (public read) ---
-@router.get("/", response_model=List[ProjectRead])
-def list_projects(db: Session = Depends(get_db)):
+@router.get("/", response_model=Page[ProjectRead])
+async def list_projects(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_read_db),
+):
     """
-    Public listing of projects. If you want only authenticated listing, add Depends(get_current_user).
+    Public listing of projects. If you want only authenticated listing, add Depends(get_principal).
+    Keyset-paginated: pass `next_cursor` back as `cursor` to get the next page.
     """
-    return db.query(Project).all()
+    result = await async_keyset_page(db, select(Project), Project.id, page)
+    etag = row_etag(*result["items"], extra=(result["next_cursor"],))
+    return conditional_response(request, response, etag, REVALIDATE_CACHE_CONTROL) or result
 
 
 # --- GET PROJECT (public read) ---
 @router.get("/{project_id}", response_model=ProjectRead)
-def get_project(project_id: int, db: Session = Depends(get_db)):
-    project = db.get(Project, project_id)
+async def get_project(
+    project_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_read_db)
+):
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    return conditional_response(request, response, row_etag(project)) or project
 
 
 # --- UPDATE PROJECT (owner OR admin) ---
@@ -62,7 +78,7 @@ def update_project(
     project_id: int,
     payload: ProjectUpdate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = Depends(get_principal),
 ):
     project = db.get(Project, project_id)
     if not project:
@@ -71,9 +87,6 @@ def update_project(
     role = current_user.get("role")
     user_email = current_user.get("email")
     user_uid = current_user.get("uid")
-@router.get("/projects")
-def list_projects(current_user = Depends(get_current_user)):
-    return {"msg": "Projects visible", "role": current_user.role}
 
     # Ownership check: if your Project has owner_email or owner_uid fields use them
     is_owner = False
@@ -89,11 +102,14 @@ def list_projects(current_user = Depends(get_current_user)):
     if not (is_owner or role == "admin"):
         raise HTTPException(status_code=403, detail="Only project owner or admin can update this project")
 
-    for field, value in payload.model_dump(exclude_unset=True).items():
+    changes = payload.model_dump(exclude_unset=True)
+    for field, value in changes.items():
         setattr(project, field, value)
 
     db.commit()
     db.refresh(project)
+    if "required_skills" in changes:
+        match_cache.invalidate_project(project_id)
     return project
 
 
@@ -102,7 +118,7 @@ def list_projects(current_user = Depends(get_current_user)):
 def delete_project(
     project_id: int,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = Depends(get_principal),
 ):
     project = db.get(Project, project_id)
     if not project:
@@ -126,4 +142,5 @@ def delete_project(
 
     db.delete(project)
     db.commit()
+    match_cache.invalidate_project(project_id)
     return None
@@ -0,0 +1,76 @@
+"""
+Every router the API serves, listed once. main.py mounts them through
+include_routers(), which refuses to register the same path+method twice:
+Starlette matches routes by scanning the table in order, so a duplicate is
+dead weight on every request (and a silent shadowing bug if the handlers
+differ).
+"""
+from app.routers.admin import router as admin_router
+from app.routers.auth import router as auth_router
+from app.routers.changes import router as changes_router
+from app.routers.crud import router as crud_router
+from app.routers.dashboard import router as dashboard_router
+from app.routers.match import router as legacy_match_router
+from app.routers.matching import router as matching_router
+from app.routers.metrics import router as metrics_router
+from app.routers.notifications import router as notifications_router
+from app.routers.outcomes import router as legacy_outcome_router
+from app.routers.payments import router as payments_router
+from app.routers.project_outcomes import router as outcome_router
+from app.routers.projects import router as project_router
+from app.routers.talent import router as talent_router
+from app.routers.upload import router as upload_router
+
+ROUTERS = (
+    talent_router,
+    project_router,
+    outcome_router,
+    matching_router,
+    auth_router,
+    dashboard_router,
+    payments_router,
+    metrics_router,
+    changes_router,
+    admin_router,
+    notifications_router,
+    crud_router,
+    legacy_match_router,
+    legacy_outcome_router,
+    upload_router,
+)
+
+
+class DuplicateRouteError(RuntimeError):
+    pass
+
+
+def route_keys(routes):
+    """(METHOD, path) for each route; routes without methods (mounts, websockets) count as '*'."""
+    for route in routes:
+        path = getattr(route, "path", None)
+        if path is None:
+            continue
+        for method in sorted(getattr(route, "methods", None) or {"*"}):
+            yield method, path
+
+
+def include_routers(app, routers=ROUTERS):
+    """Mount each router once; raise DuplicateRouteError on a repeated path+method."""
+    # Remembered on the app so a second call can't re-mount what the first did
+    seen = getattr(app.state, "route_owners", None)
+    if seen is None:
+        seen = app.state.route_owners = {key: "app" for key in route_keys(app.routes)}
+    for router in routers:
+        keys = list(route_keys(router.routes))
+        for key in keys:
+            if key in seen:
+                raise DuplicateRouteError(
+                    f"{key[0]} {key[1]} is registered by both {seen[key]} and {_label(router)}"
+                )
+            seen[key] = _label(router)
+        app.include_router(router)
+    return app
+
+
+def _label(router):
+    return router.prefix or ", ".join(router.tags) or repr(router)
@@ -1,14 +1,20 @@
 # app/routers/talent.py
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_async_db, get_db, get_read_db
 from app.models.talent import Talent
+from app.schemas.pagination import Page
 from app.schemas.talent import TalentCreate, TalentRead, TalentUpdate
+from app.services.http_cache import conditional_response, row_etag
+from app.services.match_cache import match_cache
+from app.services.pagination import PageParams, async_keyset_page
+from app.services.skill_index import skill_index
 
-# Auth helpers (admin_utils exposes get_current_user and get_current_admin)
-from app.security.admin_utils import get_current_user, get_current_admin
+from app.security.principal import get_async_current_admin, get_principal
 
 router = APIRouter(prefix="/talent", tags=["Talent"])
 
@@ -18,7 +24,7 @@ router = APIRouter(prefix="/talent", tags=["Talent"])
 def create_talent(
     payload: TalentCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = Depends(get_principal),
 ):
     """
     Create a talent profile. Allowed for authenticated users (role 'user') and admin.
@@ -44,29 +50,35 @@ def create_talent(
     db.add(talent)
     db.commit()
     db.refresh(talent)
+    skill_index.upsert(talent.id, talent.skills)
+    match_cache.invalidate_talent(talent.skills)
     return talent
 
 
 # --- LIST ALL TALENT (admin only) ---
-@router.get("/", response_model=List[TalentRead])
-def list_talent(
-    db: Session = Depends(get_db),
-    admin: dict = Depends(get_current_admin),
+@router.get("/", response_model=Page[TalentRead])
+async def list_talent(
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    admin: dict = Depends(get_async_current_admin),
 ):
-    return db.query(Talent).all()
+    return await async_keyset_page(db, select(Talent), Talent.id, page)
 
 
 # --- GET TALENT (public read) ---
 @router.get("/{talent_id}", response_model=TalentRead)
-def get_talent(talent_id: int, db: Session = Depends(get_db)):
+async def get_talent(
+    talent_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_read_db)
+):
     """
     Public endpoint to view talent profiles (per spec, these are public).
-    If you want them restricted, swap to Depends(get_current_user) and adjust.
+    If you want them restricted, swap to Depends(get_principal) and adjust.
+    Cacheable by CDNs; If-None-Match with the current ETag gets a bodyless 304.
     """
-    talent = db.get(Talent, talent_id)
+    talent = await db.get(Talent, talent_id)
     if not talent:
         raise HTTPException(status_code=404, detail="Talent not found")
-    return talent
+    return conditional_response(request, response, row_etag(talent)) or talent
 
 
 # --- UPDATE: owner (talent) OR admin ---
@@ -75,7 +87,7 @@ def update_talent(
     talent_id: int,
     payload: TalentUpdate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = Depends(get_principal),
 ):
     talent = db.get(Talent, talent_id)
     if not talent:
@@ -96,11 +108,14 @@ def update_talent(
     if not (is_owner or role == "admin"):
         raise HTTPException(status_code=403, detail="Not authorized to update this talent")
 
+    old_skills = list(talent.skills or [])
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(talent, field, value)
 
     db.commit()
     db.refresh(talent)
+    skill_index.upsert(talent.id, talent.skills)
+    match_cache.invalidate_talent(old_skills, talent.skills)
     return talent
 
 
@@ -109,7 +124,7 @@ def update_talent(
 def delete_talent(
     talent_id: int,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = Depends(get_principal),
 ):
     talent = db.get(Talent, talent_id)
     if not talent:
@@ -129,8 +144,11 @@ def delete_talent(
     if not (is_owner or role == "admin"):
         raise HTTPException(status_code=403, detail="Not authorized to delete this talent")
 
+    old_skills = list(talent.skills or [])
     db.delete(talent)
     db.commit()
+    skill_index.remove(talent_id)
+    match_cache.invalidate_talent(old_skills)
     return None
 @router.get("/talents")
 def list_talents(
@@ -1,12 +1,22 @@
+import os
 import shutil
-from fastapi import APIRouter, UploadFile, File
+import uuid
+from fastapi import APIRouter, Depends, UploadFile, File
+
+from app.security.principal import get_principal
+
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
 
 router = APIRouter(prefix="/upload", tags=["Upload"])
 
 
 @router.post("/")
-def upload_file(file: UploadFile = File(...)):
-    filepath = f"uploads/{file.filename}"
+def upload_file(file: UploadFile = File(...), user=Depends(get_principal)):
+    # never trust the client's filename as a path: keep only its base name,
+    # prefixed so two uploads of "cv.pdf" don't overwrite each other
+    name = f"{uuid.uuid4().hex}-{os.path.basename(file.filename or 'upload')}"
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    filepath = os.path.join(UPLOAD_DIR, name)
     with open(filepath, "wb") as buffer:
         shutil.copyfileobj(file.file, buffer)
     return {"file_path": filepath}
@@ -6,3 +6,6 @@ from .project_outcome import (
     ProjectOutcomeUpdate,
     ProjectOutcomeRead
 )
+from .pagination import Page
+from .matching import MatchRow, MatchResponse, ProjectMatchRow, ProjectMatchResponse
+from .changes import ChangeFeed
@@ -0,0 +1,13 @@
+from typing import List
+from pydantic import BaseModel
+
+from .project import ProjectRead
+from .talent import TalentRead
+
+
+class ChangeFeed(BaseModel):
+    talent: List[TalentRead]
+    projects: List[ProjectRead]
+    # pass back as `since` to continue; unchanged when nothing new
+    next_since: int
+    has_more: bool
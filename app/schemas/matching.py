@@ -0,0 +1,30 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class MatchRow(BaseModel):
+    talent_id: int
+    name: Optional[str] = None
+    skills: List[str] = []
+    skill_score: float
+    vetting_score: float
+    combined_score: float
+    location: Optional[str] = None
+
+
+class MatchResponse(BaseModel):
+    project_id: int
+    matches: List[MatchRow]
+
+
+class ProjectMatchRow(BaseModel):
+    talent_id: int
+    name: Optional[str] = None
+    match_score: float
+    skills: List[str] = []
+    experience_years: Optional[int] = None
+
+
+class ProjectMatchResponse(BaseModel):
+    project_id: int
+    matches: List[ProjectMatchRow]
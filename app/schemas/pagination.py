@@ -0,0 +1,15 @@
+from typing import Generic, List, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[int] = None
+
+
+class NamePage(BaseModel):
+    """Page of names, keyed on the name itself (pass next_cursor back as cursor)."""
+    items: List[str]
+    next_cursor: Optional[str] = None
@@ -1,10 +1,12 @@
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 from pydantic import BaseModel, ConfigDict
 
 class ProjectBase(BaseModel):
     title: str
     description: Optional[str] = None
     technical_brief: Optional[str] = None
+    required_skills: Optional[List[str]] = []
     expected_duration_days: Optional[int] = None
     time_to_match_days: Optional[int] = None
     days_of_trial_and_error: Optional[int] = None
@@ -19,6 +21,7 @@ class ProjectUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     technical_brief: Optional[str] = None
+    required_skills: Optional[List[str]] = None
     expected_duration_days: Optional[int] = None
     time_to_match_days: Optional[int] = None
     days_of_trial_and_error: Optional[int] = None
@@ -27,5 +30,7 @@ class ProjectUpdate(BaseModel):
 
 class ProjectRead(ProjectBase):
     id: int
+    version: Optional[int] = None
+    updated_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel, EmailStr, ConfigDict
 
@@ -24,6 +25,8 @@ class TalentUpdate(BaseModel):
 
 class TalentRead(TalentBase):
     id: int
+    version: Optional[int] = None
+    updated_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
 from pydantic import BaseModel
@@ -1,17 +1,27 @@
+from typing import Literal
+
 from pydantic import BaseModel, EmailStr
 
+# Every role some route checks (require_roles / role comparisons); anything
+# else would lock the user out of all of them
+Role = Literal["admin", "owner", "client", "talent", "user"]
+
 class UserBase(BaseModel):
     full_name: str
     email: EmailStr
 
 class UserCreate(UserBase):
+    # no `role`: self-registration is always "client"; roles change only via
+    # the admin PATCH /admin/users/{id}/role
     password: str
-    role: str = "client"
 
 class UserLogin(BaseModel):
     email: EmailStr
     password: str
 
+class UserRoleUpdate(BaseModel):
+    role: Role
+
 class UserResponse(UserBase):
     id: int
     role: str
@@ -3,6 +3,7 @@ from fastapi import Depends, HTTPException, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from typing import Optional, Callable
 from app.security.firebase import verify_id_token
+from app.security.principal import Principal, get_principal
 from pydantic import BaseModel
 
 bearer_scheme = HTTPBearer(auto_error=False)
@@ -34,18 +35,18 @@ def get_current_token(token: str = Depends(get_token_from_header)) -> dict:
 
     return decoded
 
-def get_current_user(decoded_token: dict = Depends(get_current_token)) -> CurrentUser:
+def get_current_user(principal: Principal = Depends(get_principal)) -> CurrentUser:
     """
-    Builds a CurrentUser object from decoded token claims.
-    We expect custom claims to include 'role' and optionally 'mfa' flags.
+    CurrentUser view of the shared principal (token decoded once per request,
+    role resolved through the cached users lookup).
     """
-    uid = decoded_token.get("uid")
-    email = decoded_token.get("email")
-    # Custom claims are at top-level of decoded_token (set via Admin SDK)
-    role = decoded_token.get("role") or decoded_token.get("roles")  # support either
-    mfa_flag = decoded_token.get("mfa")  # boolean custom claim if you set it
-
-    return CurrentUser(uid=uid, email=email, role=role, mfa=bool(mfa_flag), raw_claims=decoded_token)
+    return CurrentUser(
+        uid=principal.uid,
+        email=principal.email,
+        role=principal.role,
+        mfa=bool(principal.claims.get("mfa")),
+        raw_claims=principal.claims,
+    )
 
 def require_role(required_role: str):
     """
@@ -1,21 +1,137 @@
+import hashlib
 import os
-import firebase_admin
-from firebase_admin import auth, credentials
+import threading
+import time
+from collections import OrderedDict
+
+from app.security.keyset import FIREBASE_CERTS_URL, PublicKeySet, verify_firebase_id_token
 
 # Path to service account JSON
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-SERVICE_ACCOUNT = os.path.join(BASE_DIR, "serviceAccountKey.json")
+SERVICE_ACCOUNT = os.getenv("FIREBASE_SERVICE_ACCOUNT", os.path.join(BASE_DIR, "serviceAccountKey.json"))
+
+TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000"))
+
+# When set, ID tokens are verified offline against locally cached signing keys
+# instead of through the Admin SDK.
+FIREBASE_PROJECT_ID = os.getenv("FIREBASE_PROJECT_ID")
+FIREBASE_CERTS_URL = os.getenv("FIREBASE_CERTS_URL", FIREBASE_CERTS_URL)
+
+_init_lock = threading.Lock()
 
-# --- Initialize Firebase (only once) ---
+
+# --- Initialize Firebase (lazily, once per process) ---
 def init_firebase():
+    """
+    Import and initialize the Admin SDK on first use rather than at import or
+    startup, so cold starts don't pay for it (and workers that only see
+    offline-verifiable tokens never do). Returns firebase_admin.auth.
+    """
+    import firebase_admin
+    from firebase_admin import auth, credentials
+
     if not firebase_admin._apps:
-        cred = credentials.Certificate(SERVICE_ACCOUNT)
-        firebase_admin.initialize_app(cred)
+        with _init_lock:
+            if not firebase_admin._apps:
+                firebase_admin.initialize_app(credentials.Certificate(SERVICE_ACCOUNT))
+    return auth
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified ID token -> decoded claims, so repeat requests with
+    the same token skip RSA signature verification. Keyed by a SHA-256 of the
+    token (raw tokens are never kept) and each entry expires at the token's
+    own `exp`, so a cached token is never accepted past its lifetime.
+    """
+
+    def __init__(self, max_entries=TOKEN_CACHE_MAX_ENTRIES, clock=time.time):
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token):
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token):
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self.clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+
+    def put(self, token, claims):
+        exp = claims.get("exp")
+        if not exp:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (float(exp), dict(claims))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+token_cache = VerifiedTokenCache()
+public_keys = PublicKeySet(FIREBASE_CERTS_URL)
+
+
+def prefetch_public_keys():
+    """Startup hook: load the signing keys in the background before the first token arrives."""
+    if FIREBASE_PROJECT_ID:
+        public_keys.start()
+
 
 # --- Token verification ---
-def verify_firebase_token(token: str):
-    if not firebase_admin._apps:
-        init_firebase()
+def verify_id_token(token: str, check_revoked: bool = False):
+    """
+    Verify a Firebase ID token, serving repeat tokens from token_cache.
+    With FIREBASE_PROJECT_ID set, new tokens are checked offline against
+    public_keys. Revocation checks always go to Firebase (they need a fresh
+    lookup anyway).
+    """
+    if not check_revoked:
+        cached = token_cache.get(token)
+        if cached is not None:
+            return cached
+
+    if FIREBASE_PROJECT_ID and not check_revoked:
+        public_keys.ensure_loaded()
+        decoded = verify_firebase_id_token(token, FIREBASE_PROJECT_ID, public_keys)
+        token_cache.put(token, decoded)
+        return decoded
 
-    decoded = auth.verify_id_token(token)
+    decoded = init_firebase().verify_id_token(token, check_revoked=check_revoked)
+    token_cache.put(token, decoded)
     return decoded
+
+
+def verify_firebase_token(token: str):
+    return verify_id_token(token)
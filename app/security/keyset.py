@@ -0,0 +1,176 @@
+import json
+import logging
+import re
+import threading
+import time
+import urllib.request
+
+from jose import jwk, jwt
+
+logger = logging.getLogger("somahorse-backend")
+
+# x509 certs Google signs Firebase ID tokens with: {"<kid>": "<PEM cert>", ...}
+FIREBASE_CERTS_URL = (
+    "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+)
+
+DEFAULT_MAX_AGE = 3600
+MIN_RETRY_SECONDS = 5
+# An unknown `kid` triggers an early refresh at most this often, so tokens
+# with made-up key ids can't turn into one cert fetch per request
+MIN_KID_REFRESH_SECONDS = 60
+
+
+def _max_age(cache_control, default=DEFAULT_MAX_AGE):
+    match = re.search(r"max-age=(\d+)", cache_control or "")
+    return int(match.group(1)) if match else default
+
+
+def fetch_certs(url, timeout=5):
+    """GET the key set. Returns ({kid: pem}, max_age_seconds)."""
+    with urllib.request.urlopen(url, timeout=timeout) as resp:
+        certs = json.loads(resp.read().decode())
+        return certs, _max_age(resp.headers.get("Cache-Control"))
+
+
+class PublicKeySet:
+    """
+    In-memory copy of the token signing keys, loaded and refreshed by a
+    background thread (started at app startup) shortly before the
+    Cache-Control max-age runs out. Request handlers never fetch: they read
+    `self.keys`, and on a cold start wait for the refresher's first load. If
+    a refresh fails the old keys are kept and the fetch is retried with backoff.
+    """
+
+    def __init__(self, url=FIREBASE_CERTS_URL, fetch=fetch_certs, refresh_margin=0.1, clock=time.time,
+                 load_timeout=10):
+        self.url = url
+        self.fetch = fetch
+        # refresh when this fraction of max-age is left
+        self.refresh_margin = refresh_margin
+        self.clock = clock
+        # how long a request waits for the first load before failing verification
+        self.load_timeout = load_timeout
+        self.keys = {}
+        self.expires_at = 0.0
+        self.max_age = 0
+        self.refreshes = 0
+        self.failures = 0
+        self.last_attempt = float("-inf")
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._loaded = threading.Event()
+        self._thread = None
+
+    def refresh(self):
+        self.last_attempt = self.clock()
+        certs, max_age = self.fetch(self.url)
+        keys = {kid: jwk.construct(pem, "RS256") for kid, pem in certs.items()}
+        with self._lock:
+            self.keys = keys
+            self.expires_at = self.clock() + max_age
+            self.max_age = max_age
+            self.refreshes += 1
+        self._loaded.set()
+        return max_age
+
+    def ensure_loaded(self):
+        """
+        Start the refresher if needed and, on a cold start, wait (up to
+        `load_timeout`) for its first load. Never fetches on the caller's thread.
+        """
+        if self.keys:
+            return
+        self.start()
+        self._loaded.wait(self.load_timeout)
+
+    def get(self, kid):
+        key = self.keys.get(kid)
+        if key is None and self.clock() - self.last_attempt >= MIN_KID_REFRESH_SECONDS:
+            # possibly a rotation we haven't seen: refresh in the background
+            self._wake.set()
+        return key
+
+    # -------------------------
+    # Background refresh
+    # -------------------------
+    def start(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="firebase-keyset-refresh", daemon=True)
+            self._thread.start()
+
+    def _next_delay(self):
+        if not self.keys:
+            return 0
+        refresh_at = self.expires_at - self.max_age * self.refresh_margin
+        return max(MIN_RETRY_SECONDS, refresh_at - self.clock())
+
+    def stats(self):
+        return {
+            "keys": len(self.keys),
+            "expires_in": max(0, round(self.expires_at - self.clock(), 1)),
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+        }
+
+    def _run(self):
+        backoff = MIN_RETRY_SECONDS
+        while True:
+            self._wake.wait(self._next_delay())
+            self._wake.clear()
+            try:
+                self.refresh()
+                backoff = MIN_RETRY_SECONDS
+            except Exception as e:
+                self.failures += 1
+                logger.warning("Firebase key refresh failed, keeping %d cached keys: %s", len(self.keys), e)
+                # a kid-miss wake must not cut the backoff short
+                time.sleep(backoff)
+                self._wake.clear()
+                backoff = min(backoff * 2, 300)
+
+
+class TokenVerificationError(Exception):
+    pass
+
+
+def verify_firebase_id_token(token, project_id, keyset):
+    """
+    Verify a Firebase ID token against locally cached keys: RS256 signature,
+    exp/iat, aud == project id, iss == securetoken issuer, non-empty sub.
+    Returns the claims with `uid` set, like firebase_admin.auth.verify_id_token.
+    """
+    try:
+        header = jwt.get_unverified_header(token)
+    except Exception as e:
+        raise TokenVerificationError(f"Malformed token: {e}")
+    if header.get("alg") != "RS256":
+        raise TokenVerificationError("Token must be signed with RS256")
+
+    key = keyset.get(header.get("kid"))
+    if key is None:
+        raise TokenVerificationError("Token signed with an unknown key id")
+
+    try:
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=["RS256"],
+            audience=project_id,
+            issuer=f"https://securetoken.google.com/{project_id}",
+        )
+    except Exception as e:
+        raise TokenVerificationError(str(e))
+
+    sub = claims.get("sub")
+    if not isinstance(sub, str) or not sub or len(sub) > 128:
+        raise TokenVerificationError("Token has an invalid subject")
+    if claims.get("iat", 0) > time.time() + 60:
+        raise TokenVerificationError("Token issued in the future")
+
+    claims["uid"] = sub
+    return claims
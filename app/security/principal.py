@@ -0,0 +1,267 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from jose import jwt
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.jwt import ALGORITHM, SECRET_KEY
+from app.database import get_async_db, get_db
+from app.models.user import User
+from app.security.firebase import verify_id_token
+
+PRINCIPAL_ROLE_TTL_SECONDS = float(os.getenv("PRINCIPAL_ROLE_TTL_SECONDS", "30"))
+PRINCIPAL_ROLE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_ROLE_MAX_ENTRIES", "10000"))
+
+
+@dataclass
+class Principal:
+    """
+    The authenticated caller. Supports attribute access (`user.role`) and the
+    dict-style access (`user.get("role")`, `user["uid"]`) older routes use.
+    """
+    uid: Optional[str]
+    email: Optional[str]
+    role: Optional[str]
+    user_id: Optional[int] = None  # users.id, when the caller is registered
+    claims: dict = field(default_factory=dict)
+
+    @property
+    def id(self):
+        return self.user_id
+
+    @property
+    def is_admin(self):
+        return self.has_role("admin")
+
+    def has_role(self, *roles):
+        if isinstance(self.role, (list, tuple, set)):
+            return any(r in self.role for r in roles)
+        return self.role in roles
+
+    def get(self, key, default=None):
+        if key in ("uid", "email", "role", "id"):
+            value = getattr(self, key)
+            return default if value is None else value
+        return self.claims.get(key, default)
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+
+_MISSING = object()
+
+
+class RoleCache:
+    """
+    TTL + LRU cache of email -> (user id, role), so resolving the caller's
+    role doesn't cost a users query per request. Unregistered emails are
+    cached too (as None). Call `invalidate(email)` whenever a role changes.
+    """
+
+    def __init__(self, ttl_seconds=PRINCIPAL_ROLE_TTL_SECONDS, max_entries=PRINCIPAL_ROLE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, email):
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None or entry[0] <= time.monotonic():
+                self._entries.pop(email, None)
+                self.misses += 1
+                return _MISSING
+            self._entries.move_to_end(email)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, email, value):
+        with self._lock:
+            self._entries[email] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(email)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, email):
+        with self._lock:
+            self._entries.pop(email, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+role_cache = RoleCache()
+
+
+def decode_bearer(authorization):
+    """
+    Verify the bearer token once: our own HS256 tokens (from /auth/login)
+    locally, anything else as a Firebase ID token.
+    """
+    if not authorization or not authorization.lower().startswith("bearer "):
+        raise HTTPException(status_code=401, detail="Missing or invalid Authorization header")
+    token = authorization.split(" ", 1)[1]
+
+    try:
+        if jwt.get_unverified_header(token).get("alg") == ALGORITHM:
+            return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        return verify_id_token(token)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=401, detail=f"Invalid token: {e}")
+
+
+def _registered_user(db: Session, email):
+    cached = role_cache.get(email)
+    if cached is not _MISSING:
+        return cached
+    row = db.query(User.id, User.role).filter(User.email == email).first()
+    value = (row.id, row.role) if row else None
+    role_cache.put(email, value)
+    return value
+
+
+async def _async_registered_user(db: AsyncSession, email):
+    cached = role_cache.get(email)
+    if cached is not _MISSING:
+        return cached
+    row = (await db.execute(select(User.id, User.role).where(User.email == email))).first()
+    value = (row.id, row.role) if row else None
+    role_cache.put(email, value)
+    return value
+
+
+def _email_is_trusted(claims):
+    """
+    Whether the token's email may be mapped to a users row (and its role).
+    Our own tokens are issued by /auth/login for that email; a Firebase token
+    only counts once Firebase has verified the address, otherwise anyone
+    could sign up with an admin's email and inherit the role.
+    """
+    if "firebase" in claims or "email" in claims:
+        return bool(claims.get("email")) and claims.get("email_verified") is True
+    return bool(claims.get("sub"))
+
+
+def get_principal(request: Request, db: Session = Depends(get_db)) -> Principal:
+    """
+    The one auth dependency: verifies the token, resolves the role (DB role
+    for registered users, else the token's `role` claim) and memoises the
+    result on request.state so it is resolved once per request.
+    """
+    principal = getattr(request.state, "principal", None)
+    if principal is not None:
+        return principal
+
+    claims = decode_bearer(request.headers.get("Authorization"))
+    email = _claims_email(claims)
+    registered = _registered_user(db, email) if _email_is_trusted(claims) else None
+    return _remember_principal(request, claims, registered)
+
+
+async def get_async_principal(request: Request, db: AsyncSession = Depends(get_async_db)) -> Principal:
+    """
+    get_principal for `async def` routes: the same resolution and per-request
+    memo, with the role lookup on the async engine so the route never waits
+    on the sync pool/threadpool just to authenticate.
+    """
+    principal = getattr(request.state, "principal", None)
+    if principal is not None:
+        return principal
+
+    authorization = request.headers.get("Authorization")
+    if _is_local_token(authorization):
+        claims = decode_bearer(authorization)
+    else:
+        # Firebase verification can wait on a key load or the Admin SDK; keep it off the event loop
+        claims = await run_in_threadpool(decode_bearer, authorization)
+    email = _claims_email(claims)
+    registered = await _async_registered_user(db, email) if _email_is_trusted(claims) else None
+    return _remember_principal(request, claims, registered)
+
+
+def _is_local_token(authorization):
+    """True for our own HS256 tokens (or a malformed header), which decode_bearer handles without I/O."""
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return True
+    try:
+        return jwt.get_unverified_header(authorization.split(" ", 1)[1]).get("alg") == ALGORITHM
+    except Exception:
+        return True
+
+
+def _claims_email(claims):
+    # Firebase tokens carry `email`; ours carry the email as `sub`
+    return claims.get("email") or claims.get("sub")
+
+
+def _remember_principal(request, claims, registered):
+    if registered:
+        user_id, role = registered
+    else:
+        user_id, role = claims.get("user_id"), claims.get("role") or claims.get("roles")
+
+    uid = claims.get("uid") or claims.get("sub")
+    principal = Principal(uid=uid, email=_claims_email(claims), role=role, user_id=user_id, claims=claims)
+    request.state.principal = principal
+    return principal
+
+
+def require_roles(allowed_roles):
+    def role_checker(user: Principal = Depends(get_principal)):
+        if not user.has_role(*allowed_roles):
+            raise HTTPException(status_code=403, detail="User does not have the required role")
+        return user
+
+    return role_checker
+
+
+def get_current_admin(user: Principal = Depends(get_principal)):
+    if not user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access only")
+    return user
+
+
+def get_async_current_admin(user: Principal = Depends(get_async_principal)):
+    if not user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access only")
+    return user
+
+
+def require_registered_user(user: Principal = Depends(get_principal)):
+    """For routes keyed on users.id."""
+    if user.user_id is None:
+        raise HTTPException(status_code=403, detail="User not found or unauthorized")
+    return user
+
+
+def require_async_registered_user(user: Principal = Depends(get_async_principal)):
+    """require_registered_user for `async def` routes."""
+    if user.user_id is None:
+        raise HTTPException(status_code=403, detail="User not found or unauthorized")
+    return user
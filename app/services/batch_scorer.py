@@ -0,0 +1,108 @@
+import numpy as np
+
+from app.services.skill_index import skill_names
+
+
+class SkillVocabulary:
+    """Maps skill names to dense integer ids (0..n-1)."""
+
+    def __init__(self):
+        self.ids = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def encode(self, skills, grow=True):
+        """Sorted, de-duplicated ids for `skills`. Unknown names are skipped unless grow=True."""
+        out = set()
+        for name in skill_names(skills):
+            skill_id = self.ids.get(name)
+            if skill_id is None:
+                if not grow:
+                    continue
+                skill_id = self.ids[name] = len(self.ids)
+            out.add(skill_id)
+        return sorted(out)
+
+
+class BatchScorer:
+    """
+    Scores every talent against a project in one vectorised pass.
+
+    Talent skills are held as a CSR matrix (indptr/indices over vocabulary ids).
+    For a project we mark its skills in a boolean vector, gather it at every
+    stored (talent, skill) entry and bincount the hits per talent row, which
+    gives |talent ∩ project| for all rows at once.
+    """
+
+    def __init__(self, talent_ids, talent_skills, vetting_scores=None, vocabulary=None):
+        self.vocabulary = vocabulary or SkillVocabulary()
+        self.talent_ids = np.asarray(talent_ids, dtype=np.int64)
+
+        indptr = [0]
+        indices = []
+        for skills in talent_skills:
+            indices.extend(self.vocabulary.encode(skills))
+            indptr.append(len(indices))
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        # row number for every stored entry, so hits can be bincounted per talent
+        self.rows = np.repeat(np.arange(len(self.talent_ids), dtype=np.int32), np.diff(self.indptr))
+
+        if vetting_scores is None:
+            self.vetting = np.zeros(len(self.talent_ids), dtype=np.float64)
+        else:
+            self.vetting = np.asarray(vetting_scores, dtype=np.float64)
+
+    @classmethod
+    def from_talents(cls, talents):
+        """Build from Talent rows (vetting falls back to 0 like match_talents)."""
+        talents = list(talents)
+        return cls(
+            [t.id for t in talents],
+            [getattr(t, "skills", []) for t in talents],
+            [getattr(t, "vetting_overall_score", 0) or 0 for t in talents],
+        )
+
+    def __len__(self):
+        return len(self.talent_ids)
+
+    def overlap(self, project_skills):
+        """|distinct talent skills ∩ project skills| for every talent row."""
+        wanted = self.vocabulary.encode(project_skills, grow=False)
+        if not wanted or not len(self.indices):
+            return np.zeros(len(self), dtype=np.int64)
+        member = np.zeros(len(self.vocabulary), dtype=bool)
+        member[wanted] = True
+        hits = member[self.indices]
+        return np.bincount(self.rows[hits], minlength=len(self))
+
+    def skill_scores(self, project_skills):
+        """Vectorised calculate_skill_match: overlap / len(project_skills) * 100."""
+        project_skills = skill_names(project_skills)
+        if not project_skills:
+            return np.zeros(len(self), dtype=np.float64)
+        return (self.overlap(project_skills) / len(project_skills)) * 100.0
+
+    def combined_scores(self, project_skills):
+        """
+        Returns (skill_score, combined_score) arrays: 70% skill, 30% vetting.
+        Unrounded and computed with the same float operations as match_talents,
+        so scores and ranking match it exactly; responses round in _match_row.
+        """
+        skill = self.skill_scores(project_skills)
+        return skill, 0.7 * skill + 0.3 * self.vetting
+
+    def top_k(self, scores, k, mask=None):
+        """
+        Row numbers of the k best scores, highest first, ties by talent id.
+        `mask` optionally restricts the rows that may be returned.
+        """
+        rows = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        if k < len(rows):
+            # partition to find the k-th best value, then keep every row tied with it
+            # so the id tie-break below stays exact.
+            kth = np.partition(-scores[rows], k - 1)[k - 1]
+            rows = rows[-scores[rows] <= kth]
+        order = np.lexsort((self.talent_ids[rows], -scores[rows]))
+        return rows[order[:k]]
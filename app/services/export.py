@@ -0,0 +1,70 @@
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import select
+
+EXPORT_BATCH_SIZE = 1000
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _plain(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _csv_cell(value):
+    value = _plain(value)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return value
+
+
+def _encode_ndjson(columns, rows):
+    return "".join(
+        json.dumps({c: _plain(v) for c, v in zip(columns, row)}) + "\n" for row in rows
+    )
+
+
+def _encode_csv(rows):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerows([_csv_cell(v) for v in row] for row in rows)
+    return buf.getvalue()
+
+
+def stream_table(bind, model, *criteria, fmt="ndjson", batch_size=EXPORT_BATCH_SIZE):
+    """
+    Generator yielding `model`'s rows as NDJSON or CSV text chunks.
+
+    Rows are read as plain column tuples on a server-side cursor
+    (stream_results + yield_per), one batch at a time, so memory stays flat no
+    matter how many rows the table has. It opens its own connection from
+    `bind`, so it keeps working after the request's session is closed.
+    """
+    table_columns = list(model.__table__.columns)
+    names = [c.name for c in table_columns]
+    stmt = select(*table_columns).where(*criteria).order_by(model.__table__.c.id)
+
+    if fmt == "csv":
+        yield _encode_csv([names])
+
+    with bind.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(stmt)
+        for rows in result.partitions():
+            if fmt == "csv":
+                yield _encode_csv(rows)
+            else:
+                yield _encode_ndjson(names, rows)
@@ -0,0 +1,82 @@
+import hashlib
+import os
+
+from sqlalchemy import inspect
+from starlette.responses import Response
+
+# Public reads: browsers always revalidate (a cheap 304), shared caches/CDNs may
+# serve a copy for PUBLIC_CACHE_S_MAXAGE seconds. Keep it short: a CDN hit can't
+# honour read-your-writes.
+PUBLIC_CACHE_S_MAXAGE = int(os.getenv("PUBLIC_CACHE_S_MAXAGE", "60"))
+PUBLIC_CACHE_CONTROL = f"public, max-age=0, s-maxage={PUBLIC_CACHE_S_MAXAGE}, stale-while-revalidate=30"
+# Listings change whenever anything is added; let every cache revalidate
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+
+def row_etag(*rows, extra=()):
+    """
+    Strong ETag for ORM rows: their `version` column when the model has one,
+    else a digest of every column value. Cheap compared to validating and
+    encoding the response body, which a 304 then skips.
+    """
+    digest = hashlib.sha256()
+    for row in rows:
+        mapper = inspect(row).mapper
+        digest.update(mapper.persist_selectable.name.encode())
+        version = getattr(row, "version", None)
+        if version is not None:
+            values = (mapper.primary_key_from_instance(row), version)
+        else:
+            values = tuple(getattr(row, attr.key) for attr in mapper.column_attrs)
+        digest.update(repr(values).encode())
+    digest.update(repr(tuple(extra)).encode())
+    return '"%s"' % digest.hexdigest()[:32]
+
+
+def etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # weak comparison (RFC 9110): W/"x" matches "x", so compressed variants match too
+    return any(tag.strip().removeprefix("W/") == etag.removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def accepted_encodings(accept_encoding):
+    """
+    Parse Accept-Encoding into {coding: qvalue}, lower-cased. A malformed
+    qvalue counts as 0 (not acceptable) rather than as a match.
+    """
+    accepted = {}
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value.strip())
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def encoding_quality(accepted, coding):
+    """qvalue for `coding` from accepted_encodings(), falling back to `*`; 0 means refused."""
+    return accepted.get(coding, accepted.get("*", 0.0))
+
+
+def conditional_response(request, response, etag, cache_control=PUBLIC_CACHE_CONTROL):
+    """
+    Returns a 304 Response when If-None-Match matches `etag`; otherwise sets
+    ETag/Cache-Control on the route's `response` and returns None.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,98 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from app.services.skill_index import skill_names
+
+MATCH_CACHE_TTL_SECONDS = float(os.getenv("MATCH_CACHE_TTL_SECONDS", "60"))
+MATCH_CACHE_MAX_ENTRIES = int(os.getenv("MATCH_CACHE_MAX_ENTRIES", "1024"))
+
+
+class MatchCache:
+    """
+    TTL + LRU cache for match results, keyed on (endpoint, project_id, filters...).
+
+    Each entry remembers the project's required skills, so a talent write only
+    drops results for projects sharing a skill with that talent. Entries stored
+    without skills (scoring we can't reason about) are dropped on every talent
+    write. The TTL bounds staleness from writes made by other workers.
+    """
+
+    def __init__(self, ttl_seconds=MATCH_CACHE_TTL_SECONDS, max_entries=MATCH_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, _, _, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, project_id, project_skills=None):
+        skills = None if project_skills is None else frozenset(skill_names(project_skills))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, project_id, skills, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _drop(self, predicate):
+        with self._lock:
+            stale = [k for k, entry in self._entries.items() if predicate(entry)]
+            for k in stale:
+                del self._entries[k]
+            self.invalidations += len(stale)
+
+    # -------------------------
+    # Invalidation hooks
+    # -------------------------
+    def invalidate_project(self, project_id):
+        self._drop(lambda entry: entry[1] == project_id)
+
+    def invalidate_talent(self, *skill_lists):
+        """Call with the talent's skills before and/or after the write."""
+        touched = set()
+        for skills in skill_lists:
+            touched.update(skill_names(skills))
+        self._drop(lambda entry: entry[2] is None or not entry[2].isdisjoint(touched))
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+match_cache = MatchCache()
@@ -0,0 +1,52 @@
+import gzip
+import hashlib
+import json
+import threading
+
+from starlette.responses import Response
+
+from app.services.http_cache import accepted_encodings, encoding_quality, etag_matches
+
+# Browsers and Swagger UI revalidate; the ETag makes that a 304
+CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+
+class OpenAPIDocument:
+    """
+    The OpenAPI schema encoded once: JSON bytes, a gzipped copy and a strong
+    ETag. `build` is app.openapi; it runs the first time the document is
+    needed (normally from warm() right after startup), never per request.
+    """
+
+    def __init__(self, build):
+        self._build = build
+        self._lock = threading.Lock()
+        self.body = None
+        self.gzipped = None
+        self.etag = None
+
+    def load(self):
+        if self.body is None:
+            with self._lock:
+                if self.body is None:
+                    body = json.dumps(self._build(), separators=(",", ":")).encode()
+                    self.gzipped = gzip.compress(body, compresslevel=9)
+                    self.etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+                    self.body = body
+        return self
+
+    def warm(self):
+        """Build in a daemon thread so startup isn't blocked by schema generation."""
+        threading.Thread(target=self.load, name="openapi-warm", daemon=True).start()
+
+    def response(self, headers):
+        self.load()
+        common = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept-Encoding"}
+        if etag_matches(headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=common)
+        if encoding_quality(accepted_encodings(headers.get("accept-encoding")), "gzip") > 0:
+            return Response(
+                self.gzipped, media_type="application/json", headers={**common, "Content-Encoding": "gzip"}
+            )
+        return Response(self.body, media_type="application/json", headers=common)
+
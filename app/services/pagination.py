@@ -0,0 +1,50 @@
+import os
+from typing import Optional
+
+from fastapi import Query
+
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "50"))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "200"))
+
+
+class PageParams:
+    """
+    Query parameters for keyset pagination on id.
+    `cursor` is the `next_cursor` returned by the previous page (omit for page one).
+    """
+
+    def __init__(
+        self,
+        cursor: Optional[int] = Query(None, ge=0, description="next_cursor from the previous page"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+def keyset_page(query, id_column, page: PageParams):
+    """
+    Apply `id > cursor ORDER BY id LIMIT n` to `query` and return
+    {"items": [...], "next_cursor": id or None}. One extra row is fetched to
+    know whether another page exists, so no COUNT(*) is needed.
+    """
+    if page.cursor is not None:
+        query = query.filter(id_column > page.cursor)
+    rows = query.order_by(id_column).limit(page.limit + 1).all()
+    return _page(rows, page)
+
+
+async def async_keyset_page(db, stmt, id_column, page: PageParams):
+    """keyset_page for an AsyncSession and a select() of one ORM entity."""
+    if page.cursor is not None:
+        stmt = stmt.where(id_column > page.cursor)
+    result = await db.execute(stmt.order_by(id_column).limit(page.limit + 1))
+    return _page(result.scalars().all(), page)
+
+
+def _page(rows, page):
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        next_cursor = rows[-1].id
+    return {"items": rows, "next_cursor": next_cursor}
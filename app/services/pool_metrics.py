@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+WAIT_SAMPLES = 1024
+
+
+class PoolMetrics:
+    """
+    Counters for one connection pool, fed by SQLAlchemy pool events
+    (connect / checkout / checkin / invalidate) plus checkout wait times from
+    the Timed*QueuePool classes below (no pool event fires when a checkout
+    starts waiting). Wait percentiles come from the last WAIT_SAMPLES checkouts.
+    """
+
+    def __init__(self, name, samples=WAIT_SAMPLES):
+        self.name = name
+        self.pool = None
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+        self.wait_max_ms = 0.0
+        self._waits = deque(maxlen=samples)
+        self._lock = threading.Lock()
+
+    def attach(self, pool):
+        self.pool = pool
+        pool.metrics = self
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+        event.listen(pool, "invalidate", self._on_invalidate)
+        return self
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+            if isinstance(self.pool, QueuePool):
+                self.peak_checked_out = max(self.peak_checked_out, self.pool.checkedout())
+                self.peak_overflow = max(self.peak_overflow, self.pool.overflow())
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checkins += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+    def record_wait(self, seconds, timed_out=False):
+        ms = seconds * 1000
+        with self._lock:
+            self._waits.append(ms)
+            self.wait_max_ms = max(self.wait_max_ms, ms)
+            if timed_out:
+                self.timeouts += 1
+
+    def stats(self):
+        with self._lock:
+            waits = sorted(self._waits)
+            result = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+                "wait_ms_p50": round(waits[len(waits) // 2], 3) if waits else 0.0,
+                "wait_ms_p99": round(waits[int(len(waits) * 0.99)], 3) if waits else 0.0,
+                "wait_ms_max": round(self.wait_max_ms, 3),
+            }
+        if isinstance(self.pool, QueuePool):
+            result.update(
+                size=self.pool.size(),
+                checked_out=self.pool.checkedout(),
+                overflow=self.pool.overflow(),
+                max_overflow=self.pool._max_overflow,
+                timeout=self.pool.timeout(),
+            )
+        return result
+
+
+class _TimedCheckout:
+    metrics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - start)
+        return record
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep counting into the same metrics
+        pool = super().recreate()
+        if self.metrics is not None:
+            self.metrics.pool = pool
+            pool.metrics = self.metrics
+        return pool
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+# engine name -> PoolMetrics, for the admin metrics endpoint
+pool_metrics = {}
+
+
+def instrument_engine(engine, name):
+    """Attach PoolMetrics to `engine` (sync Engine or AsyncEngine) under `name`."""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    pool_metrics[name] = PoolMetrics(name).attach(sync_engine.pool)
+    return pool_metrics[name]
+
+
+def pool_stats():
+    return {name: metrics.stats() for name, metrics in pool_metrics.items()}
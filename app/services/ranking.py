@@ -0,0 +1,15 @@
+import heapq
+
+
+def rank_top_k(items, score, ident, limit=None, offset=0):
+    """
+    Rank `items` by score (highest first), breaking ties by ident (lowest first),
+    and return the page [offset:offset + limit].
+
+    With a limit this is a bounded heap selection, O(n log k), so callers can
+    score cheap tuples and only build response dicts for the winners.
+    """
+    key = lambda item: (-score(item), ident(item))
+    if limit is None:
+        return sorted(items, key=key)[offset:]
+    return heapq.nsmallest(offset + limit, items, key=key)[offset:]
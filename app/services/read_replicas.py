@@ -0,0 +1,138 @@
+import asyncio
+import hashlib
+import itertools
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+logger = logging.getLogger("somahorse-backend")
+
+# Comma-separated replica URLs; empty means every read goes to the primary
+DATABASE_REPLICA_URLS = [u.strip() for u in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if u.strip()]
+# How long a replica that failed to connect is skipped
+REPLICA_RETRY_SECONDS = float(os.getenv("REPLICA_RETRY_SECONDS", "30"))
+# A replica that takes longer than this to hand out a connection is skipped
+REPLICA_CONNECT_TIMEOUT = float(os.getenv("REPLICA_CONNECT_TIMEOUT", "2"))
+# Per-statement timeout on replica connections (Postgres), so a hung replica errors instead of hanging
+REPLICA_STATEMENT_TIMEOUT = float(os.getenv("REPLICA_STATEMENT_TIMEOUT", "10"))
+# After a write, the same caller reads from the primary for this long
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+
+PRIMARY_COOKIE = "primary_until"
+# request.state flag set when the request wrote to the primary (see mark_primary_write)
+WROTE_PRIMARY = "wrote_primary"
+
+
+class ReplicaSet:
+    """
+    Picks a connection for read-only work: replicas in round-robin order,
+    skipping any that failed to connect in the last `retry_seconds`, and
+    the primary when there are no replicas, none is healthy, or the caller
+    asked for it (read-your-writes).
+    """
+
+    def __init__(self, primary, replicas=(), retry_seconds=REPLICA_RETRY_SECONDS,
+                 connect_timeout=REPLICA_CONNECT_TIMEOUT, clock=time.monotonic):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.retry_seconds = retry_seconds
+        self.connect_timeout = connect_timeout
+        self.clock = clock
+        self._next = itertools.count()
+        self._down_until = {}
+        self.reads = {"primary": 0, **{f"replica-{i}": 0 for i in range(len(self.replicas))}}
+        self.failovers = 0
+
+    def _healthy_order(self):
+        if not self.replicas:
+            return []
+        start = next(self._next) % len(self.replicas)
+        now = self.clock()
+        order = [(start + k) % len(self.replicas) for k in range(len(self.replicas))]
+        return [i for i in order if self._down_until.get(i, 0) <= now]
+
+    async def connect(self, use_primary=False):
+        """Returns (AsyncConnection, name)."""
+        if not use_primary:
+            for i in self._healthy_order():
+                try:
+                    conn = await asyncio.wait_for(self.replicas[i].connect(), self.connect_timeout)
+                except (OperationalError, DBAPIError, OSError, asyncio.TimeoutError) as e:
+                    self.mark_down(f"replica-{i}", e)
+                    continue
+                self.reads[f"replica-{i}"] += 1
+                return conn, f"replica-{i}"
+        self.reads["primary"] += 1
+        return await self.primary.connect(), "primary"
+
+    def mark_down(self, name, error):
+        """Skip replica `name` for `retry_seconds` (no-op for the primary)."""
+        if not name.startswith("replica-"):
+            return
+        self._down_until[int(name.split("-", 1)[1])] = self.clock() + self.retry_seconds
+        self.failovers += 1
+        logger.warning("Read %s unavailable, skipping for %ss: %r", name, self.retry_seconds, error)
+
+    def stats(self):
+        now = self.clock()
+        return {
+            "replicas": len(self.replicas),
+            "down": [f"replica-{i}" for i, until in self._down_until.items() if until > now],
+            "reads": dict(self.reads),
+            "failovers": self.failovers,
+        }
+
+
+class RecentWrites:
+    """Callers (by hashed credentials) that wrote within the last `window` seconds."""
+
+    def __init__(self, window=READ_YOUR_WRITES_SECONDS, max_entries=100_000, clock=time.monotonic):
+        self.window = window
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def mark(self, key):
+        with self._lock:
+            self._entries[key] = self.clock() + self.window
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def is_recent(self, key):
+        until = self._entries.get(key)
+        return until is not None and until > self.clock()
+
+
+recent_writes = RecentWrites()
+
+
+def caller_key(authorization):
+    if not authorization:
+        return None
+    return hashlib.sha256(authorization.encode()).hexdigest()
+
+
+def mark_primary_write(state):
+    """
+    Record on the request's state that it wrote to the primary, so
+    ReadYourWritesMiddleware pins the caller. get_db/get_async_db sessions
+    call this on flush and on bulk INSERT/UPDATE/DELETE.
+    """
+    setattr(state, WROTE_PRIMARY, True)
+
+
+def wants_primary(headers, cookies):
+    """Read-your-writes: pin reads to the primary just after the caller's own write."""
+    key = caller_key(headers.get("authorization"))
+    if key and recent_writes.is_recent(key):
+        return True
+    try:
+        return float(cookies.get(PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
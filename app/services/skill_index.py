@@ -0,0 +1,100 @@
+import os
+import threading
+import time
+
+from app.models.talent import Talent
+
+# Rebuild from the database after this many seconds, so talent written by
+# other workers/replicas is picked up even though we never saw the write.
+SKILL_INDEX_TTL_SECONDS = float(os.getenv("SKILL_INDEX_TTL_SECONDS", "300"))
+
+
+def skill_names(items):
+    """
+    Normalise a skills value to a list of names.
+    Accepts plain strings (ARRAY(Text) columns) or objects with a `.name`.
+    """
+    return [s if isinstance(s, str) else s.name for s in (items or [])]
+
+
+class SkillIndex:
+    """
+    In-memory inverted index: skill name -> set of talent ids (posting list).
+    Kept up to date by the talent write routes and rebuilt lazily from the DB.
+    """
+
+    def __init__(self, ttl_seconds=SKILL_INDEX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._postings = {}
+        self._talent_skills = {}
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._talent_skills)
+
+    def _add(self, talent_id, skills):
+        names = frozenset(skill_names(skills))
+        self._talent_skills[talent_id] = names
+        for name in names:
+            self._postings.setdefault(name, set()).add(talent_id)
+
+    def _remove(self, talent_id):
+        for name in self._talent_skills.pop(talent_id, ()):
+            posting = self._postings.get(name)
+            if posting is None:
+                continue
+            posting.discard(talent_id)
+            if not posting:
+                del self._postings[name]
+
+    # -------------------------
+    # Write path (called from talent routes)
+    # -------------------------
+    def upsert(self, talent_id, skills):
+        with self._lock:
+            self._remove(talent_id)
+            self._add(talent_id, skills)
+
+    def remove(self, talent_id):
+        with self._lock:
+            self._remove(talent_id)
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded_at = None
+
+    # -------------------------
+    # Read path
+    # -------------------------
+    def is_stale(self):
+        if self._loaded_at is None:
+            return True
+        return (time.monotonic() - self._loaded_at) > self.ttl_seconds
+
+    def rebuild(self, db):
+        rows = db.query(Talent.id, Talent.skills).all()
+        with self._lock:
+            self._postings = {}
+            self._talent_skills = {}
+            for talent_id, skills in rows:
+                self._add(talent_id, skills)
+            self._loaded_at = time.monotonic()
+
+    def ensure_loaded(self, db):
+        if self.is_stale():
+            self.rebuild(db)
+
+    def candidates(self, skills):
+        """Ids of talent sharing at least one of `skills`."""
+        ids = set()
+        with self._lock:
+            for name in set(skill_names(skills)):
+                ids |= self._postings.get(name, set())
+        return ids
+
+    def skills_of(self, talent_id):
+        return self._talent_skills.get(talent_id, frozenset())
+
+
+skill_index = SkillIndex()
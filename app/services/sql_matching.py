@@ -0,0 +1,89 @@
+from decimal import Decimal
+
+from sqlalchemy import Numeric, Text, any_, bindparam, cast, distinct, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from app.models.talent import Talent
+
+
+def overlap_count(required):
+    """Correlated scalar subquery: number of distinct talent skills in `required`."""
+    skill = func.unnest(Talent.skills).table_valued("skill")
+    return (
+        select(func.count(distinct(skill.c.skill)))
+        .where(skill.c.skill == any_(required))
+        .scalar_subquery()
+    )
+
+
+def _vetting_column():
+    # Talent has no vetting score column yet; score it as 0 like the Python path.
+    column = getattr(Talent, "vetting_overall_score", None)
+    return column if column is not None else literal(0)
+
+
+def _candidates(required, *columns, location=None, completed_only=False):
+    # `skills && :required` is served by the GIN index ix_talent_skills_gin
+    q = select(Talent, *columns).where(Talent.skills.overlap(required))
+    if completed_only:
+        q = q.where(Talent.profile_completed == True)
+    if location and hasattr(Talent, "location"):
+        q = q.where(Talent.location == location)
+    return q
+
+
+def sql_weighted_matches(db, project_skills, vetting_min=0.0, location=None, limit=10, offset=0):
+    """
+    /v1/match scoring done in one Postgres query (70% skill match, 30% vetting).
+    Returns (talent, skill_score, vetting_score, combined_score) rows, best first.
+    """
+    if not project_skills:
+        return []
+    required = bindparam("required_skills", sorted(set(project_skills)), type_=ARRAY(Text))
+    vetting = _vetting_column()
+
+    # Keep the arithmetic in NUMERIC so round(x, 2) matches the Python scores
+    skill_score = cast(overlap_count(required), Numeric) * 100 / len(project_skills)
+    combined = func.round(
+        literal(Decimal("0.7"), Numeric) * skill_score
+        + literal(Decimal("0.3"), Numeric) * cast(vetting, Numeric),
+        2,
+    ).label("combined_score")
+
+    q = _candidates(
+        required,
+        func.round(skill_score, 2).label("skill_score"),
+        vetting.label("vetting_score"),
+        combined,
+        location=location,
+    )
+    if vetting_min:
+        q = q.where(vetting >= vetting_min)
+    q = q.order_by(combined.desc(), Talent.id).offset(offset).limit(limit)
+
+    return [
+        (t, float(skill), vetting_score, float(score))
+        for t, skill, vetting_score, score in db.execute(q).all()
+    ]
+
+
+def sql_overlap_matches(db, required_skills, limit=None, offset=0):
+    """
+    /match scoring done in one Postgres query: overlap / |required|, completed
+    profiles only. Returns (score, talent) rows, best first.
+    """
+    required_set = set(required_skills or [])
+    if not required_set:
+        return []
+    required = bindparam("required_skills", sorted(required_set), type_=ARRAY(Text))
+
+    score = func.round(cast(overlap_count(required), Numeric) / len(required_set), 2).label("score")
+    q = (
+        _candidates(required, score, completed_only=True)
+        .order_by(score.desc(), Talent.id)
+        .offset(offset)
+    )
+    if limit is not None:
+        q = q.limit(limit)
+
+    return [(float(s), t) for t, s in db.execute(q).all()]
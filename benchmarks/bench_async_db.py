@@ -0,0 +1,140 @@
+"""
+Concurrent GET /talent/{id}: the old sync route (threadpool-bound) vs the
+async route on the async engine, with every SELECT taking LATENCIES_MS to
+mimic a Postgres round trip. The latency is injected inside the SQLite
+driver thread, so it blocks a worker thread in the sync case and nothing on
+the event loop in the async case, just like network I/O would.
+
+    DATABASE_URL=sqlite:// python -m benchmarks.bench_async_db
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+import time
+
+import httpx
+from fastapi import Depends, FastAPI, HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.database import get_async_db, get_read_db
+from app.models import Talent
+from app.routers.talent import router as talent_router
+
+REQUESTS = 4_000
+CONCURRENCY = 400
+LATENCIES_MS = (0, 50, 200)
+# big enough that the connection pool is never the limit
+POOL_SIZE = CONCURRENCY
+
+
+class SlowConnection(sqlite3.Connection):
+    latency_ms = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.set_authorizer(self._authorize)
+
+    @classmethod
+    def _authorize(cls, action, *args):
+        if action == sqlite3.SQLITE_SELECT and cls.latency_ms:
+            time.sleep(cls.latency_ms / 1000)
+        return sqlite3.SQLITE_OK
+
+
+CONNECT_ARGS = {
+    "factory": SlowConnection,
+    "cached_statements": 0,
+    "check_same_thread": False,
+    "detect_types": sqlite3.PARSE_DECLTYPES,
+}
+
+# talent.skills is a Postgres ARRAY; store it as JSON text on SQLite
+sqlite3.register_converter("JSON", json.loads)
+
+
+def build_before(path):
+    engine = create_engine(f"sqlite:///{path}", connect_args=CONNECT_ARGS, pool_size=POOL_SIZE)
+    SessionLocal = sessionmaker(bind=engine)
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+
+    @app.get("/talent/{talent_id}")
+    def get_talent(talent_id: int, db: Session = Depends(get_db)):
+        talent = db.get(Talent, talent_id)
+        if not talent:
+            raise HTTPException(status_code=404, detail="Talent not found")
+        return {"id": talent.id, "full_name": talent.full_name}
+
+    return app
+
+
+def build_after(path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", connect_args=CONNECT_ARGS, pool_size=POOL_SIZE
+    )
+    factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async def _get_async_db():
+        async with factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(talent_router)
+    app.dependency_overrides[get_async_db] = _get_async_db
+    # GET /talent/{id} reads through get_read_db (replica or primary)
+    app.dependency_overrides[get_read_db] = _get_async_db
+    return app
+
+
+def seed(path):
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE talent (id INTEGER PRIMARY KEY, full_name VARCHAR, email VARCHAR, skills JSON,"
+        " experience_years INTEGER, profile_completed BOOLEAN, availability_status VARCHAR,"
+        " version INTEGER, updated_at DATETIME)"
+    )
+    conn.executemany(
+        "INSERT INTO talent VALUES (?, ?, ?, '[\"py\"]', 1, 0, 'available', ?, '2026-01-01 00:00:00')",
+        [(i + 1, f"t{i}", f"t{i}@x.io", i + 1) for i in range(100)],
+    )
+    conn.commit()
+    conn.close()
+
+
+async def drive(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def worker(n, offset):
+            for i in range(n):
+                r = await client.get(f"/talent/{(offset + i) % 100 + 1}")
+                assert r.status_code == 200, r.text
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(REQUESTS // CONCURRENCY, c) for c in range(CONCURRENCY)))
+        return REQUESTS / (time.perf_counter() - start)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        seed(path)
+        for latency_ms in LATENCIES_MS:
+            SlowConnection.latency_ms = latency_ms
+            for name, build in (("before (sync def, threadpool)", build_before), ("after (async def, asyncio)", build_after)):
+                rps = asyncio.run(drive(build(path)))
+                print(f"{latency_ms:>4}ms/query  {name:<32} {rps:>8.0f} req/s  ({CONCURRENCY} concurrent)")
+
+
+if __name__ == "__main__":
+    main()
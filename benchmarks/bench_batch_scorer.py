@@ -0,0 +1,58 @@
+"""
+Microbenchmark: per-talent Python scoring vs the vectorised BatchScorer.
+
+    DATABASE_URL=sqlite:// python -m benchmarks.bench_batch_scorer
+"""
+import random
+import time
+
+from app.routers.matching import calculate_skill_match
+from app.services.batch_scorer import BatchScorer
+
+VOCAB = ["skill-%d" % i for i in range(500)]
+SIZES = (10_000, 100_000, 1_000_000)
+PROJECT_SKILLS = VOCAB[:6]
+
+
+def make_pool(n, rng):
+    return [rng.sample(VOCAB, rng.randint(1, 10)) for _ in range(n)]
+
+
+def python_scores(pool, vetting):
+    return [
+        0.7 * calculate_skill_match(skills, PROJECT_SKILLS) + 0.3 * v
+        for skills, v in zip(pool, vetting)
+    ]
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'talent':>10} {'python ms':>12} {'batch ms':>10} {'build ms':>10} {'speedup':>8}")
+    for n in SIZES:
+        pool = make_pool(n, rng)
+        vetting = [rng.uniform(0, 100) for _ in range(n)]
+
+        start = time.perf_counter()
+        scorer = BatchScorer(range(n), pool, vetting)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        def batch():
+            _, combined = scorer.combined_scores(PROJECT_SKILLS)
+            scorer.top_k(combined, 50)
+
+        py_ms = timed(lambda: python_scores(pool, vetting), repeat=1)
+        np_ms = timed(batch)
+        print(f"{n:>10} {py_ms:>12.1f} {np_ms:>10.1f} {build_ms:>10.1f} {py_ms / np_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
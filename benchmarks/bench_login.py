@@ -0,0 +1,102 @@
+"""
+Login throughput under a storm, with /healthz latency sampled alongside:
+bcrypt inline in a sync route ("before", runs on the shared threadpool) vs
+awaited on the dedicated hashing pool ("after").
+
+    DATABASE_URL=sqlite:// python -m benchmarks.bench_login
+"""
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI, HTTPException
+
+from app.core.security import PasswordHasher, pwd_context, verify_password
+
+LOGINS = 400
+CONCURRENCY = 100
+PROBES = 50
+ROUNDS = 10
+
+STORED_HASH = pwd_context.copy(bcrypt__rounds=ROUNDS).hash("correct horse")
+
+
+def build_before():
+    app = FastAPI()
+
+    @app.post("/auth/login")
+    def login(password: str):
+        if not verify_password(password, STORED_HASH):
+            raise HTTPException(status_code=400, detail="Invalid email or password")
+        return {"ok": True}
+
+    _add_healthz(app)
+    return app
+
+
+def build_after(hasher):
+    app = FastAPI()
+
+    @app.post("/auth/login")
+    async def login(password: str):
+        valid, _ = await hasher.verify(password, STORED_HASH)
+        if not valid:
+            raise HTTPException(status_code=400, detail="Invalid email or password")
+        return {"ok": True}
+
+    _add_healthz(app)
+    return app
+
+
+def _add_healthz(app):
+    # sync like the real /healthz, so it shares the threadpool with sync routes
+    @app.get("/healthz")
+    def healthz():
+        return {"status": "ok"}
+
+
+async def drive(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        statuses = []
+        latencies = []
+
+        async def storm(n):
+            for _ in range(n):
+                r = await client.post("/auth/login", params={"password": "correct horse"})
+                statuses.append(r.status_code)
+
+        async def probe():
+            for _ in range(PROBES):
+                start = time.perf_counter()
+                await client.get("/healthz")
+                latencies.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.01)
+
+        start = time.perf_counter()
+        await asyncio.gather(probe(), *(storm(LOGINS // CONCURRENCY) for _ in range(CONCURRENCY)))
+        elapsed = time.perf_counter() - start
+
+    ok = statuses.count(200)
+    latencies.sort()
+    return {
+        "logins/s": ok / elapsed,
+        "503s": statuses.count(503),
+        "healthz p50 ms": statistics.median(latencies),
+        "healthz p99 ms": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+def main():
+    hasher = PasswordHasher(max_pending=LOGINS)
+    try:
+        for name, app in (("before (inline, threadpool)", build_before()), ("after (hashing pool)", build_after(hasher))):
+            result = asyncio.run(drive(app))
+            print(f"{name:<30} " + "  ".join(f"{k}={v:.1f}" if isinstance(v, float) else f"{k}={v}" for k, v in result.items()))
+    finally:
+        hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
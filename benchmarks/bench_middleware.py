@@ -0,0 +1,98 @@
+"""
+Throughput of /healthz through the middleware stack, BaseHTTPMiddleware
+("before") vs pure ASGI ("after"), driven in-process with httpx.
+
+    DATABASE_URL=sqlite:// python -m benchmarks.bench_middleware
+"""
+import asyncio
+import logging
+import time
+
+import httpx
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+
+from app.middleware.rate_limit import LIMITS, SlidingWindowLimiter, RateLimitMiddleware, role_from_authorization
+from app.middleware.request_log import RequestLogMiddleware
+
+REQUESTS = 5_000
+CONCURRENCY = 50
+LIMITS_NO_DENY = {role: 10**9 for role in LIMITS}
+
+logger = logging.getLogger("somahorse-backend")
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    """Same limiter as RateLimitMiddleware, wrapped the old BaseHTTPMiddleware way."""
+
+    def __init__(self, app, limiter, limits):
+        super().__init__(app)
+        self.limiter = limiter
+        self.limits = limits
+
+    async def dispatch(self, request, call_next):
+        role = role_from_authorization(request.headers.get("authorization"))
+        limit = self.limits[role]
+        allowed, remaining, retry_after = await self.limiter.acquire(f"{request.client.host}:{role}", limit)
+        if not allowed:
+            return JSONResponse(status_code=429, content={"detail": "Too many requests"})
+        response = await call_next(request)
+        response.headers["X-RateLimit-Remaining"] = str(remaining)
+        return response
+
+
+def build_before():
+    app = FastAPI()
+    app.add_middleware(LegacyRateLimitMiddleware, limiter=SlidingWindowLimiter(), limits=LIMITS_NO_DENY)
+
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        start_time = time.time()
+        logger.info(f">>> {request.method} {request.url.path}")
+        response = await call_next(request)
+        process_time = (time.time() - start_time) * 1000
+        logger.info(f"<<< {request.method} {request.url.path} completed_in={process_time:.2f}ms")
+        response.headers["X-Process-Time-ms"] = f"{process_time:.2f}"
+        return response
+
+    _add_healthz(app)
+    return app
+
+
+def build_after():
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, limiter=SlidingWindowLimiter(), limits=LIMITS_NO_DENY)
+    app.add_middleware(RequestLogMiddleware)
+    _add_healthz(app)
+    return app
+
+
+def _add_healthz(app):
+    @app.get("/healthz")
+    async def healthz():
+        return {"status": "ok"}
+
+
+async def drive(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker(n):
+            for _ in range(n):
+                r = await client.get("/healthz")
+                assert r.status_code == 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(REQUESTS // CONCURRENCY) for _ in range(CONCURRENCY)))
+        return REQUESTS / (time.perf_counter() - start)
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    for name, build in (("before (BaseHTTPMiddleware)", build_before), ("after (pure ASGI)", build_after)):
+        rps = asyncio.run(drive(build()))
+        print(f"{name:<30} {rps:>10.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
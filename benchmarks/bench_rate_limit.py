@@ -0,0 +1,51 @@
+"""
+Per-request overhead of each rate-limit backend.
+
+    DATABASE_URL=sqlite:// python -m benchmarks.bench_rate_limit
+
+Shared-store rows use the in-process Redis stand-in, so their time is pure
+client-side cost; the round trips/request column is what turns into network
+latency against a real server (set REDIS_URL to also measure one).
+"""
+import asyncio
+import os
+import time
+
+from app.middleware.rate_limit import SlidingWindowLimiter
+from app.middleware.rate_limit_backends import InProcessRedis, RedisWindowBackend
+
+REQUESTS = 200_000
+CLIENTS = 1_000
+LIMIT = 1_000_000  # high enough that nothing is denied; we measure the happy path
+
+
+async def run(backend, store=None):
+    start = time.perf_counter()
+    for i in range(REQUESTS):
+        await backend.acquire(f"10.0.{i % CLIENTS}:user", LIMIT)
+    elapsed = time.perf_counter() - start
+    trips = store.round_trips / REQUESTS if isinstance(store, InProcessRedis) else float("nan")
+    return elapsed / REQUESTS * 1e6, trips
+
+
+def main():
+    rows = [("memory", SlidingWindowLimiter(), None)]
+    for lease in (1, 10, 100):
+        store = InProcessRedis()
+        rows.append((f"shared lease={lease}", RedisWindowBackend(store, lease_size=lease), store))
+
+    if os.getenv("REDIS_URL"):
+        import redis.asyncio as redis
+
+        client = redis.from_url(os.environ["REDIS_URL"])
+        for lease in (1, 10):
+            rows.append((f"redis lease={lease}", RedisWindowBackend(client, lease_size=lease, prefix="bench"), client))
+
+    print(f"{'backend':<20} {'us/request':>12} {'round trips/request':>20}")
+    for name, backend, store in rows:
+        us, trips = asyncio.run(run(backend, store))
+        print(f"{name:<20} {us:>12.2f} {trips:>20.3f}")
+
+
+if __name__ == "__main__":
+    main()
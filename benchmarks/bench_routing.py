@@ -0,0 +1,79 @@
+"""
+Route dispatch cost over the full route table: the old main.py layout
+(talent/project/outcome/matching routers included twice) vs the registry
+(each router once). Requests go straight into the ASGI app, no middleware,
+so the difference is the router's linear scan.
+
+    DATABASE_URL=sqlite:// python -m benchmarks.bench_routing
+"""
+import asyncio
+import time
+
+from fastapi import FastAPI
+
+from app.routers.registry import ROUTERS, include_routers
+from app.routers.matching import router as matching_router
+from app.routers.project_outcomes import router as outcome_router
+from app.routers.projects import router as project_router
+from app.routers.talent import router as talent_router
+
+REQUESTS = 20_000
+
+# Cheap requests that still walk the table: a 404 scans every route, /healthz
+# is registered last, and GET on a POST-only route ends in a 405.
+PATHS = ("/no-such-route", "/healthz", "/v1/match/batch")
+
+
+def build_before():
+    app = FastAPI()
+    for router in ROUTERS:
+        app.include_router(router)
+    _add_health(app)
+    for router in (talent_router, project_router, outcome_router, matching_router):
+        app.include_router(router)
+    return app
+
+
+def build_after():
+    app = FastAPI()
+    include_routers(app)
+    _add_health(app)
+    return app
+
+
+def _add_health(app):
+    @app.get("/healthz")
+    def healthz():
+        return {"status": "ok"}
+
+
+async def drive(app, path):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / REQUESTS * 1e6
+
+
+def main():
+    apps = {"before (duplicated)": build_before(), "after (registry)": build_after()}
+    print(f"{'':<22}" + "".join(f"{p:>18}" for p in PATHS) + "   (us/request)")
+    for name, app in apps.items():
+        asyncio.run(drive(app, "/healthz"))  # warm up route caches
+        row = [asyncio.run(drive(app, path)) for path in PATHS]
+        print(f"{name:<22}" + "".join(f"{us:>18.1f}" for us in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Encoding a 10k-row /v1/match-style response through FastAPI, per strategy:
+
+  jsonable_encoder  no response_model: jsonable_encoder walk + stdlib json (old default)
+  orjson default    no response_model, ORJSONResponse as the route class
+  response_model    MatchResponse validated, then dumped by pydantic-core
+  model+orjson      MatchResponse validated, python dict, then orjson
+  prebuilt orjson   handler returns ORJSONResponse itself: no validation, no walk
+
+    DATABASE_URL=sqlite:// python -m benchmarks.bench_serialization
+"""
+import asyncio
+import random
+import time
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from app.core.responses import ORJSONResponse
+from app.schemas.matching import MatchResponse
+
+ROWS = 10_000
+REPEAT = 5
+
+
+def make_payload(n, rng):
+    return {"project_id": 1, "matches": [
+        {
+            "talent_id": i,
+            "name": f"Talent {i}",
+            "skills": rng.sample(["python", "go", "sql", "react", "aws", "k8s"], 3),
+            "skill_score": round(rng.uniform(0, 100), 2),
+            "vetting_score": round(rng.uniform(0, 100), 2),
+            "combined_score": round(rng.uniform(0, 100), 2),
+            "location": rng.choice([None, "Nairobi", "Lagos"]),
+        }
+        for i in range(n)
+    ]}
+
+
+def build_app(payload):
+    app = FastAPI()
+
+    @app.get("/jsonable", response_class=JSONResponse)
+    async def jsonable():
+        return payload
+
+    @app.get("/orjson", response_class=ORJSONResponse)
+    async def orjson_default():
+        return payload
+
+    @app.get("/model", response_model=MatchResponse)
+    async def model():
+        return payload
+
+    @app.get("/model-orjson", response_model=MatchResponse, response_class=ORJSONResponse)
+    async def model_orjson():
+        return payload
+
+    @app.get("/prebuilt", response_model=MatchResponse)
+    async def prebuilt():
+        return ORJSONResponse(payload)
+
+    return app
+
+
+async def call(app, path):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+def timed(app, path):
+    best = float("inf")
+    size = 0
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        size = len(asyncio.run(call(app, path)))
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, size
+
+
+def main():
+    app = build_app(make_payload(ROWS, random.Random(42)))
+    print(f"{ROWS} match rows")
+    print(f"{'strategy':<18} {'best ms':>9} {'bytes':>10}")
+    for name, path in (
+        ("jsonable_encoder", "/jsonable"),
+        ("orjson default", "/orjson"),
+        ("response_model", "/model"),
+        ("model+orjson", "/model-orjson"),
+        ("prebuilt orjson", "/prebuilt"),
+    ):
+        ms, size = timed(app, path)
+        print(f"{name:<18} {ms:>9.1f} {size:>10}")
+
+
+if __name__ == "__main__":
+    main()
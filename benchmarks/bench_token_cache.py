@@ -0,0 +1,69 @@
+"""
+Auth overhead per request: RS256 ID-token verification vs a verified-token
+cache hit. Firebase's verifier is replaced by an equivalent local RS256 check
+(same signature work, no network), so this runs offline.
+
+    DATABASE_URL=sqlite:// python -m benchmarks.bench_token_cache
+"""
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt
+
+from app.security import firebase
+
+ITERATIONS = 2_000
+
+
+def make_keys():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    return private_pem, public_pem
+
+
+def timed(fn):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main():
+    private_pem, public_pem = make_keys()
+    token = jwt.encode(
+        {"uid": "u1", "role": "user", "exp": int(time.time()) + 3600},
+        private_pem,
+        algorithm="RS256",
+    )
+
+    class LocalAuth:
+        """Stands in for firebase_admin.auth (init_firebase's return value)."""
+
+        @staticmethod
+        def verify_id_token(t, check_revoked=False):
+            return jwt.decode(t, public_pem, algorithms=["RS256"])
+
+    firebase.FIREBASE_PROJECT_ID = None  # take the Admin SDK path, stubbed above
+    firebase.init_firebase = lambda: LocalAuth
+
+    def uncached():
+        firebase.token_cache.clear()
+        firebase.verify_firebase_token(token)
+
+    def cached():
+        firebase.verify_firebase_token(token)
+
+    print(f"{'path':<24} {'us/request':>12}")
+    print(f"{'verify every request':<24} {timed(uncached):>12.1f}")
+    print(f"{'token cache hit':<24} {timed(cached):>12.1f}")
+    print("cache stats:", firebase.token_cache.stats())
+
+
+if __name__ == "__main__":
+    main()
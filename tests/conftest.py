@@ -0,0 +1,110 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+# app.database builds its engine at import time
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine, event, types as sqltypes
+from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+
+# The models use Postgres ARRAY(Text); on SQLite store those columns as JSON
+# text so the real models can be exercised without a Postgres server.
+@compiles(sqltypes.ARRAY, "sqlite")
+@compiles(PG_ARRAY, "sqlite")
+def _array_as_json(type_, compiler, **kw):
+    return "JSON"
+
+
+sqlite3.register_adapter(list, json.dumps)
+sqlite3.register_converter("JSON", json.loads)
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    from app.database import Base
+    import app.models  # noqa: F401  (register tables on Base.metadata)
+
+    # a file, so threadpool-run routes and the async engine see the same DB
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        connect_args={"detect_types": sqlite3.PARSE_DECLTYPES, "check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(sqlite_engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=sqlite_engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def async_db(sqlite_engine):
+    """Override for app.database.get_async_db, on the same database as db_session."""
+    engine = create_async_engine(
+        sqlite_engine.url.set(drivername="sqlite+aiosqlite"),
+        connect_args={"detect_types": sqlite3.PARSE_DECLTYPES},
+        # no pooled connections carried between TestClient event loops
+        poolclass=NullPool,
+    )
+    factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async def _get_async_db():
+        async with factory() as db:
+            yield db
+
+    return _get_async_db
+
+
+@pytest.fixture
+def api_client(db_session, async_db):
+    """
+    TestClient factory: api_client(router, ..., principal=...) serves the
+    routers on a fresh app with every DB dependency on the test database.
+    The caller is `principal` (default: an admin); pass principal=None to
+    keep the real token check.
+    """
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.database import get_async_db, get_db, get_read_db
+    from app.security.principal import Principal, get_async_principal, get_principal
+
+    admin = Principal(uid="admin", email="admin@x.io", role="admin", user_id=1)
+
+    def _client(*routers, principal=admin):
+        app = FastAPI()
+        for router in routers:
+            app.include_router(router)
+        app.dependency_overrides[get_db] = lambda: db_session
+        app.dependency_overrides[get_async_db] = async_db
+        app.dependency_overrides[get_read_db] = async_db
+        if principal is not None:
+            app.dependency_overrides[get_principal] = lambda: principal
+            app.dependency_overrides[get_async_principal] = lambda: principal
+        return TestClient(app)
+
+    return _client
+
+
+@pytest.fixture
+def count_queries(sqlite_engine):
+    """Returns a list that collects every SQL statement run on the test engine."""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(sqlite_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(sqlite_engine, "before_cursor_execute", _record)
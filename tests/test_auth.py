@@ -1,2 +1,389 @@
 def test_dummy():
     assert 1 == 1
+
+
+def test_verified_token_cache_skips_repeat_verification(monkeypatch):
+    import time
+    from types import SimpleNamespace
+    from app.security import firebase
+
+    calls = []
+
+    def fake_verify(token, check_revoked=False):
+        calls.append(token)
+        return {"uid": token, "role": "user", "exp": time.time() + 3600}
+
+    monkeypatch.setattr(firebase, "init_firebase", lambda: SimpleNamespace(verify_id_token=fake_verify))
+    monkeypatch.setattr(firebase, "token_cache", firebase.VerifiedTokenCache(max_entries=2))
+
+    assert firebase.verify_firebase_token("a")["uid"] == "a"
+    assert firebase.verify_firebase_token("a")["uid"] == "a"
+    assert calls == ["a"]
+
+    # revocation checks always go to Firebase
+    firebase.verify_id_token("a", check_revoked=True)
+    assert calls == ["a", "a"]
+
+    firebase.verify_firebase_token("b")
+    firebase.verify_firebase_token("c")  # evicts "a"
+    firebase.verify_firebase_token("a")
+    assert calls[-1] == "a" and len(firebase.token_cache) == 2
+    assert firebase.token_cache.stats()["hits"] == 1
+
+
+def test_verified_token_cache_honours_token_exp():
+    from app.security.firebase import VerifiedTokenCache
+
+    now = [1000.0]
+    cache = VerifiedTokenCache(clock=lambda: now[0])
+    cache.put("tok", {"uid": "u", "exp": 1060})
+    assert cache.get("tok") == {"uid": "u", "exp": 1060}
+    now[0] = 1060.0
+    assert cache.get("tok") is None
+    assert len(cache) == 0
+
+
+# -------------------------
+# Offline verification against a stub key server
+# -------------------------
+def _signing_key(kid):
+    import datetime
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, kid)])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name).issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now).not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    return private_pem, cert.public_bytes(serialization.Encoding.PEM).decode()
+
+
+def _stub_key_server(certs, hits):
+    import http.server
+    import json
+    import threading
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            body = json.dumps(certs).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Cache-Control", "public, max-age=600")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/certs"
+
+
+def _id_token(private_pem, kid, project_id="demo-project", **overrides):
+    import time
+    from jose import jwt
+
+    now = int(time.time())
+    claims = {
+        "iss": f"https://securetoken.google.com/{project_id}",
+        "aud": project_id,
+        "sub": "user-1",
+        "iat": now,
+        "exp": now + 3600,
+        "role": "user",
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, private_pem, algorithm="RS256", headers={"kid": kid})
+
+
+def test_offline_verification_uses_cached_keys(monkeypatch):
+    import pytest
+    from app.security import firebase
+    from app.security.keyset import PublicKeySet, TokenVerificationError
+
+    private_pem, cert_pem = _signing_key("k1")
+    hits = []
+    server, url = _stub_key_server({"k1": cert_pem}, hits)
+    try:
+        keys = PublicKeySet(url)
+        monkeypatch.setattr(firebase, "FIREBASE_PROJECT_ID", "demo-project")
+        monkeypatch.setattr(firebase, "public_keys", keys)
+        monkeypatch.setattr(firebase, "token_cache", firebase.VerifiedTokenCache())
+        monkeypatch.setattr(firebase, "init_firebase", lambda: pytest.fail("SDK called"))
+
+        claims = firebase.verify_id_token(_id_token(private_pem, "k1"))
+        assert claims["uid"] == "user-1" and claims["role"] == "user"
+        firebase.verify_id_token(_id_token(private_pem, "k1", sub="user-2"))
+        assert len(hits) == 1  # one fetch on cold start, then all local
+        assert 590 <= keys.stats()["expires_in"] <= 600
+
+        for bad in (
+            _id_token(private_pem, "k1", aud="other-project"),
+            _id_token(private_pem, "k1", exp=1),
+            _id_token(private_pem, "unknown-kid"),
+            _id_token(_signing_key("k1")[0], "k1"),  # right kid, wrong key
+        ):
+            with pytest.raises(TokenVerificationError):
+                firebase.verify_id_token(bad)
+    finally:
+        server.shutdown()
+
+
+def test_keys_are_fetched_by_the_refresher_not_the_request_thread():
+    import threading
+    from app.security.keyset import PublicKeySet
+
+    _, cert_pem = _signing_key("k1")
+    fetch_threads = []
+
+    def fetch(url):
+        fetch_threads.append(threading.current_thread().name)
+        return {"k1": cert_pem}, 600
+
+    keys = PublicKeySet("stub", fetch=fetch)
+    keys.start()  # what the startup hook does
+    keys.ensure_loaded()
+    assert keys.get("k1") is not None
+    assert fetch_threads == ["firebase-keyset-refresh"]
+
+
+def test_unknown_kid_refreshes_at_most_once_a_minute():
+    from app.security.keyset import MIN_KID_REFRESH_SECONDS, PublicKeySet
+
+    _, cert_pem = _signing_key("k1")
+    now = [1000.0]
+    keys = PublicKeySet("stub", fetch=lambda url: ({"k1": cert_pem}, 3600), clock=lambda: now[0])
+    keys.refresh()
+
+    assert keys.get("random-kid") is None
+    assert not keys._wake.is_set()  # refreshed moments ago: no refetch
+
+    now[0] += MIN_KID_REFRESH_SECONDS
+    assert keys.get("random-kid") is None
+    assert keys._wake.is_set()
+
+
+def test_key_refresh_failure_keeps_old_keys():
+    from app.security.keyset import PublicKeySet
+
+    _, cert_pem = _signing_key("k1")
+    responses = [({"k1": cert_pem}, 600)]
+
+    def fetch(url):
+        if not responses:
+            raise OSError("key server down")
+        return responses.pop(0)
+
+    keys = PublicKeySet("stub", fetch=fetch)
+    keys.refresh()
+    try:
+        keys.refresh()
+    except OSError:
+        pass
+    assert keys.get("k1") is not None
+    assert keys.refreshes == 1
+
+
+# -------------------------
+# Password hashing pool
+# -------------------------
+def test_password_hasher_fails_fast_when_full():
+    import asyncio
+    import pytest
+    from app.core.security import PasswordHasher, PasswordHasherBusy
+
+    hasher = PasswordHasher(max_workers=1, max_pending=0)
+    with pytest.raises(PasswordHasherBusy) as exc:
+        asyncio.run(hasher.hash("secret"))
+    assert exc.value.status_code == 503
+    assert exc.value.headers["Retry-After"] == "1"
+    assert hasher.stats()["rejected"] == 1
+
+
+def test_password_hasher_rehash_is_opt_in():
+    import asyncio
+    from app.core.security import PasswordHasher, pwd_context
+
+    old_hash = pwd_context.copy(bcrypt__rounds=4).hash("secret")
+
+    async def check(rehash):
+        hasher = PasswordHasher(max_workers=1, rehash=rehash)
+        try:
+            return await hasher.verify("secret", old_hash), await hasher.verify("wrong", old_hash)
+        finally:
+            hasher.shutdown()
+
+    (valid, new_hash), (invalid, _) = asyncio.run(check(rehash=False))
+    assert valid and new_hash is None and not invalid
+
+    (valid, new_hash), _ = asyncio.run(check(rehash=True))
+    assert valid and new_hash and pwd_context.verify("secret", new_hash)
+    assert not pwd_context.needs_update(new_hash)
+
+
+# -------------------------
+# Principal resolver
+# -------------------------
+def test_principal_role_lookup_is_cached_and_invalidated_on_role_change(monkeypatch, db_session, count_queries):
+    from fastapi import Depends, FastAPI
+    from fastapi.testclient import TestClient
+    from app.core.jwt import create_access_token
+    from app.database import get_db
+    from app.models.user import User
+    from app.routers.admin import router as admin_router
+    from app.security import principal as principal_mod
+
+    monkeypatch.setattr(principal_mod, "role_cache", principal_mod.RoleCache())
+    import app.routers.admin as admin_mod
+    monkeypatch.setattr(admin_mod, "role_cache", principal_mod.role_cache)
+
+    admin = User(full_name="A", email="a@example.com", hashed_password="x", role="admin")
+    client_user = User(full_name="B", email="b@example.com", hashed_password="x", role="client")
+    db_session.add_all([admin, client_user])
+    db_session.commit()
+    b_id = client_user.id
+
+    app = FastAPI()
+    app.include_router(admin_router)
+    app.dependency_overrides[get_db] = lambda: db_session
+
+    @app.get("/whoami", dependencies=[Depends(principal_mod.require_roles(["admin", "client"]))])
+    def whoami(user=Depends(principal_mod.get_principal)):
+        return {"role": user.role, "id": user.id}
+
+    client = TestClient(app)
+    b_headers = {"Authorization": "Bearer " + create_access_token({"sub": "b@example.com", "role": "admin"})}
+    a_headers = {"Authorization": "Bearer " + create_access_token({"sub": "a@example.com"})}
+
+    count_queries.clear()
+    # DB role wins over the token's claim
+    assert client.get("/whoami", headers=b_headers).json() == {"role": "client", "id": b_id}
+    assert client.get("/whoami", headers=b_headers).status_code == 200
+    assert sum("FROM users" in s for s in count_queries) == 1
+    assert client.get("/admin/talents", headers=b_headers).status_code == 403
+
+    typo = client.patch(f"/admin/users/{b_id}/role", json={"role": "admn"}, headers=a_headers)
+    assert typo.status_code == 422
+    r = client.patch(f"/admin/users/{b_id}/role", json={"role": "admin"}, headers=a_headers)
+    assert r.status_code == 200 and r.json()["role"] == "admin"
+    assert client.get("/admin/talents", headers=b_headers).status_code == 200
+
+    assert client.get("/whoami").status_code == 401
+    assert client.get("/whoami", headers={"Authorization": "Bearer nope"}).status_code == 401
+
+
+def test_async_principal_resolves_role_on_the_async_session(monkeypatch, db_session, async_db):
+    from fastapi import Depends, FastAPI
+    from fastapi.testclient import TestClient
+    from app.core.jwt import create_access_token
+    from app.database import get_async_db, get_db
+    from app.models.user import User
+    from app.security import principal as principal_mod
+
+    monkeypatch.setattr(principal_mod, "role_cache", principal_mod.RoleCache())
+    db_session.add(User(full_name="A", email="a@example.com", hashed_password="x", role="admin"))
+    db_session.commit()
+
+    def no_sync_db():
+        raise AssertionError("async routes must not open a sync session")
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = no_sync_db
+    app.dependency_overrides[get_async_db] = async_db
+
+    @app.get("/admin-only")
+    async def admin_only(user=Depends(principal_mod.get_async_current_admin)):
+        return {"role": user.role, "id": user.id}
+
+    client = TestClient(app)
+    token = create_access_token({"sub": "a@example.com", "role": "client"})
+    r = client.get("/admin-only", headers={"Authorization": "Bearer " + token})
+    assert r.status_code == 200 and r.json()["role"] == "admin"  # DB role wins
+    stranger = create_access_token({"sub": "s@example.com", "role": "client"})
+    assert client.get("/admin-only", headers={"Authorization": "Bearer " + stranger}).status_code == 403
+    assert client.get("/admin-only").status_code == 401
+
+
+def test_principal_supports_dict_style_access():
+    from app.security.principal import Principal
+
+    user = Principal(uid="u1", email="e@example.com", role="admin", user_id=7, claims={"photoUrl": "p"})
+    assert user["uid"] == "u1" and user.get("id") == 7 and user.get("photoUrl") == "p"
+    assert user.is_admin and user.get("missing", "d") == "d"
+
+
+def test_self_registration_cannot_reach_admin_routes(monkeypatch, db_session):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.core.security import PasswordHasher
+    from app.database import get_db
+    from app.routers import auth as auth_mod
+    from app.routers.metrics import router as metrics_router
+    from app.security import principal as principal_mod
+
+    hasher = PasswordHasher(max_workers=1)
+    monkeypatch.setattr(auth_mod, "password_hasher", hasher)
+    monkeypatch.setattr(auth_mod, "role_cache", principal_mod.RoleCache())
+    monkeypatch.setattr(principal_mod, "role_cache", auth_mod.role_cache)
+
+    app = FastAPI()
+    app.include_router(auth_mod.router)
+    app.include_router(metrics_router)
+    app.dependency_overrides[get_db] = lambda: db_session
+    client = TestClient(app)
+
+    try:
+        r = client.post("/auth/register", json={
+            "full_name": "M", "email": "m@example.com", "password": "pw", "role": "admin",
+        })
+        assert r.status_code == 200 and r.json()["role"] == "client"
+
+        token = client.post("/auth/login", json={"email": "m@example.com", "password": "pw"}).json()
+        assert token["role"] == "client"
+        headers = {"Authorization": "Bearer " + token["access_token"]}
+        assert client.get("/admin/metrics/role-cache", headers=headers).status_code == 403
+    finally:
+        hasher.shutdown()
+
+
+def test_unverified_firebase_email_does_not_inherit_db_role(monkeypatch, db_session):
+    from fastapi import Depends, FastAPI
+    from fastapi.testclient import TestClient
+    from app.database import get_db
+    from app.models.user import User
+    from app.security import principal as principal_mod
+
+    monkeypatch.setattr(principal_mod, "role_cache", principal_mod.RoleCache())
+    db_session.add(User(full_name="A", email="a@example.com", hashed_password="x", role="admin"))
+    db_session.commit()
+
+    claims = {"uid": "u1", "email": "a@example.com", "email_verified": False, "firebase": {}}
+    monkeypatch.setattr(principal_mod, "decode_bearer", lambda authorization: dict(claims))
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = lambda: db_session
+
+    @app.get("/admin-only")
+    def admin_only(user=Depends(principal_mod.get_current_admin)):
+        return {"ok": True}
+
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer firebase-token"}
+    assert client.get("/admin-only", headers=headers).status_code == 403
+
+    claims["email_verified"] = True
+    assert client.get("/admin-only", headers=headers).status_code == 200
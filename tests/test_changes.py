@@ -0,0 +1,65 @@
+from app.routers.changes import router
+
+
+def test_version_is_monotonic_across_tables_and_bumped_on_update(db_session):
+    from app.models import Project, Talent
+
+    talent = Talent(full_name="t", email="t@x.io", skills=["py"])
+    db_session.add(talent)
+    db_session.commit()
+    project = Project(title="p", required_skills=["py"])
+    db_session.add(project)
+    db_session.commit()
+    assert project.version > talent.version
+    assert talent.updated_at is not None
+
+    before = talent.version
+    talent.experience_years = 3
+    db_session.commit()
+    assert talent.version > project.version > before
+
+
+def test_changes_feed_returns_only_rows_after_since(db_session, api_client):
+    from app.models import Project, Talent
+
+    db_session.add_all(Talent(full_name=f"t{i}", email=f"t{i}@x.io", skills=["py"]) for i in range(3))
+    db_session.commit()
+    db_session.add(Project(title="p", required_skills=["py"]))
+    db_session.commit()
+    client = api_client(router)
+
+    everything = client.get("/admin/changes").json()
+    assert [t["full_name"] for t in everything["talent"]] == ["t0", "t1", "t2"]
+    assert [p["title"] for p in everything["projects"]] == ["p"]
+    assert everything["has_more"] is False
+    since = everything["next_since"]
+
+    assert client.get("/admin/changes", params={"since": since}).json() == {
+        "talent": [], "projects": [], "next_since": since, "has_more": False,
+    }
+
+    t1 = db_session.query(Talent).filter_by(full_name="t1").one()
+    t1.skills = ["py", "go"]
+    db_session.commit()
+    changed = client.get("/admin/changes", params={"since": since}).json()
+    assert [t["full_name"] for t in changed["talent"]] == ["t1"]
+    assert changed["projects"] == []
+    assert changed["next_since"] == t1.version
+
+
+def test_changes_feed_pages_by_version(db_session, api_client):
+    from app.models import Project, Talent
+
+    for i in range(3):
+        db_session.add(Talent(full_name=f"t{i}", email=f"t{i}@x.io", skills=["py"]))
+        db_session.add(Project(title=f"p{i}"))
+        db_session.commit()
+    client = api_client(router)
+
+    first = client.get("/admin/changes", params={"limit": 4}).json()
+    assert first["has_more"] is True
+    assert len(first["talent"]) + len(first["projects"]) == 4
+    rest = client.get("/admin/changes", params={"since": first["next_since"], "limit": 4}).json()
+    assert rest["has_more"] is False
+    assert [t["full_name"] for t in first["talent"] + rest["talent"]] == ["t0", "t1", "t2"]
+    assert [p["title"] for p in first["projects"] + rest["projects"]] == ["p0", "p1", "p2"]
@@ -0,0 +1,143 @@
+def test_timed_pool_records_checkouts_overflow_and_timeouts(tmp_path):
+    import pytest
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+    from app.services.pool_metrics import TimedQueuePool, instrument_engine, pool_metrics
+
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool, pool_size=1, max_overflow=1, pool_timeout=0.05,
+    )
+    metrics = instrument_engine(engine, "test")
+    try:
+        with engine.connect() as a, engine.connect() as b:
+            a.execute(text("select 1"))
+            b.execute(text("select 1"))
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+
+        stats = metrics.stats()
+        assert stats["checkouts"] == 2 and stats["checkins"] == 2
+        assert stats["connects"] == 2
+        assert stats["peak_overflow"] == 1 and stats["peak_checked_out"] == 2
+        assert stats["timeouts"] == 1
+        assert stats["wait_ms_max"] >= 50
+        assert stats["size"] == 1 and stats["checked_out"] == 0
+
+        # dispose() swaps the pool; counting carries on in the same metrics
+        engine.dispose()
+        with engine.connect():
+            pass
+        assert metrics.stats()["checkouts"] == 3
+    finally:
+        pool_metrics.pop("test", None)
+        engine.dispose()
+
+
+def test_postgres_engines_get_configured_pool(monkeypatch):
+    from sqlalchemy.engine import make_url
+    from app import database
+    from app.services.pool_metrics import TimedQueuePool
+
+    monkeypatch.setattr(database, "DB_POOL_SIZE", 8)
+    kwargs = database._pool_kwargs(make_url("postgresql+psycopg2://u@h/db"), TimedQueuePool)
+    assert kwargs["poolclass"] is TimedQueuePool and kwargs["pool_size"] == 8
+    assert kwargs["pool_pre_ping"] is True and kwargs["pool_recycle"] == database.DB_POOL_RECYCLE
+    assert set(database._pool_kwargs(make_url("sqlite://"), TimedQueuePool)) == {"pool_pre_ping"}
+
+
+def test_read_db_round_robins_replicas_fails_over_and_reads_own_writes(monkeypatch, tmp_path):
+    import sqlite3
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from sqlalchemy import create_engine
+    from fastapi import Depends
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import NullPool
+    from app import database
+    from app.middleware.read_your_writes import ReadYourWritesMiddleware
+    from app.models import Project, Talent
+    from app.routers.matching import router as matching_router
+    from app.routers.talent import router as talent_router
+    from app.services.match_cache import match_cache
+    from app.services.read_replicas import ReplicaSet
+
+    def make_db(name):
+        path = tmp_path / f"{name}.db"
+        engine = create_engine(f"sqlite:///{path}")
+        # Project too: row versions are numbered across both tables
+        database.Base.metadata.create_all(engine, tables=[Talent.__table__, Project.__table__])
+        with Session(engine) as s:
+            s.add(Talent(full_name=name, email="t@x.io", skills=["py"]))
+            s.add(Project(title=name, required_skills=["py"]))
+            s.commit()
+        engine.dispose()
+        return create_async_engine(
+            f"sqlite+aiosqlite:///{path}",
+            connect_args={"detect_types": sqlite3.PARSE_DECLTYPES},
+            poolclass=NullPool,
+        )
+
+    primary, replica = make_db("primary"), make_db("replica")
+    down = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/missing/dir.db", poolclass=NullPool)
+    replicas = ReplicaSet(primary, [down, replica])
+    monkeypatch.setattr(database, "replica_set", replicas)
+    monkeypatch.setattr(database, "AsyncSessionLocal", async_sessionmaker(primary, expire_on_commit=False))
+    match_cache.clear()
+
+    app = FastAPI()
+    app.include_router(talent_router)
+    app.include_router(matching_router)
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    @app.post("/touch", status_code=201)
+    async def touch(db=Depends(database.get_async_db)):
+        db.add(Talent(full_name="new", email="n@x.io", skills=[]))
+        await db.commit()
+        return {}
+
+    @app.post("/peek")
+    async def peek(db=Depends(database.get_read_db)):
+        return {}
+
+    client = TestClient(app)
+    a = {"Authorization": "Bearer a"}
+    name = lambda headers=None: client.get("/talent/1", headers=headers).json()["full_name"]
+
+    assert name() == "replica"
+    assert name() == "replica"
+    assert replicas.stats()["failovers"] == 1  # the broken replica is skipped after one try
+    assert replicas.stats()["down"] == ["replica-0"]
+
+    # replica rows may lag, so they never fill the shared match cache
+    assert client.get("/v1/match/1").status_code == 200
+    assert len(match_cache) == 0
+
+    # a POST that only reads doesn't pin the caller to the primary
+    assert client.post("/peek", headers=a).status_code == 200
+    assert "primary_until" not in client.cookies
+    assert name(a) == "replica"
+
+    assert client.post("/touch", headers=a).status_code == 201
+    assert name() == "primary"  # cookie
+    client.cookies.clear()
+    assert name(a) == "primary"  # same bearer credentials
+    assert name({"Authorization": "Bearer b"}) == "replica"
+
+
+def test_replica_that_hangs_on_connect_is_skipped():
+    import asyncio
+    from app.services.read_replicas import ReplicaSet
+
+    class Hung:
+        async def connect(self):
+            await asyncio.sleep(10)
+
+    class Primary:
+        async def connect(self):
+            return "primary-conn"
+
+    replicas = ReplicaSet(Primary(), [Hung()], connect_timeout=0.01)
+    assert asyncio.run(replicas.connect()) == ("primary-conn", "primary")
+    assert replicas.stats()["down"] == ["replica-0"]
@@ -2,3 +2,317 @@ def test_skill_match_simple():
     from app.routers.matching import calculate_skill_match
     s = calculate_skill_match(['py','sql'], ['py','js'])
     assert s == 50.0
+
+
+def test_skill_index_candidates_and_updates():
+    from app.services.skill_index import SkillIndex
+    idx = SkillIndex()
+    idx.upsert(1, ['py', 'sql'])
+    idx.upsert(2, ['js'])
+    idx.upsert(3, [])
+    assert idx.candidates(['py', 'js']) == {1, 2}
+    assert idx.candidates(['go']) == set()
+
+    idx.upsert(1, ['go'])
+    assert idx.candidates(['py']) == set()
+    assert idx.candidates(['go']) == {1}
+
+    idx.remove(2)
+    assert idx.candidates(['js']) == set()
+    assert len(idx) == 2
+
+
+def test_rank_top_k_matches_full_sort_with_id_tiebreak():
+    from app.services.ranking import rank_top_k
+    rows = [(50, 4), (80, 3), (50, 1), (80, 7), (10, 2)]
+    ranked = rank_top_k(rows, score=lambda r: r[0], ident=lambda r: r[1])
+    assert ranked == [(80, 3), (80, 7), (50, 1), (50, 4), (10, 2)]
+    assert rank_top_k(rows, score=lambda r: r[0], ident=lambda r: r[1], limit=2) == ranked[:2]
+    assert rank_top_k(rows, score=lambda r: r[0], ident=lambda r: r[1], limit=2, offset=2) == ranked[2:4]
+
+
+def test_sql_overlap_query_uses_array_overlap_and_limit():
+    from sqlalchemy.dialects import postgresql
+    from app.services.sql_matching import sql_weighted_matches
+
+    class CapturingSession:
+        def execute(self, q):
+            self.sql = str(q.compile(dialect=postgresql.dialect()))
+            return self
+
+        def all(self):
+            return []
+
+    db = CapturingSession()
+    assert sql_weighted_matches(db, ['py', 'sql'], limit=5) == []
+    assert 'talent.skills && ' in db.sql
+    assert 'ORDER BY combined_score DESC, talent.id' in db.sql
+    assert 'LIMIT' in db.sql
+
+
+def test_batch_scorer_parity_with_calculate_skill_match():
+    import random
+    from app.routers.matching import calculate_skill_match
+    from app.services.batch_scorer import BatchScorer
+
+    rng = random.Random(7)
+    vocab = ['s%d' % i for i in range(40)]
+    talent_skills = [rng.sample(vocab, rng.randint(0, 8)) for _ in range(300)]
+    vetting = [rng.uniform(0, 100) for _ in talent_skills]
+    scorer = BatchScorer(range(1, 301), talent_skills, vetting)
+
+    for project_skills in (['s1', 's2', 'nope'], rng.sample(vocab, 5), [], ['s3', 's3']):
+        skill, combined = scorer.combined_scores(project_skills)
+        for i, skills in enumerate(talent_skills):
+            expected = calculate_skill_match(skills, project_skills)
+            assert skill[i] == expected
+            assert combined[i] == 0.7 * expected + 0.3 * vetting[i]
+            assert round(float(combined[i]), 2) == round(0.7 * expected + 0.3 * vetting[i], 2)
+
+
+def test_batch_scorer_top_k_breaks_ties_by_id():
+    from app.services.batch_scorer import BatchScorer
+    scorer = BatchScorer([9, 4, 7, 1], [['a'], ['a'], ['b'], ['a', 'b']])
+    skill = scorer.skill_scores(['a', 'b'])
+    rows = scorer.top_k(skill, 3)
+    assert list(scorer.talent_ids[rows]) == [1, 4, 7]
+
+
+def test_match_cache_lru_ttl_and_invalidation():
+    from app.services.match_cache import MatchCache
+    cache = MatchCache(ttl_seconds=60, max_entries=2)
+    cache.set(("v1", 1), "p1", 1, ['py'])
+    cache.set(("v1", 2), "p2", 2, ['go'])
+    assert cache.get(("v1", 1)) == "p1"
+    cache.set(("v1", 3), "p3", 3, ['js'])  # evicts least recently used: project 2
+    assert cache.get(("v1", 2)) is None
+    assert cache.stats()["evictions"] == 1
+
+    cache.invalidate_talent(['rust'], ['js'])
+    assert cache.get(("v1", 3)) is None
+    assert cache.get(("v1", 1)) == "p1"
+
+    cache.set(("admin", 1), "a1", 1)  # no skills recorded: dropped by any talent write
+    cache.invalidate_talent([])
+    assert cache.get(("admin", 1)) is None
+
+    cache.invalidate_project(1)
+    assert cache.get(("v1", 1)) is None
+    assert cache.stats()["hits"] == 2
+
+    expired = MatchCache(ttl_seconds=0)
+    expired.set("k", "v", 1, [])
+    assert expired.get("k") is None
+
+
+def test_project_match_page_query_count_is_constant(db_session, count_queries):
+    from app.models import Project, Talent
+    from app.routers.matching import project_match_page
+
+    project = Project(title="p", required_skills=['py', 'sql'])
+    db_session.add(project)
+    db_session.commit()
+
+    counts = []
+    for pool_size in (3, 30):
+        db_session.add_all(
+            Talent(full_name="t", email="t%d-%d@x.io" % (pool_size, i), skills=['py'])
+            for i in range(pool_size)
+        )
+        db_session.commit()
+        db_session.refresh(project)
+        del count_queries[:]
+        matches = project_match_page(db_session, project, limit=5)
+        counts.append(len(count_queries))
+        assert len(matches) == min(5, pool_size)
+        assert matches[0]["match_score"] == 50.0
+
+    assert counts[0] == counts[1] == 1
+
+
+def test_crud_match_talents_to_project_uses_flat_selects(db_session, count_queries):
+    from app.models import Project, Talent
+    from app.routers.crud import match_talents_to_project
+
+    project = Project(title="p", required_skills=["py", "sql"])
+    db_session.add(project)
+    db_session.add_all([
+        Talent(full_name="one", email="a@x.io", skills=["sql"]),
+        Talent(full_name="both", email="b@x.io", skills=["py", "sql"]),
+        Talent(full_name="none", email="c@x.io", skills=["go"]),
+    ])
+    db_session.commit()
+    project_id = project.id
+
+    del count_queries[:]
+    results = match_talents_to_project(db_session, project_id)
+    assert len(count_queries) == 2
+    assert [(r["talent_name"], r["match_score"]) for r in results] == [("both", 100.0), ("one", 50.0), ("none", 0)]
+    assert results[0]["skills"] == ["py", "sql"]
+    assert match_talents_to_project(db_session, 999) is None
+
+
+def test_async_match_route_ranks_candidates(monkeypatch, db_session, api_client):
+    from app.models import Project, Talent
+    from app.routers import matching
+    from app.services.match_cache import MatchCache
+    from app.services.skill_index import SkillIndex
+
+    monkeypatch.setattr(matching, "skill_index", SkillIndex())
+    monkeypatch.setattr(matching, "match_cache", MatchCache())
+
+    project = Project(title="p", required_skills=["py", "sql"])
+    db_session.add(project)
+    db_session.add_all([
+        Talent(full_name="both", email="a@x.io", skills=["py", "sql"]),
+        Talent(full_name="one", email="b@x.io", skills=["sql"]),
+        Talent(full_name="none", email="c@x.io", skills=["go"]),
+    ])
+    db_session.commit()
+    project_id = project.id
+
+    client = api_client(matching.router)
+
+    r = client.get(f"/v1/match/{project_id}")
+    assert r.status_code == 200
+    assert [(m["name"], m["skill_score"]) for m in r.json()["matches"]] == [("both", 100.0), ("one", 50.0)]
+    assert client.get("/v1/match/999").status_code == 404
+    # no location column yet: ignored like in sql mode, not a 500
+    located = client.get(f"/v1/match/{project_id}", params={"location": "Nairobi"})
+    assert located.status_code == 200 and located.json()["matches"] == r.json()["matches"]
+
+    # served pre-encoded by orjson, and the cached copy serializes identically
+    assert r.headers["content-type"] == "application/json"
+    assert client.get(f"/v1/match/{project_id}").content == r.content
+    assert "MatchResponse" in client.get("/openapi.json").text
+
+
+def test_match_batch_route_streams_ndjson_matching_single_route(monkeypatch, db_session, api_client):
+    import json
+    from app.models import Project, Talent
+    from app.routers import matching
+    from app.services.match_cache import MatchCache
+    from app.services.skill_index import SkillIndex
+
+    monkeypatch.setattr(matching, "skill_index", SkillIndex())
+    monkeypatch.setattr(matching, "match_cache", MatchCache())
+
+    projects = [Project(title="p", required_skills=["py", "sql", "go"]), Project(title="q", required_skills=["go"])]
+    db_session.add_all(projects)
+    db_session.add_all([
+        Talent(full_name="both", email="a@x.io", skills=["py", "sql"]),
+        Talent(full_name="one", email="b@x.io", skills=["sql"]),
+        Talent(full_name="go", email="c@x.io", skills=["go"]),
+    ])
+    db_session.commit()
+    p, q = (project.id for project in projects)
+
+    client = api_client(matching.router)
+
+    r = client.post("/v1/match/batch", json={"projects": [
+        {"project_id": p}, {"project_id": 999}, {"project_id": q, "limit": 1},
+    ]})
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in r.text.splitlines()]
+    assert [line["project_id"] for line in lines] == [p, 999, q]
+    assert lines[1] == {"project_id": 999, "error": "Project not found"}
+    assert [m["name"] for m in lines[2]["matches"]] == ["go"]
+
+    # identical rows (scores and order) to the per-project route
+    for line in (lines[0], lines[2]):
+        single = client.get(f"/v1/match/{line['project_id']}", params={"limit": len(line["matches"])})
+        assert line["matches"] == single.json()["matches"]
+
+
+def test_admin_match_page_is_refreshed_by_unrelated_talent_writes(monkeypatch, db_session, api_client):
+    from app.models import Project, Talent
+    from app.routers import admin, talent
+    from app.services.match_cache import MatchCache
+    from app.services.skill_index import SkillIndex
+
+    cache = MatchCache()
+    monkeypatch.setattr(admin, "match_cache", cache)
+    monkeypatch.setattr(talent, "match_cache", cache)
+    monkeypatch.setattr(talent, "skill_index", SkillIndex())
+    project = Project(title="p", required_skills=["py"])
+    db_session.add_all([project, Talent(full_name="py", email="a@x.io", skills=["py"])])
+    db_session.commit()
+
+    client = api_client(admin.router, talent.router)
+
+    names = lambda: [m["name"] for m in client.get(f"/admin/match/{project.id}").json()["matches"]]
+    assert names() == ["py"]
+    # shares no skill with the project, but the admin page lists every talent
+    r = client.post("/talent/", json={"full_name": "go", "email": "g@x.io", "skills": ["go"]})
+    assert r.status_code == 201
+    assert names() == ["py", "go"]
+
+
+def test_orjson_dumps_decimal_like_jsonable_encoder():
+    from decimal import Decimal
+    from app.core.responses import dumps
+
+    assert dumps({"score": Decimal("87.50"), "skills": ["py"]}) == b'{"score":87.5,"skills":["py"]}'
+
+
+def _legacy_match_rows(db, project_id, **params):
+    from app.routers.match import match_talent
+    result = match_talent(project_id, db=db, **{"limit": None, "offset": 0, **params})
+    return [(m["talent_id"], m["score"]) for m in result["matches"]]
+
+
+def _seed_legacy_match(db):
+    from app.models import Project, Talent
+
+    projects = [Project(title="p", required_skills=["a", "b", "c", "d", "e", "f", "g", "h"]), Project(title="none", required_skills=[])]
+    talent = [
+        Talent(full_name="one", email="1@x.io", skills=["a"], profile_completed=True),  # 1/8: ties round up
+        Talent(full_name="three", email="3@x.io", skills=["a", "b", "c"], profile_completed=True),
+        Talent(full_name="zero", email="0@x.io", skills=["z"], profile_completed=True),
+        Talent(full_name="draft", email="d@x.io", skills=["a", "b"], profile_completed=False),
+        Talent(full_name="one-again", email="1b@x.io", skills=["h", "h"], profile_completed=True),
+    ]
+    db.add_all(projects + talent)
+    db.commit()
+    return [p.id for p in projects], {t.full_name: t.id for t in talent}
+
+
+def test_legacy_match_python_mode_returns_only_overlapping_completed_profiles(db_session):
+    (project_id, empty_id), ids = _seed_legacy_match(db_session)
+
+    assert _legacy_match_rows(db_session, project_id) == [
+        (ids["three"], 0.38), (ids["one"], 0.13), (ids["one-again"], 0.13),
+    ]
+    assert _legacy_match_rows(db_session, project_id, limit=1, offset=1) == [(ids["one"], 0.13)]
+    assert _legacy_match_rows(db_session, empty_id) == []
+
+
+def test_legacy_match_modes_agree_on_postgres():
+    """Runs only with POSTGRES_TEST_URL set (a scratch database: tables are created and dropped)."""
+    import os
+    import pytest
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from app.database import Base
+    from app.models import Project, Talent
+    from app.models.versioning import row_version_seq
+
+    url = os.getenv("POSTGRES_TEST_URL")
+    if not url:
+        pytest.skip("POSTGRES_TEST_URL not set")
+    engine = create_engine(url)
+    tables = [Talent.__table__, Project.__table__]
+    Base.metadata.drop_all(engine, tables=tables)
+    row_version_seq.create(engine, checkfirst=True)
+    Base.metadata.create_all(engine, tables=tables)
+    try:
+        with Session(engine) as db:
+            (project_id, empty_id), _ = _seed_legacy_match(db)
+            for pid in (project_id, empty_id):
+                for page in ({}, {"limit": 1, "offset": 1}, {"limit": 2}):
+                    assert _legacy_match_rows(db, pid, mode="sql", **page) == \
+                        _legacy_match_rows(db, pid, mode="python", **page), (pid, page)
+    finally:
+        Base.metadata.drop_all(engine, tables=tables)
+        engine.dispose()
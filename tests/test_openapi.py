@@ -0,0 +1,71 @@
+import gzip
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.openapi_document import OpenAPIDocument
+
+
+def test_openapi_served_with_etag_and_conditional_get():
+    client = TestClient(app)
+    r = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/json"
+    assert "content-encoding" not in r.headers
+    assert "/healthz" in r.json()["paths"]
+    etag = r.headers["etag"]
+
+    again = client.get("/openapi.json", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+    weak = client.get("/openapi.json", headers={"If-None-Match": f'"stale", W/{etag}'})
+    assert weak.status_code == 304
+
+
+def test_openapi_gzip_matches_plain_body():
+    client = TestClient(app)
+    plain = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+    # ask for the raw bytes so the client doesn't transparently decode them
+    with client.stream("GET", "/openapi.json", headers={"Accept-Encoding": "gzip"}) as r:
+        raw = b"".join(r.iter_raw())
+        assert r.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in r.headers["vary"]
+    assert gzip.decompress(raw) == plain.content
+
+
+def test_document_builds_once():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"openapi": "3.1.0", "paths": {}}
+
+    doc = OpenAPIDocument(build)
+    for _ in range(3):
+        doc.response({})
+    assert len(calls) == 1
+    assert json.loads(doc.body) == {"openapi": "3.1.0", "paths": {}}
+
+
+def test_document_honours_accept_encoding_qvalues():
+    doc = OpenAPIDocument(lambda: {"openapi": "3.1.0", "paths": {}})
+    encoding = lambda accept: doc.response({"accept-encoding": accept}).headers.get("content-encoding")
+
+    assert encoding("gzip;q=0") is None
+    assert encoding("br, gzip;q=0.0, *;q=0.1") is None
+    assert encoding("GZIP; q=0.5") == "gzip"
+    assert encoding("br;q=1, *;q=0.1") == "gzip"
+    assert encoding("*;q=0") is None
+    assert encoding("identity") is None
+
+
+def test_docs_pages_point_at_openapi_json():
+    client = TestClient(app)
+    for path in ("/docs", "/redoc"):
+        r = client.get(path)
+        assert r.status_code == 200
+        assert "/openapi.json" in r.text
@@ -1,14 +1,19 @@
 from fastapi.testclient import TestClient
 from app.main import app
+from app.security.principal import Principal, get_principal
 
 client = TestClient(app)
 
 def test_create_outcome_validation():
+    app.dependency_overrides[get_principal] = lambda: Principal(uid="c1", email="c@example.com", role="client", user_id=1)
     payload = {
         "forecast_accuracy_percentage": 120.0,  # invalid
         "client_satisfaction_rating": 3,
         "code_quality_score": 4,
         "delivery_speed_days": 10
     }
-    r = client.post("/v1/projects/1/outcomes", json=payload, headers={"Authorization":"Bearer test-token"})
+    try:
+        r = client.post("/v1/projects/1/outcomes", json=payload, headers={"Authorization":"Bearer test-token"})
+    finally:
+        app.dependency_overrides.pop(get_principal, None)
     assert r.status_code == 400 or r.status_code == 422
@@ -0,0 +1,142 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.rate_limit import RateLimitMiddleware, SlidingWindowLimiter
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_sliding_window_blocks_and_recovers():
+    clock = FakeClock(120.0)
+    limiter = SlidingWindowLimiter(window=60, clock=clock)
+    for _ in range(3):
+        assert limiter.hit("ip", 3)[0]
+    allowed, remaining, retry_after = limiter.hit("ip", 3)
+    assert not allowed and remaining == 0 and retry_after == 60
+
+    # halfway into the next window the previous 3 still weigh 1.5
+    clock.now = 210.0
+    assert limiter.hit("ip", 3)[0]
+    assert limiter.hit("ip", 3)[0]
+    allowed, _, retry_after = limiter.hit("ip", 3)
+    assert not allowed and 10 <= retry_after <= 11
+
+    clock.now = 300.0
+    assert limiter.hit("ip", 3)[0]
+
+
+def test_idle_keys_are_evicted_and_key_count_is_bounded():
+    clock = FakeClock(0.0)
+    limiter = SlidingWindowLimiter(window=60, max_keys=10, clock=clock)
+    for i in range(50):
+        limiter.hit("ip-%d" % i, 5)
+    assert len(limiter) <= 11
+
+    clock.now = 1000.0
+    limiter.hit("fresh", 5)
+    assert len(limiter) == 1
+
+
+def test_middleware_returns_429_with_retry_after_and_role_limits():
+    from jose import jwt
+    from app.core.jwt import create_access_token
+
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=SlidingWindowLimiter(window=60),
+        limits={"user": 2, "admin": 4},
+    )
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    client = TestClient(app)
+    assert [client.get("/ping").status_code for _ in range(3)] == [200, 200, 429]
+    blocked = client.get("/ping")
+    assert blocked.status_code == 429
+    assert int(blocked.headers["Retry-After"]) >= 1
+    assert blocked.json()["detail"] == "Too many requests"
+
+    # a forged admin claim stays in the caller's (exhausted) user bucket
+    forged = {"Authorization": "Bearer " + jwt.encode({"role": "admin"}, "k", algorithm="HS256")}
+    assert client.get("/ping", headers=forged).status_code == 429
+
+    admin = {"Authorization": "Bearer " + create_access_token({"sub": "a@x.io", "role": "admin"})}
+    codes = [client.get("/ping", headers=admin).status_code for _ in range(5)]
+    assert codes == [200, 200, 200, 200, 429]
+
+
+def test_redis_backend_shares_limit_across_workers_and_leases_tokens():
+    import asyncio
+    from app.middleware.rate_limit_backends import InProcessRedis, RedisWindowBackend
+
+    clock = FakeClock(600.0)
+    store = InProcessRedis(clock=clock)
+    workers = [RedisWindowBackend(store, window=60, lease_size=5, clock=clock) for _ in range(3)]
+
+    async def run():
+        results = []
+        for i in range(90):
+            allowed, _, retry_after = await workers[i % 3].acquire("1.2.3.4:user", 50)
+            results.append(allowed)
+        return results
+
+    results = asyncio.run(run())
+    # three workers together never admit more than the shared limit
+    assert sum(results) <= 50
+    assert sum(results) >= 50 - 3 * 4
+    # leasing: far fewer store round trips than requests
+    assert store.round_trips < 60
+
+    clock.now = 780.0
+    assert asyncio.run(workers[0].acquire("1.2.3.4:user", 50))[0]
+
+
+def test_redis_backend_fails_open_to_local_window_when_store_is_down():
+    import asyncio
+    from app.middleware.rate_limit_backends import InProcessRedis, RedisWindowBackend
+
+    class DownRedis(InProcessRedis):
+        def pipeline(self, transaction=True):
+            raise ConnectionError("connection refused")
+
+    backend = RedisWindowBackend(DownRedis(), window=60, lease_size=5)
+
+    async def run():
+        return [(await backend.acquire("1.2.3.4:user", 3))[0] for _ in range(4)]
+
+    assert asyncio.run(run()) == [True, True, True, False]
+    assert backend.store_failures == 4
+
+
+def test_redis_backend_without_url_is_a_config_error(monkeypatch):
+    from app.middleware import rate_limit
+
+    monkeypatch.setattr(rate_limit, "RATE_LIMIT_BACKEND", "redis")
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    with pytest.raises(RuntimeError, match="REDIS_URL"):
+        rate_limit.backend_from_env()
+
+
+def test_request_log_middleware_sets_process_time_header():
+    from app.middleware.request_log import RequestLogMiddleware
+
+    app = FastAPI()
+    app.add_middleware(RequestLogMiddleware)
+
+    @app.get("/healthz")
+    def healthz():
+        return {"status": "ok"}
+
+    r = TestClient(app).get("/healthz")
+    assert r.status_code == 200
+    assert float(r.headers["X-Process-Time-ms"]) >= 0
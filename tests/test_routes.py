@@ -0,0 +1,83 @@
+import importlib
+import pkgutil
+from collections import Counter
+
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from app.main import app
+from app.routers.registry import ROUTERS, DuplicateRouteError, include_routers, route_keys
+
+
+def _flat_routes(app):
+    try:
+        from fastapi.routing import iter_route_contexts
+    except ImportError:  # older FastAPI copies included routes into app.routes
+        return app.routes
+    return list(iter_route_contexts(app.routes))
+
+
+def test_app_has_no_duplicate_routes():
+    counts = Counter(route_keys(_flat_routes(app)))
+    assert [key for key, n in counts.items() if n > 1] == []
+    # every registered router is actually served
+    for router in ROUTERS:
+        for key in route_keys(router.routes):
+            assert counts[key] == 1, key
+
+
+def test_every_router_module_is_registered():
+    import app.routers as routers_package
+
+    unregistered = []
+    for module_info in pkgutil.iter_modules(routers_package.__path__):
+        module = importlib.import_module(f"app.routers.{module_info.name}")
+        router = getattr(module, "router", None)
+        if router is not None and not any(router is r for r in ROUTERS):
+            unregistered.append(module_info.name)
+    assert unregistered == []
+
+
+def test_newly_mounted_routers_require_auth(db_session):
+    from fastapi.testclient import TestClient
+    from app.core.jwt import create_access_token
+    from app.database import get_db
+    from app.routers import admin, crud, match, notifications, outcomes, upload
+
+    target = include_routers(FastAPI(), [r.router for r in (admin, crud, match, notifications, outcomes, upload)])
+    target.dependency_overrides[get_db] = lambda: db_session
+    client = TestClient(target)
+    client_token = {"Authorization": "Bearer " + create_access_token({"sub": "c@x.io", "role": "client"})}
+
+    admin_only = {key for r in (crud.router, match.router) for key in route_keys(r.routes)}
+    for method, path in route_keys(_flat_routes(target)):
+        if method == "HEAD" or path.startswith(("/openapi", "/docs", "/redoc")):
+            continue
+        # every path parameter is an integer id
+        url = "".join("1" if i % 2 else part for i, part in enumerate(path.replace("}", "{").split("{")))
+        assert client.request(method, url).status_code == 401, (method, path)
+        if (method, path) in admin_only:
+            assert client.request(method, url, headers=client_token).status_code == 403, (method, path)
+
+
+def test_registry_rejects_duplicate_path_and_method():
+    first, second = APIRouter(prefix="/x"), APIRouter(prefix="/x")
+    first.get("/items")(lambda: None)
+    second.get("/items")(lambda: None)
+
+    with pytest.raises(DuplicateRouteError, match="GET /x/items"):
+        include_routers(FastAPI(), [first, second])
+
+
+def test_registry_rejects_mounting_the_same_routers_twice():
+    target = FastAPI()
+    include_routers(target)
+    with pytest.raises(DuplicateRouteError):
+        include_routers(target)
+
+
+def test_registry_allows_same_path_with_other_method():
+    router = APIRouter()
+    router.get("/items")(lambda: None)
+    router.post("/items")(lambda: None)
+    include_routers(FastAPI(), [router])
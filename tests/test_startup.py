@@ -0,0 +1,46 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Cold start = a fresh interpreter importing app.main and answering /healthz.
+# Generous by default so slow CI machines don't flake; tighten locally.
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "5000"))
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    status = client.get("/healthz").status_code
+ready = time.perf_counter()
+from app.services.pool_metrics import pool_stats
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_healthz_ms": (ready - start) * 1000,
+    "status": status,
+    "firebase_loaded": "firebase_admin" in sys.modules,
+    "numpy_loaded": "numpy" in sys.modules,
+    "db_checkouts": sum(s["checkouts"] for s in pool_stats().values()),
+}))
+"""
+
+
+def test_cold_start_to_first_healthz():
+    root = Path(__file__).resolve().parent.parent
+    env = {**os.environ, "DATABASE_URL": os.environ.get("DATABASE_URL", "sqlite://")}
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=root, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+    print(f"\nstartup: import {result['import_ms']:.0f}ms, first /healthz {result['first_healthz_ms']:.0f}ms")
+
+    assert result["status"] == 200
+    # nothing on the startup path touches the database or the Firebase SDK
+    assert result["db_checkouts"] == 0
+    assert not result["firebase_loaded"]
+    assert not result["numpy_loaded"]
+    assert result["first_healthz_ms"] < STARTUP_BUDGET_MS
@@ -0,0 +1,199 @@
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from app.routers.talent import router as talent_router
+
+
+def test_list_talent_keyset_pagination(db_session, api_client):
+    from app.models import Talent
+    db_session.add_all(
+        Talent(full_name="t%d" % i, email="t%d@x.io" % i, skills=['py']) for i in range(5)
+    )
+    db_session.commit()
+    client = api_client(talent_router)
+
+    first = client.get("/talent/", params={"limit": 2}).json()
+    assert [t["full_name"] for t in first["items"]] == ["t0", "t1"]
+
+    second = client.get("/talent/", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+    assert [t["full_name"] for t in second["items"]] == ["t2", "t3"]
+
+    last = client.get("/talent/", params={"limit": 2, "cursor": second["next_cursor"]}).json()
+    assert [t["full_name"] for t in last["items"]] == ["t4"]
+    assert last["next_cursor"] is None
+
+
+def test_list_talent_enforces_max_page_size(db_session, api_client):
+    from app.services.pagination import MAX_PAGE_SIZE
+    r = api_client(talent_router).get("/talent/", params={"limit": MAX_PAGE_SIZE + 1})
+    assert r.status_code == 422
+
+
+def test_admin_export_endpoints_stream_ndjson_and_csv(db_session):
+    import csv
+    import io
+    import json
+    from app.database import get_db
+    from app.main import app
+    from app.models import Project, Talent
+    from app.security.principal import Principal, get_principal
+
+    db_session.add_all(
+        Talent(full_name="t%d" % i, email="t%d@x.io" % i, skills=['py', 'sql']) for i in range(5)
+    )
+    db_session.add(Project(title="p", required_skills=["py"]))
+    db_session.commit()
+
+    admin = Principal(uid="a", email="a@x.io", role="admin", user_id=1)
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_principal] = lambda: admin
+    try:
+        client = TestClient(app)
+
+        r = client.get("/admin/export/talents")
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("application/x-ndjson")
+        assert r.headers["content-disposition"] == 'attachment; filename="talents.ndjson"'
+        rows = [json.loads(line) for line in r.text.splitlines()]
+        assert [row["full_name"] for row in rows] == ["t0", "t1", "t2", "t3", "t4"]
+        assert rows[0]["skills"] == ['py', 'sql']
+        assert rows[0]["availability_status"] == "available"
+
+        r = client.get("/admin/export/projects", params={"format": "csv"})
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/csv")
+        assert r.headers["content-disposition"] == 'attachment; filename="projects.csv"'
+        table = list(csv.reader(io.StringIO(r.text)))
+        assert table[0][:2] == ["id", "title"]
+        assert [row[1] for row in table[1:]] == ["p"]
+
+        r = client.get("/admin/export/outcomes")
+        assert r.status_code == 200 and r.text == ""
+
+        assert client.get("/admin/export/talents", params={"format": "xml"}).status_code == 422
+        # filters on columns talent doesn't have are refused, not ignored
+        for params in ({"location": "Nairobi"}, {"min_vetting_score": 50}):
+            r = client.get("/admin/export/talents", params=params)
+            assert r.status_code == 422 and "not supported" in r.json()["detail"]
+        app.dependency_overrides[get_principal] = lambda: Principal(uid="c", email="c@x.io", role="client")
+        assert client.get("/admin/export/talents").status_code == 403
+    finally:
+        app.dependency_overrides.clear()
+
+def test_get_talent_etag_and_conditional_get(db_session, api_client):
+    from app.models import Talent
+    talent = Talent(full_name="t", email="t@x.io", skills=["py"])
+    db_session.add(talent)
+    db_session.commit()
+    client = api_client(talent_router)
+
+    r = client.get(f"/talent/{talent.id}")
+    assert r.status_code == 200
+    assert r.headers["cache-control"].startswith("public")
+    etag = r.headers["etag"]
+
+    cached = client.get(f"/talent/{talent.id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    talent.full_name = "renamed"
+    db_session.commit()
+    changed = client.get(f"/talent/{talent.id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["full_name"] == "renamed"
+    assert changed.headers["etag"] != etag
+
+
+def test_compression_above_threshold_only():
+    from app.middleware.compression import CompressionMiddleware
+
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1000)
+
+    @app.get("/big")
+    def big(response: Response):
+        response.headers["ETag"] = '"v1"'
+        return {"data": "x" * 5000}
+
+    @app.get("/small")
+    def small():
+        return {"data": "x"}
+
+    client = TestClient(app)
+    r = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["etag"] == 'W/"v1"'  # compressed bytes: weak validator
+    assert r.json()["data"] == "x" * 5000
+
+    assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    plain = client.get("/big", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] == '"v1"'
+
+
+def test_compression_parses_accept_encoding_qvalues(monkeypatch):
+    from app.middleware import compression
+
+    monkeypatch.setattr(compression, "brotli", None)  # gzip-only server
+    app = FastAPI()
+    app.add_middleware(compression.CompressionMiddleware, minimum_size=compression.COMPRESSION_MINIMUM_SIZE)
+
+    @app.get("/big")
+    def big():
+        return {"data": "x" * (2 * compression.COMPRESSION_MINIMUM_SIZE)}
+
+    client = TestClient(app)
+    encoding = lambda accept: client.get("/big", headers={"Accept-Encoding": accept}).headers.get("content-encoding")
+    assert encoding("gzip;q=0") is None
+    assert encoding("gzip;q=0, identity") is None
+    assert encoding("*;q=0.5") == "gzip"
+    assert encoding("x-gzip-ish") is None  # not a substring match
+    assert encoding("br, GZip;q=0.2") == "gzip"
+
+
+def test_compression_brotli_path_above_threshold():
+    import pytest
+    brotli = pytest.importorskip("brotli")
+    from app.middleware.compression import COMPRESSION_MINIMUM_SIZE, CompressionMiddleware
+
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/big")
+    def big(response: Response):
+        response.headers["ETag"] = '"v1"'
+        return {"data": "x" * (2 * COMPRESSION_MINIMUM_SIZE)}
+
+    client = TestClient(app)
+    with client.stream("GET", "/big", headers={"Accept-Encoding": "gzip, br"}) as r:
+        raw = b"".join(r.iter_raw())
+        assert r.headers["content-encoding"] == "br"
+        assert r.headers["etag"] == 'W/"v1"'
+        assert "Accept-Encoding" in r.headers["vary"]
+    assert brotli.decompress(raw) == client.get("/big", headers={"Accept-Encoding": "identity"}).content
+
+    # gzip preferred by qvalue, and br refused outright
+    assert client.get("/big", headers={"Accept-Encoding": "br;q=0.5, gzip"}).headers["content-encoding"] == "gzip"
+    assert client.get("/big", headers={"Accept-Encoding": "br;q=0, gzip"}).headers["content-encoding"] == "gzip"
+
+
+def test_api_skills_is_keyset_paged_by_name(db_session, api_client):
+    from app.models import Project, Talent
+    from app.routers import crud
+
+    db_session.add_all([
+        Talent(full_name="a", email="a@x.io", skills=["sql", "py"]),
+        Talent(full_name="b", email="b@x.io", skills=["py"]),
+        Project(title="p", required_skills=["go", "sql"]),
+        Project(title="q", required_skills=None),
+    ])
+    db_session.commit()
+
+    client = api_client(crud.router)
+
+    first = client.get("/api/skills", params={"limit": 2}).json()
+    assert first == {"items": ["go", "py"], "next_cursor": "py"}
+    second = client.get("/api/skills", params={"limit": 2, "cursor": "py"}).json()
+    assert second == {"items": ["sql"], "next_cursor": None}
+    assert client.get("/api/skills", params={"limit": 10_000}).status_code == 422